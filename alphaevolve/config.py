@@ -10,8 +10,30 @@ LOCAL_MODEL_PATH  – Path to local model [None]
 LOCAL_SERVER_URL  – OpenAI-compatible server base URL [None]
 
 SQLITE_DB         – Path to SQLite file ["~/.alphaevolve/programs.db"]
+
+EVAL_BACKEND      – "process" or "thread" back-test executor ["process"]
+EVAL_WORKERS      – Evaluation worker processes [os.cpu_count()]
+EVAL_MAX_TASKS_PER_CHILD – Recycle a worker after N back-tests [None]
+EVAL_START_METHOD – "spawn" or "forkserver" ["spawn"]
+EVAL_PREWARM      – Load market data once per worker at start-up [True]
+EVAL_SHARED_MEMORY – Workers attach to one shared copy of the data [True]
+EVAL_CACHE_DB     – SQLite KPI cache, empty to disable ["~/.alphaevolve/eval_cache.db"]
+EVAL_DATASET      – pwb-toolbox dataset back-tests run on ["ETFs-Daily-Price"]
+EVAL_TIMEFRAME    – Resample bars to "5m", "15m", "1h" or "1d" [None = native]
+EVAL_TIMEOUT      – Wall-clock seconds one back-test may run [600]
+EVAL_MAX_RSS_MB   – Extra resident memory one back-test may allocate [2048]
+
+CASCADE_ENABLED   – Screen children on a recent window before the full run [True]
+CASCADE_SCREEN_YEARS – Length of the screening window in years [5]
+CASCADE_THRESHOLD – Fraction of the best hall-of-fame score to pass the screen [0.5]
+EVAL_FOLDS        – Score children on K walk-forward folds run in parallel [1 = off]
+
+ABORT_MAX_DRAWDOWN – Stop a back-test once equity is this far below its peak [0.8]
+ABORT_EQUITY_FLOOR – Stop once equity falls below this fraction of the cash [None]
+ABORT_NO_TRADE_BARS – Stop if nothing was traded after N bars [None]
 """
 
+import os
 from pathlib import Path
 
 import yaml
@@ -40,6 +62,30 @@ class Settings(BaseSettings):
     prompt_iterations: int = Field(5, env="PROMPT_ITERATIONS")
     prompt_sqlite_db: str = Field("~/.alphaevolve/prompts.db", env="PROMPT_SQLITE_DB")
 
+    # Evaluation
+    eval_backend: str = Field("process", env="EVAL_BACKEND")
+    eval_workers: int | None = Field(None, env="EVAL_WORKERS")
+    eval_max_tasks_per_child: int | None = Field(None, env="EVAL_MAX_TASKS_PER_CHILD")
+    eval_start_method: str = Field("spawn", env="EVAL_START_METHOD")
+    eval_prewarm: bool = Field(True, env="EVAL_PREWARM")
+    eval_shared_memory: bool = Field(True, env="EVAL_SHARED_MEMORY")
+    eval_cache_db: str | None = Field("~/.alphaevolve/eval_cache.db", env="EVAL_CACHE_DB")
+    eval_dataset: str = Field("ETFs-Daily-Price", env="EVAL_DATASET")
+    eval_timeframe: str | None = Field(None, env="EVAL_TIMEFRAME")
+    eval_timeout: float | None = Field(600, env="EVAL_TIMEOUT")
+    eval_max_rss_mb: int | None = Field(2048, env="EVAL_MAX_RSS_MB")
+
+    # Evaluation cascade (cheap screen → full back-test)
+    cascade_enabled: bool = Field(True, env="CASCADE_ENABLED")
+    cascade_screen_years: int = Field(5, env="CASCADE_SCREEN_YEARS")
+    cascade_threshold: float = Field(0.5, env="CASCADE_THRESHOLD")
+    eval_folds: int = Field(1, env="EVAL_FOLDS")
+
+    # Early abort of doomed back-tests (None disables a rule)
+    abort_max_drawdown: float | None = Field(0.8, env="ABORT_MAX_DRAWDOWN")
+    abort_equity_floor: float | None = Field(None, env="ABORT_EQUITY_FLOOR")
+    abort_no_trade_bars: int | None = Field(None, env="ABORT_NO_TRADE_BARS")
+
     # ------------------------------------------------------------------
     # Evolutionary parameters
     # ------------------------------------------------------------------
@@ -65,4 +111,6 @@ else:
     yaml_defaults = {}
 
 
-settings = Settings(**yaml_defaults)
+# Keyword arguments take precedence over the environment in BaseSettings, so
+# only pass YAML defaults for options the environment does not set.
+settings = Settings(**{k: v for k, v in yaml_defaults.items() if k.upper() not in os.environ})
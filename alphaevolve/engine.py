@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Any
 
 from alphaevolve.evolution.controller import Controller
+from alphaevolve.store.async_store import AsyncProgramStore
 from alphaevolve.store.sqlite import ProgramStore
 from alphaevolve.config import settings
 from examples import config as example_settings
@@ -47,9 +48,10 @@ class AlphaEvolve:
         metrics = (
             example_settings.BRANCH_METRICS if example_settings.MULTI_BRANCH_MUTATION else [None]
         )
+        async_store = AsyncProgramStore(self.store)  # one writer thread for all
         self.controllers = [
             Controller(
-                self.store,
+                async_store,
                 initial_program_paths=self.initial_program_paths,
                 metric=m,
             )
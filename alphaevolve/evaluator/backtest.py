@@ -5,39 +5,117 @@ strategy.  The entry symbol must expose either:
     1. a subclass of `bt.Strategy` named `Strategy`, **or**
     2. a variable `STRATEGY_CLASS` pointing to a bt.Strategy subclass.
 
+Signal-style strategies that instead expose `target_weights` are routed to
+the vectorised fast path in `evaluator.vectorized`.
+
 Returned KPI dict is JSON-serialisable for Mongo storage.
 """
 
-import asyncio, inspect, importlib.util, sys, tempfile, types
+import asyncio, hashlib, inspect, itertools, linecache, logging, os, sys, threading, types
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from functools import partial
-from pathlib import Path
 from typing import Any, Sequence, Dict
 import backtrader as bt
+import numpy as np
 import pandas as pd
 
 from examples import config as example_config
-from alphaevolve.evaluator.loader import load_ohlc, add_feeds_to_cerebro
+from alphaevolve.config import settings
+from alphaevolve.evaluator.loader import (
+    PreparedPanel,
+    add_panel_to_cerebro,
+    check_timeframe,
+    load_ohlc,
+    prepare_panel,
+)
 from alphaevolve.evaluator import metrics as mt
+from alphaevolve.evaluator import limits, pool, shared_panel, vectorized
+from alphaevolve.store.eval_cache import EvalCache, cache_key, code_hash
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever a change alters the KPIs produced for the same code & data,
+# so stale entries in the evaluation cache stop matching.
+EVALUATOR_VERSION = "3"
+
+# Prepared market data, kept for the lifetime of the (worker) process; the
+# least recently used panels are dropped beyond PANEL_CACHE_MAX_BYTES.
+PANEL_CACHE_MAX_BYTES = 1024**3
+_PANELS: "OrderedDict[tuple, PreparedPanel]" = OrderedDict()
+_panel_lock = threading.Lock()
+# Shared-memory copies published by the parent for the process pool.
+_SHARED: Dict[tuple, shared_panel.PanelDescriptor | None] = {}
+_cache: EvalCache | None = None
+# Compiled candidate sources, most recently used last.
+CODE_CACHE_SIZE = 256
+_CODE_CACHE: "OrderedDict[str, types.CodeType]" = OrderedDict()
+_module_ids = itertools.count()
+_code_lock = threading.Lock()
+# re-runs jobs from a broken pool one at a time (see `_run_on_pool`)
+_isolation = ThreadPoolExecutor(1, thread_name_prefix="eval-isolation")
 
 
 # ------------------------------------------------------------------ #
 # INTERNAL HELPERS
 # ------------------------------------------------------------------ #
+def _compile(code: str) -> types.CodeType:
+    """Compiled module code for `code`, cached by source hash."""
+    digest = hashlib.sha256(code.encode()).hexdigest()
+    with _code_lock:
+        compiled = _CODE_CACHE.get(digest)
+        if compiled is not None:
+            _CODE_CACHE.move_to_end(digest)
+            return compiled
+    filename = f"<strategy-{digest[:16]}>"
+    compiled = compile(code, filename, "exec")
+    with _code_lock:
+        # keep source available to tracebacks and `inspect` without a real file
+        linecache.cache[filename] = (len(code), None, code.splitlines(True), filename)
+        _CODE_CACHE[digest] = compiled
+        while len(_CODE_CACHE) > CODE_CACHE_SIZE:
+            _, evicted = _CODE_CACHE.popitem(last=False)
+            linecache.cache.pop(evicted.co_filename, None)
+    return compiled
+
+
 def _load_module_from_code(code: str, name: str | None = None) -> types.ModuleType:
-    """Create a temporary module from source code string."""
-    name = name or f"strategy_{hash(code)}"
-    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as tmp:
-        tmp.write(code)
-        tmp_path = Path(tmp.name)
-
-    spec = importlib.util.spec_from_file_location(name, tmp_path)
-    mod = importlib.util.module_from_spec(spec)
+    """Create a module from source code string, entirely in memory.
+
+    The module is registered in `sys.modules` (Backtrader's metaclasses look
+    strategies up there); pair with `_unload_module` once finished.
+    """
+    compiled = _compile(code)
+    name = name or f"{compiled.co_filename.strip('<>').replace('-', '_')}_{next(_module_ids)}"
+    mod = types.ModuleType(name)
+    mod.__file__ = compiled.co_filename
     sys.modules[name] = mod
-    spec.loader.exec_module(mod)  # type: ignore
-    tmp_path.unlink(missing_ok=True)
+    try:
+        exec(compiled, mod.__dict__)
+    except BaseException:
+        sys.modules.pop(name, None)
+        raise
     return mod
 
 
+def _unload_module(mod: types.ModuleType) -> None:
+    if sys.modules.get(mod.__name__) is mod:
+        del sys.modules[mod.__name__]
+
+
+@contextmanager
+def _strategy_module(code: str) -> Iterator[types.ModuleType]:
+    """`_load_module_from_code` for the duration of one evaluation."""
+    mod = _load_module_from_code(code)
+    try:
+        yield mod
+    finally:
+        _unload_module(mod)
+
+
 def _find_strategy(mod: types.ModuleType) -> type[bt.Strategy]:
     for attr in ("Strategy", "STRATEGY_CLASS"):
         if hasattr(mod, attr):
@@ -55,54 +133,367 @@ def _find_strategy(mod: types.ModuleType) -> type[bt.Strategy]:
     raise ValueError("No compatible Strategy class found in code snippet.")
 
 
+def _cached_panel(key: tuple) -> PreparedPanel | None:
+    with _panel_lock:
+        panel = _PANELS.get(key)
+        if panel is not None:
+            _PANELS.move_to_end(key)
+        return panel
+
+
+def _cache_panel(key: tuple, panel: PreparedPanel) -> None:
+    """Keep `panel`, evicting the least recently used ones beyond the budget.
+
+    Slices share memory with their base panel, so the byte count errs on the
+    high side; the newest panel is always kept.
+    """
+    with _panel_lock:
+        _PANELS[key] = panel
+        _PANELS.move_to_end(key)
+        total = sum(p.values.nbytes for p in _PANELS.values())
+        while total > PANEL_CACHE_MAX_BYTES and len(_PANELS) > 1:
+            _, old = _PANELS.popitem(last=False)
+            total -= old.values.nbytes
+
+
+def _prepared_panel(
+    symbols: Sequence[str],
+    start: str | None,
+    end: str | None = None,
+    timeframe: str | None = None,
+) -> PreparedPanel:
+    key = (tuple(symbols), start, end, timeframe)
+    panel = _cached_panel(key)
+    if panel is None:
+        # sub-windows (e.g. the cascade screen) are views of the full history
+        base = _cached_panel((tuple(symbols), example_config.START_DATE, None, timeframe))
+        if base is not None and pd.Timestamp(start) >= pd.Timestamp(example_config.START_DATE):
+            panel = base.slice(start, end)
+        else:
+            df = load_ohlc(
+                tuple(symbols),
+                start=start,
+                end=end,
+                dataset=settings.eval_dataset,
+                timeframe=timeframe,
+            )
+            panel = prepare_panel(df, timeframe=timeframe)
+        _cache_panel(key, panel)
+    return panel
+
+
+def _timeframe(mod: types.ModuleType) -> str | None:
+    """Bar size requested by the candidate (`TIMEFRAME`), else the configured one."""
+    for obj in (getattr(mod, "STRATEGY_CLASS", None), getattr(mod, "Strategy", None), mod):
+        timeframe = getattr(obj, "TIMEFRAME", None)
+        if timeframe:
+            return timeframe
+    return settings.eval_timeframe
+
+
+def _shared_descriptor(
+    symbols: Sequence[str], start: str | None, timeframe: str | None = None
+) -> shared_panel.PanelDescriptor | None:
+    """Publish the prepared panel once so pool workers can attach to it."""
+    key = (tuple(symbols), start, timeframe)
+    if key not in _SHARED:
+        try:
+            _SHARED[key] = shared_panel.publish(
+                _prepared_panel(symbols, start, None, timeframe)
+            )
+        except Exception as e:  # workers fall back to loading their own copy
+            logger.warning(f"Could not publish shared market data: {e}")
+            _SHARED[key] = None
+    return _SHARED[key]
+
+
+def _warm_up_args() -> tuple[Any, tuple]:
+    """Pool initializer and its arguments (None when pre-warming is off)."""
+    if not settings.eval_prewarm:
+        return None, ()
+    symbols, start = tuple(example_config.DEFAULT_SYMBOLS), example_config.START_DATE
+    timeframe = settings.eval_timeframe
+    shared = None
+    if settings.eval_backend.lower() == "process" and settings.eval_shared_memory:
+        shared = _shared_descriptor(symbols, start, timeframe)
+    return warm_up, (symbols, start, shared, timeframe)
+
+
+def _pool_executor():
+    initializer, initargs = _warm_up_args()
+    return pool.get_executor(initializer=initializer, initargs=initargs)
+
+
+def get_cache() -> EvalCache | None:
+    """Persistent KPI cache shared by every `evaluate` call (None if disabled)."""
+    global _cache
+    if _cache is None and settings.eval_cache_db:
+        _cache = EvalCache(settings.eval_cache_db)
+    return _cache
+
+
+def _abort_params(strategy_cls: type[bt.Strategy]) -> Dict[str, Any]:
+    """Configured early-abort rules the strategy understands (see BaseLoggingStrategy)."""
+    rules = {
+        "abort_max_drawdown": settings.abort_max_drawdown,
+        "abort_equity_floor": settings.abort_equity_floor,
+        "abort_no_trade_bars": settings.abort_no_trade_bars,
+    }
+    names = strategy_cls.params._getkeys()
+    return {k: v for k, v in rules.items() if v is not None and k in names}
+
+
+def _eval_version() -> str:
+    """Cache version: evaluator revision plus the settings that shape KPIs."""
+    return ":".join(
+        str(v)
+        for v in (
+            EVALUATOR_VERSION,
+            settings.eval_dataset,
+            settings.eval_timeframe,
+            settings.abort_max_drawdown,
+            settings.abort_equity_floor,
+            settings.abort_no_trade_bars,
+        )
+    )
+
+
+def _max_rss_bytes() -> int | None:
+    mb = settings.eval_max_rss_mb
+    return None if mb is None else int(mb) << 20
+
+
+async def _run_on_pool(job: partial) -> Dict[str, Any]:
+    """Run `job` on the evaluation pool, respawning it if a worker is killed.
+
+    A dead worker fails every job in flight, so each of them is re-run on
+    its own in a fresh process, one at a time: an innocent job just returns
+    its KPIs, while the culprit dies again and its exit code tells why
+    (`limits.from_exit_code`: timeout, oom, or an unexplained crash).
+    """
+    loop = asyncio.get_running_loop()
+    executor = _pool_executor()
+    try:
+        return await loop.run_in_executor(executor, job)
+    except BrokenProcessPool:
+        logger.warning("Evaluation worker died; respawning the pool")
+        pool.discard(executor)
+    initializer, initargs = _warm_up_args()
+    try:
+        return await loop.run_in_executor(
+            _isolation, pool.run_isolated, job, initializer, initargs
+        )
+    except pool.WorkerDied as e:
+        raise limits.from_exit_code(e.exitcode) from None
+
+
 def _run_backtest(
-    strategy_cls: type[bt.Strategy], symbols: Sequence[str] = example_config.DEFAULT_SYMBOLS
+    strategy_cls: type[bt.Strategy],
+    symbols: Sequence[str] = example_config.DEFAULT_SYMBOLS,
+    start: str | None = None,
+    end: str | None = None,
+    timeframe: str | None = None,
 ) -> Dict[str, Any]:
-    df = load_ohlc(tuple(symbols), start=example_config.START_DATE)
+    panel = _prepared_panel(symbols, start or example_config.START_DATE, end, timeframe)
     cerebro = bt.Cerebro()
-    add_feeds_to_cerebro(df, cerebro)
-    cerebro.addstrategy(strategy_cls)
+    add_panel_to_cerebro(panel, cerebro)
+    cerebro.addstrategy(strategy_cls, **_abort_params(strategy_cls))
     cerebro.broker.set_cash(1_000)
 
     # execute
     strat = cerebro.run(maxcpus=1)[0]  # serial for determinism
 
     # metrics
-    curve = pd.Series(
-        [pt["value"] for pt in strat.equity_curve],
-        index=[pt["date"] for pt in strat.equity_curve],
-        name="equity",
-    )
-    rets = mt.daily_returns(curve)
-    kpis = {
-        "total_return": curve.iloc[-1] / curve.iloc[0] - 1,
-        "cagr": mt.cagr(curve),
-        "sharpe": mt.sharpe(rets),
-        "max_drawdown": float(mt.max_drawdown(curve)),
-        "calmar": mt.calmar(mt.cagr(curve), mt.max_drawdown(curve)),
-        "n_days": int(curve.size),
-    }
+    kpis = mt.summary(strat.equity_curve.values, mt.periods_per_year(panel.dates))
+    if getattr(strat, "aborted", None):
+        kpis["aborted"] = strat.aborted
     return kpis
 
 
 # ------------------------------------------------------------------ #
 # PUBLIC API
 # ------------------------------------------------------------------ #
+def warm_up(
+    symbols: Sequence[str] = example_config.DEFAULT_SYMBOLS,
+    start: str | None = None,
+    shared: shared_panel.PanelDescriptor | None = None,
+    timeframe: str | None = None,
+) -> None:
+    """Load and prepare market data once, so later back-tests skip it.
+
+    Used as the evaluation pool initializer: every worker process pays the
+    data-loading cost at start-up instead of once per candidate.  With a
+    `shared` descriptor the worker maps the parent's copy instead of loading.
+    `timeframe` should be the configured one, which is what jobs look up.
+    """
+    start = start or example_config.START_DATE
+    try:
+        if shared is not None:
+            key = (tuple(symbols), start, None, timeframe)
+            _cache_panel(key, shared_panel.attach(shared))
+        else:
+            _prepared_panel(symbols, start, None, timeframe)
+    except Exception as e:  # keep the worker alive; jobs will load lazily
+        logger.warning(f"Evaluation warm-up failed: {e}")
+
+
 def evaluate_sync(
-    code: str, *, symbols: Sequence[str] = example_config.DEFAULT_SYMBOLS
+    code: str,
+    *,
+    symbols: Sequence[str] = example_config.DEFAULT_SYMBOLS,
+    start: str | None = None,
+    end: str | None = None,
 ) -> Dict[str, Any]:
-    """Blocking evaluation; raises on errors (handled by controller)."""
-    mod = _load_module_from_code(code)
-    strat_cls = _find_strategy(mod)
-    return _run_backtest(strat_cls, symbols=symbols)
+    """Blocking evaluation; raises on errors (handled by controller).
+
+    `start`/`end` restrict the back-test window (default: START_DATE → today).
+    A module or strategy-class `TIMEFRAME` ("5m", "1h", "1d", …) selects the
+    bar size, falling back to `settings.eval_timeframe` (None = native bars).
+    Runs past `eval_timeout` / `eval_max_rss_mb` raise `EvaluationTimeout` /
+    `EvaluationOOM` (see `evaluator.limits`).
+    """
+    start = start or example_config.START_DATE
+    with limits.enforce(settings.eval_timeout, _max_rss_bytes()):
+        with _strategy_module(code) as mod:
+            timeframe = _timeframe(mod)
+            weights_fn = vectorized.find_weights_fn(mod)
+            if weights_fn is not None:
+                panel = _prepared_panel(symbols, start, end, timeframe)
+                return vectorized.run(weights_fn, panel)
+            strat_cls = _find_strategy(mod)
+            return _run_backtest(
+                strat_cls, symbols=symbols, start=start, end=end, timeframe=timeframe
+            )
 
 
 async def evaluate(
-    code: str, *, symbols: Sequence[str] = example_config.DEFAULT_SYMBOLS
+    code: str,
+    *,
+    symbols: Sequence[str] = example_config.DEFAULT_SYMBOLS,
+    start: str | None = None,
+    end: str | None = None,
 ) -> Dict[str, Any]:
     """
     Async wrapper so the evolution controller can `await`.
-    Runs the sync back-test in a thread to avoid event-loop blocking.
+    Runs the sync back-test on the evaluation pool (worker processes by
+    default, see `evaluator.pool`) to avoid event-loop blocking.  Code that
+    normalises to an already evaluated program is answered from the cache
+    (looked up and written in a worker thread, off the event loop).
     """
-    loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, partial(evaluate_sync, code, symbols=symbols))
+    start = start or example_config.START_DATE
+    # a misconfigured timeframe fails here, not in every worker
+    check_timeframe(settings.eval_timeframe, settings.eval_dataset)
+    cache = get_cache()
+    key = None
+    if cache is not None:
+        key = cache_key(code, symbols=symbols, start=start, end=end, version=_eval_version())
+        kpis = await asyncio.to_thread(cache.get, key)
+        if kpis is not None:
+            logger.debug("Evaluation cache hit %s", key[:12])
+            return kpis
+    kpis = await _run_on_pool(
+        partial(evaluate_sync, code, symbols=tuple(symbols), start=start, end=end)
+    )
+    if cache is not None:
+        await asyncio.to_thread(cache.put, key, kpis)
+    return kpis
+
+
+async def evaluate_many(
+    codes: Iterable[str],
+    *,
+    symbols: Sequence[str] = example_config.DEFAULT_SYMBOLS,
+    start: str | None = None,
+    end: str | None = None,
+    max_concurrency: int | None = None,
+) -> AsyncIterator[tuple[str, Dict[str, Any] | Exception]]:
+    """Evaluate many sources on the pool, yielding results as they finish.
+
+    Sources that normalise to the same program (see `code_hash`) are run
+    once.  Each item is `(code_hash, kpis)`, or `(code_hash, exception)` when
+    that back-test failed, so one bad program does not end the stream.
+    `max_concurrency` bounds jobs in flight (default: two per pool worker,
+    which keeps every core busy without queueing the whole batch at once).
+    """
+    unique: Dict[str, str] = {}
+    for code in codes:
+        unique.setdefault(code_hash(code), code)
+    if not unique:
+        return
+    limit = max_concurrency or 2 * (settings.eval_workers or os.cpu_count() or 1)
+    sem = asyncio.Semaphore(limit)
+
+    async def _one(h: str, code: str) -> tuple[str, Dict[str, Any] | Exception]:
+        async with sem:
+            try:
+                return h, await evaluate(code, symbols=symbols, start=start, end=end)
+            except Exception as e:
+                logger.debug("Batch evaluation of %s failed: %s", h[:12], e)
+                return h, e
+
+    tasks = [asyncio.create_task(_one(h, code)) for h, code in unique.items()]
+    try:
+        for fut in asyncio.as_completed(tasks):
+            yield await fut
+    finally:  # consumer stopped early: drop the jobs still waiting
+        for task in tasks:
+            task.cancel()
+
+
+def walk_forward_windows(
+    folds: int,
+    *,
+    symbols: Sequence[str] = example_config.DEFAULT_SYMBOLS,
+    start: str | None = None,
+    end: str | None = None,
+) -> list[tuple[str, str]]:
+    """Split the available trading days into `folds` consecutive windows.
+
+    Windows hold (nearly) equal numbers of bars at the evaluation timeframe
+    and are returned as inclusive `(start, end)` date strings, ready for
+    `evaluate`.
+    """
+    start = start or example_config.START_DATE
+    dates = _prepared_panel(symbols, start, end, settings.eval_timeframe).dates
+    if folds < 1 or len(dates) < 2 * folds:
+        raise ValueError(f"Cannot split {len(dates)} bars into {folds} folds")
+    bounds = np.linspace(0, len(dates), folds + 1).astype(int)
+
+    def _fmt(ts: pd.Timestamp) -> str:
+        return ts.date().isoformat() if ts == ts.normalize() else ts.isoformat()
+
+    return [(_fmt(dates[a]), _fmt(dates[b - 1])) for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+async def evaluate_walk_forward(
+    code: str,
+    *,
+    folds: int,
+    symbols: Sequence[str] = example_config.DEFAULT_SYMBOLS,
+    start: str | None = None,
+    end: str | None = None,
+) -> Dict[str, Any]:
+    """Back-test `code` on `folds` consecutive windows at once.
+
+    Each fold is an ordinary `evaluate` call, so the folds run side by side
+    on the pool (wall-clock ≈ the longest fold, not K full runs) and are
+    cached individually.  Returns `metrics.fold_summary`: the mean KPIs under
+    the usual names plus `<kpi>_worst` / `<kpi>_std` and the per-fold dicts.
+    An abort in any fold marks the whole result `aborted`.  Fold boundaries
+    need the trading calendar (a data load on first use), so they are
+    computed in a worker thread rather than on the event loop.
+    """
+    windows = await asyncio.to_thread(
+        walk_forward_windows, folds, symbols=symbols, start=start, end=end
+    )
+    results = await asyncio.gather(
+        *(evaluate(code, symbols=symbols, start=a, end=b) for a, b in windows)
+    )
+    per_fold = [
+        {**kpis, "start": a, "end": b} for kpis, (a, b) in zip(results, windows)
+    ]
+    kpis = mt.fold_summary(per_fold)
+    aborted = next((f["aborted"] for f in per_fold if f.get("aborted")), None)
+    if aborted:
+        kpis["aborted"] = aborted
+    return kpis
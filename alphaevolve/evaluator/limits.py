@@ -0,0 +1,179 @@
+"""
+Wall-clock and memory limits for a single back-test.
+
+`enforce` runs a watchdog thread next to the evaluation.  When the job
+exceeds its time budget, or its resident memory grows by more than the
+allowed amount, the watchdog signals the main thread, which unwinds
+whatever Python code the candidate is running; `enforce` then raises
+`EvaluationTimeout` / `EvaluationOOM`.  What unwinds the candidate is not an
+`Exception`, so its `except Exception:` blocks cannot swallow it, and the
+watchdog stays armed until the block has actually exited.  If it has not
+done so within a grace period (stuck outside the interpreter, or a bare
+`except:` caught the signal), the watchdog ends the whole worker process
+with a `EXIT_CODES` status.  Code stuck in a C call that holds the GIL (a
+pathological regex, say) starves the watchdog too, so the time limit is also
+installed as an `RLIMIT_CPU` soft limit, which the kernel enforces with
+SIGXCPU.  Either way `evaluator.backtest.evaluate` then respawns the pool,
+re-runs the job on its own and turns the exit status back into an exception
+with `from_exit_code`; any other death is reported as `EvaluationCrashed`.
+
+Limits need a POSIX main thread, i.e. the process backend (or a direct
+call); elsewhere `enforce` is a no-op.
+"""
+
+import os
+import signal
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # not POSIX
+    resource = None
+
+_SIGNAL = getattr(signal, "SIGUSR2", None)
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class EvaluationLimitExceeded(Exception):
+    """A back-test was stopped by a resource limit, or its worker died;
+    `status` names which."""
+
+    status = "limit"
+
+
+class EvaluationTimeout(EvaluationLimitExceeded):
+    status = "timeout"
+
+
+class EvaluationOOM(EvaluationLimitExceeded):
+    status = "oom"
+
+
+class EvaluationCrashed(EvaluationLimitExceeded):
+    """The worker died for a reason the limits do not explain (segfault,
+    SIGKILL from outside, the OS OOM killer, …)."""
+
+    status = "crashed"
+
+
+class _Interrupt(BaseException):
+    """Unwinds the candidate's code once a limit is breached; `enforce`
+    turns it into the breach exception."""
+
+
+# exit status of a worker the watchdog had to end (see `from_exit_code`)
+EXIT_CODES = {EvaluationTimeout: 124, EvaluationOOM: 125}
+
+
+def from_exit_code(exitcode: int | None) -> EvaluationLimitExceeded:
+    """The exception for a worker that ended with `exitcode` (-N: signal N)."""
+    for cls, code in EXIT_CODES.items():
+        if exitcode == code:
+            return cls(f"evaluation worker stopped by the {cls.status} limit")
+    if exitcode is not None and exitcode < 0:
+        if -exitcode == getattr(signal, "SIGXCPU", None):
+            return EvaluationTimeout("evaluation worker exceeded its CPU-time limit")
+        try:
+            name = signal.Signals(-exitcode).name
+        except ValueError:
+            name = f"signal {-exitcode}"
+        return EvaluationCrashed(f"evaluation worker killed by {name}")
+    return EvaluationCrashed(f"evaluation worker exited with status {exitcode}")
+
+
+def rss_bytes() -> int | None:
+    """Current resident set size of this process (None if unknown)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def _limit_cpu(seconds: float) -> tuple[int, int] | None:
+    """Lower the CPU-time soft limit to `seconds` from now; return the old one."""
+    if resource is None:
+        return None
+    soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    limit = int(usage.ru_utime + usage.ru_stime + seconds) + 1
+    if hard != resource.RLIM_INFINITY and limit > hard:
+        return None
+    resource.setrlimit(resource.RLIMIT_CPU, (limit, hard))
+    return soft, hard
+
+
+def _supported() -> bool:
+    return (
+        _SIGNAL is not None
+        and hasattr(signal, "pthread_kill")
+        and threading.current_thread() is threading.main_thread()
+    )
+
+
+@contextmanager
+def enforce(
+    timeout: float | None,
+    max_rss_bytes: int | None,
+    *,
+    grace: float = 5.0,
+    interval: float = 0.05,
+) -> Iterator[None]:
+    """Bound the enclosed block to `timeout` seconds and `max_rss_bytes` of
+    additional resident memory (either may be None)."""
+    if (timeout is None and max_rss_bytes is None) or not _supported():
+        yield
+        return
+    baseline = rss_bytes() if max_rss_bytes is not None else None
+    if baseline is None:
+        max_rss_bytes = None
+    breach: list[EvaluationLimitExceeded] = []
+    done = threading.Event()
+    main = threading.main_thread().ident
+
+    def _raise(signum, frame):
+        if breach and not done.is_set():
+            raise _Interrupt
+
+    def _watch():
+        started = time.monotonic()
+        while not done.wait(interval):
+            elapsed = time.monotonic() - started
+            if timeout is not None and elapsed > timeout:
+                breach.append(EvaluationTimeout(f"evaluation exceeded {timeout:g}s"))
+            elif max_rss_bytes is not None:
+                rss = rss_bytes()
+                if rss is not None and rss - baseline > max_rss_bytes:
+                    breach.append(
+                        EvaluationOOM(
+                            f"evaluation grew resident memory by "
+                            f"{(rss - baseline) >> 20} MiB"
+                        )
+                    )
+            if breach:
+                break
+        else:
+            return
+        signal.pthread_kill(main, _SIGNAL)
+        if not done.wait(grace):  # stuck outside the interpreter, or swallowed it
+            os._exit(EXIT_CODES[type(breach[0])])
+
+    previous = signal.signal(_SIGNAL, _raise)
+    cpu_limit = _limit_cpu(timeout + 2 * grace) if timeout is not None else None
+    watchdog = threading.Thread(target=_watch, name="eval-watchdog", daemon=True)
+    watchdog.start()
+    try:
+        yield
+    except _Interrupt:
+        pass
+    finally:
+        done.set()  # the block has exited: the watchdog stands down
+        watchdog.join()
+        if cpu_limit is not None:
+            resource.setrlimit(resource.RLIMIT_CPU, cpu_limit)
+        signal.signal(_SIGNAL, previous)
+    if breach:
+        raise breach[0]
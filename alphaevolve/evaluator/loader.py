@@ -7,74 +7,582 @@ symbols = ["SPY", "EFA", "IEF", "VNQ", "GSG"]
 price_df = load_ohlc(symbols, start="1990-01-01")
 cerebro    = bt.Cerebro()
 add_feeds_to_cerebro(price_df, cerebro)
+
+Long-lived workers prepare the per-symbol trading-day frames once and reuse
+them for every back-test:
+
+panel = prepare_panel(price_df)
+add_panel_to_cerebro(panel, cerebro)
+
+Pivoted frames are cached on disk as uncompressed Arrow IPC (feather) files
+keyed by dataset, symbols, range and `CACHE_VERSION`.  The cache is checked
+before the dataset is touched and read through a memory map, so a cold worker
+maps a file instead of downloading and pivoting.  Open-ended ranges roll over
+daily; the least recently used files are evicted beyond `CACHE_MAX_BYTES`.
+
+Any load can be resampled to a coarser `timeframe` ("5m", "15m", "1h", "1d").
+The first such request builds the whole OHLCV pyramid 1m → 5m → 15m → 1h → 1d
+(each level from the previous one) and caches every level on disk.  Asking a
+daily dataset for intraday bars fails before anything is loaded.
+
+Underneath, raw rows live in a local Parquet lake partitioned by symbol and
+year (`LAKE_DIR/<dataset>/symbol=SPY/year=2005/…`).  A symbol is ingested from
+pwb-toolbox once (refreshed after `LAKE_MAX_AGE_DAYS`); later requests read
+only the columns, symbols and years they need via predicate pushdown.
 """
 
-from functools import lru_cache
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
 from pathlib import Path
 from typing import Iterable
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as pds
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 import pwb_toolbox.datasets as pwb_ds
 import backtrader as bt
-from tqdm import tqdm
+
+logger = logging.getLogger(__name__)
 
 CACHE_DIR = Path.home() / ".alpha_trader_cache"
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
+CACHE_MAX_BYTES = 2 * 1024**3
+# Bump when the pivot logic or the file layout changes.
+CACHE_VERSION = "1"
+
+# In-process budget for loaded frames (see PanelCache)
+MEMORY_CACHE_MAX_BYTES = 512 * 1024**2
+
+LAKE_DIR = CACHE_DIR / "lake"
+LAKE_MAX_AGE_DAYS = 1
+_LAKE_PARTITIONING = pds.partitioning(
+    pa.schema([("symbol", pa.string()), ("year", pa.int32())]), flavor="hive"
+)
+# file in a symbol partition the dataset had no rows for ("_" → not read as data)
+_EMPTY_MARKER = "_EMPTY"
+
+FIELDS = ("open", "high", "low", "close", "volume")
+
+# pyramid levels, finest first: name → pandas offset
+TIMEFRAMES = {"1m": "1min", "5m": "5min", "15m": "15min", "1h": "1h", "1d": "1D"}
+_OHLCV_AGG = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+
+
+class PanelCache:
+    """Byte-budgeted LRU of `load_ohlc` frames.
+
+    Stored frames are backed by one non-writeable float64 array and callers
+    get shallow views of it, so nobody can corrupt the shared copy: in-place
+    edits either raise or (with copy-on-write) copy first.  A lock guards the
+    LRU order and byte count (thread backend, Streamlit GUI).
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._frames: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _nbytes(df: pd.DataFrame) -> int:
+        return int(df.to_numpy().nbytes + df.index.nbytes)
+
+    def get(self, key: tuple) -> pd.DataFrame | None:
+        with self._lock:
+            df = self._frames.get(key)
+            if df is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._frames.move_to_end(key)
+        return df.copy(deep=False)
+
+    def put(self, key: tuple, df: pd.DataFrame) -> pd.DataFrame:
+        """Store a read-only version of `df` and return a view of it."""
+        values = df.to_numpy(dtype=np.float64)
+        values.flags.writeable = False
+        frozen = pd.DataFrame(values, index=df.index, columns=df.columns, copy=False)
+        with self._lock:
+            if key in self._frames:
+                self.bytes -= self._nbytes(self._frames.pop(key))
+            self._frames[key] = frozen
+            self.bytes += self._nbytes(frozen)
+            while self.bytes > self.max_bytes and self._frames:
+                _, old = self._frames.popitem(last=False)
+                self.bytes -= self._nbytes(old)
+                self.evictions += 1
+        return frozen.copy(deep=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._frames),
+                "bytes": self.bytes,
+            }
+
+
+panel_cache = PanelCache(MEMORY_CACHE_MAX_BYTES)
+
+
+def native_timeframe(dataset: str) -> str | None:
+    """Bar size `dataset` stores, when its name tells ("ETFs-Daily-Price" → "1d")."""
+    return "1d" if "daily" in dataset.lower() else None
+
+
+def check_timeframe(timeframe: str | None, dataset: str) -> None:
+    """Raise ValueError if `dataset` cannot be resampled to `timeframe`."""
+    if timeframe is None:
+        return
+    if timeframe not in TIMEFRAMES:
+        raise ValueError(f"Unknown timeframe {timeframe!r}; choose from {list(TIMEFRAMES)}")
+    native = native_timeframe(dataset)
+    if native is not None and pd.Timedelta(TIMEFRAMES[timeframe]) < pd.Timedelta(
+        TIMEFRAMES[native]
+    ):
+        raise ValueError(
+            f"Timeframe {timeframe!r} is finer than the {native} bars of {dataset}; "
+            f"use an intraday dataset or a timeframe of at least {native!r}"
+        )
 
 
-@lru_cache(maxsize=32)
 def load_ohlc(
-    symbols: tuple[str, ...],
+    symbols: Iterable[str],
     start: str | None = None,
     end: str | None = None,
     dataset: str = "ETFs-Daily-Price",
+    timeframe: str | None = None,
 ) -> pd.DataFrame:
-    """Return OHLC dataframe indexed by date with a 2-level column (field, symbol)."""
-    symbols = list(symbols)
+    """Return OHLC dataframe indexed by date with a 2-level column (field, symbol).
+
+    `timeframe` (a `TIMEFRAMES` key) resamples the dataset's native bars; None
+    keeps them.  The frame is a read-only view shared through `panel_cache`;
+    copy it before modifying values.
+    """
+    check_timeframe(timeframe, dataset)
+    key = (tuple(symbols), start, end, dataset, timeframe)
+    df = panel_cache.get(key)
+    if df is None:
+        if timeframe is None:
+            df = _load_ohlc(list(symbols), start, end, dataset)
+        else:
+            df = _load_level(list(symbols), start, end, dataset, timeframe)
+        df = panel_cache.put(key, df)
+    return df
+
+
+def _load_ohlc(
+    symbols: list[str], start: str | None, end: str | None, dataset: str
+) -> pd.DataFrame:
+    cache_file = _cache_path(dataset, symbols, start, end)
+    cached = _read_cached(cache_file)
+    if cached is not None:
+        return cached
+
+    df = _read_lake(dataset, symbols, start, end)
+
+    # daily bars: (field, symbol) columns on every calendar day, weekends /
+    # holidays are NaN and get forward-filled onto trading days later
+    daily = bool((df["date"] == df["date"].dt.normalize()).all())
+    pivot_df = pivot_ohlc(df, freq="D" if daily else None)
+
+    _write_cached(cache_file, pivot_df)
+    return pivot_df
+
+
+def _load_level(
+    symbols: list[str], start: str | None, end: str | None, dataset: str, timeframe: str
+) -> pd.DataFrame:
+    cached = _read_cached(_cache_path(dataset, symbols, start, end, timeframe))
+    if cached is not None:
+        return cached
+    levels = build_pyramid(load_ohlc(symbols, start, end, dataset))
+    for name, level in levels.items():
+        _write_cached(_cache_path(dataset, symbols, start, end, name), level)
+    if timeframe not in levels:
+        raise ValueError(f"Timeframe {timeframe!r} is finer than the {dataset} bars")
+    return levels[timeframe]
+
+
+# ------------------------------------------------------------------ #
+# RESAMPLING PYRAMID
+# ------------------------------------------------------------------ #
+def resample_ohlc(df: pd.DataFrame, rule: str) -> pd.DataFrame:
+    """Aggregate a (field, symbol) frame into `rule` bars, all symbols at once."""
+    parts = {}
+    for field in df.columns.get_level_values(0).unique():
+        bins = df[field].resample(rule, label="left", closed="left")
+        how = _OHLCV_AGG[field]
+        parts[field] = bins.sum(min_count=1) if how == "sum" else getattr(bins, how)()
+    out = pd.concat(parts, axis=1)
+    out.columns.names = df.columns.names
+    if pd.Timedelta(rule) < pd.Timedelta("1D"):
+        out = out.dropna(how="all")  # no empty intraday bars (nights, weekends)
+    return out
+
+
+def build_pyramid(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """Every `TIMEFRAMES` level at or above the native bar size of `df`.
+
+    Each level is resampled from the previous one: OHLCV aggregates compose
+    and the bins nest, so this matches resampling the base every time.
+    """
+    step = pd.Series(df.index).diff().min()
+    levels: dict[str, pd.DataFrame] = {}
+    prev = df
+    for name, rule in TIMEFRAMES.items():
+        if pd.Timedelta(rule) < step:
+            continue
+        prev = levels[name] = resample_ohlc(prev, rule)
+    return levels
+
+
+# ------------------------------------------------------------------ #
+# PARQUET LAKE (symbol / year partitions)
+# ------------------------------------------------------------------ #
+def _symbol_dir(dataset: str, symbol: str) -> Path:
+    # partition values are URI-encoded on disk ("^GSPC" → "%5EGSPC")
+    return LAKE_DIR / dataset / f"symbol={urllib.parse.quote(symbol, safe='')}"
+
+
+def _is_fresh(part: Path) -> bool:
+    try:
+        age = time.time() - part.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return age < LAKE_MAX_AGE_DAYS * 86_400
+
+
+def _ingest(dataset: str, symbols: list[str]) -> None:
+    """Download `symbols` once and store them as symbol/year Parquet partitions.
+
+    Symbols the dataset has no rows for get an (ignored) `_EMPTY` marker in
+    their partition, so they count as fresh instead of being fetched again.
+    """
     df = pwb_ds.load_dataset(dataset, symbols, extend=True)
+    root = LAKE_DIR / dataset
+    root.mkdir(parents=True, exist_ok=True)
+    # write aside (a "." directory, which dataset discovery skips), then swap
+    # each symbol directory in
+    with tempfile.TemporaryDirectory(dir=root, prefix=".ingest-") as tmp:
+        if len(df):
+            df = df[["date", "symbol", *FIELDS]].copy()
+            df["date"] = pd.to_datetime(df["date"])
+            df["year"] = df["date"].dt.year
+            pq.write_to_dataset(
+                pa.Table.from_pandas(df, preserve_index=False),
+                tmp,
+                partitioning=_LAKE_PARTITIONING,
+            )
+        found = set(df["symbol"].astype(str)) if len(df) else set()
+        for symbol in symbols:
+            if symbol in found:
+                continue
+            target = _symbol_dir(dataset, symbol)
+            if target.is_dir() and any(target.iterdir()):
+                os.utime(target)  # keep the rows we have; retry after LAKE_MAX_AGE_DAYS
+                continue
+            marker = Path(tmp) / target.name
+            marker.mkdir()
+            (marker / _EMPTY_MARKER).touch()
+        for part in Path(tmp).iterdir():
+            _swap_dir(part, root / part.name)
+
+
+def _swap_dir(new: Path, target: Path) -> None:
+    """Put `new` in place of `target`, leaving it missing only between two renames."""
+    old = target.with_name(f".{target.name}.old-{os.getpid()}")
+    try:
+        os.replace(target, old)  # directories: rename aside, never delete in place
+    except FileNotFoundError:
+        old = None
+    os.replace(new, target)
+    if old is not None:
+        shutil.rmtree(old, ignore_errors=True)
+
+
+def _read_lake(
+    dataset: str, symbols: list[str], start: str | None, end: str | None
+) -> pd.DataFrame:
+    """Rows for `symbols` in [start, end], reading only the matching partitions."""
+    stale = [s for s in symbols if not _is_fresh(_symbol_dir(dataset, s))]
+    if stale:
+        _ingest(dataset, stale)
+
+    lake = pds.dataset(LAKE_DIR / dataset, format="parquet", partitioning=_LAKE_PARTITIONING)
+    cond = pds.field("symbol").isin(symbols)
+    date_type = lake.schema.field("date").type
     if start:
-        df = df[df["date"] >= start]
+        ts = pd.Timestamp(start)
+        cond &= (pds.field("year") >= ts.year) & (pds.field("date") >= pa.scalar(ts, date_type))
     if end:
-        df = df[df["date"] <= end]
-
-    # pivot to (field, symbol) MultiIndex
-    pivot_df = pd.pivot_table(
-        df,
-        index="date",
-        columns="symbol",
-        values=["open", "high", "low", "close", "volume"],
-        aggfunc="first",
-    ).sort_index()
-
-    # fill weekends / holidays → NaNs; forward-fill to trading days later
-    full_range = pd.date_range(pivot_df.index.min(), pivot_df.index.max(), freq="D")
-    pivot_df = pivot_df.reindex(full_range)
-
-    # persistent feather cache for faster reloads
-    cache_key = (
-        f"{dataset}_{'_'.join(symbols)}_ohlc_{pivot_df.index.min().date()}_"
-        f"{pivot_df.index.max().date()}.feather"
-    )
-    cache_file = CACHE_DIR / cache_key
-    if not cache_file.exists():
-        pivot_df.reset_index().rename(columns={"index": "date"}).to_feather(cache_file)
-    return pivot_df
+        ts = pd.Timestamp(end)
+        cond &= (pds.field("year") <= ts.year) & (pds.field("date") <= pa.scalar(ts, date_type))
+    table = lake.to_table(columns=["date", "symbol", *FIELDS], filter=cond)
+    return table.to_pandas()
+
+
+# ------------------------------------------------------------------ #
+# ON-DISK PANEL CACHE
+# ------------------------------------------------------------------ #
+def _cache_path(
+    dataset: str,
+    symbols: Iterable[str],
+    start: str | None,
+    end: str | None,
+    timeframe: str | None = None,
+) -> Path:
+    # without an end date the dataset keeps growing: refresh once a day
+    until = end or f"open:{date.today().isoformat()}"
+    parts = (CACHE_VERSION, dataset, ",".join(symbols), start or "", until)
+    if timeframe:
+        parts += (timeframe,)
+    digest = hashlib.sha256("\0".join(parts).encode()).hexdigest()[:24]
+    return CACHE_DIR / f"{dataset}_{digest}.feather"
+
+
+def _read_cached(path: Path) -> pd.DataFrame | None:
+    try:
+        table = feather.read_table(path, memory_map=True)
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # truncated or foreign file: rebuild it
+        logger.warning(f"Ignoring unreadable cache file {path.name}: {e}")
+        path.unlink(missing_ok=True)
+        return None
+    os.utime(path)  # recency for eviction
+    return table.to_pandas()
+
+
+def _write_cached(path: Path, df: pd.DataFrame) -> None:
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=True)
+        feather.write_feather(table, tmp, compression="uncompressed")
+        os.replace(tmp, path)  # atomic: concurrent workers never see partial files
+    except Exception as e:
+        logger.warning(f"Could not write cache file {path.name}: {e}")
+        tmp.unlink(missing_ok=True)
+        return
+    evict_cache()
+
+
+def evict_cache(max_bytes: int | None = None) -> None:
+    """Delete least recently used cache files until the total fits `max_bytes`."""
+    max_bytes = CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    files = []
+    for f in CACHE_DIR.glob("*.feather"):
+        try:
+            st = f.stat()
+        except FileNotFoundError:
+            continue
+        files.append((st.st_mtime, st.st_size, f))
+    total = sum(size for _, size, _ in files)
+    for _, size, f in sorted(files):
+        if total <= max_bytes:
+            break
+        f.unlink(missing_ok=True)
+        total -= size
+
+
+def pivot_ohlc(df: pd.DataFrame, freq: str | None = None) -> pd.DataFrame:
+    """Long (date, symbol, fields…) rows → date × (field, symbol) frame.
+
+    Same layout as `pd.pivot_table(..., aggfunc="first")` but built with a
+    hash factorisation and one NumPy scatter per field instead of a groupby.
+    With `freq` the rows land directly on a regular `date_range` (gaps NaN),
+    which saves a separate `reindex` of the whole frame.
+    """
+    if freq:
+        dates = pd.date_range(df["date"].min(), df["date"].max(), freq=freq)
+        d_idx = dates.get_indexer(df["date"])
+    else:
+        d_idx, dates = pd.factorize(df["date"], sort=True)
+        dates = pd.DatetimeIndex(dates, name="date")
+    s_idx, symbols = pd.factorize(df["symbol"].astype(str), sort=True)
+    # keep the first row of duplicated (date, symbol) pairs; drop off-grid rows
+    first = ~pd.Index(d_idx * len(symbols) + s_idx).duplicated() & (d_idx >= 0)
+    d_idx, s_idx = d_idx[first], s_idx[first]
+
+    fields = sorted(FIELDS)
+    # (field, symbol, date) so the frame below wraps it without a copy
+    out = np.full((len(fields), len(symbols), len(dates)), np.nan)
+    for k, field in enumerate(fields):
+        out[k, s_idx, d_idx] = df[field].to_numpy(dtype=np.float64)[first]
+    columns = pd.MultiIndex.from_product([fields, symbols], names=[None, "symbol"])
+    return pd.DataFrame(out.reshape(-1, len(dates)).T, index=dates, columns=columns, copy=False)
+
+
+_FILL_BLOCK = 1 << 20  # cells per fill pass
+
+
+def _fill_along_dates(a: np.ndarray) -> np.ndarray:
+    """`ffill().bfill()` down the rows of a 2-D array, all columns at once."""
+    n, m = a.shape
+    rows = np.arange(n, dtype=np.intp)[:, None]
+    cols = np.arange(m, dtype=np.intp)
+    last = np.where(np.isnan(a), 0, rows)
+    np.maximum.accumulate(last, axis=0, out=last)
+    a = a[last, cols]
+    # leading gaps: back-fill from the first valid row
+    nxt = np.where(np.isnan(a), n - 1, rows)
+    nxt = np.minimum.accumulate(nxt[::-1], axis=0)[::-1]
+    return a[nxt, cols]
 
 
 def _trading_days(idx: pd.DatetimeIndex) -> pd.DatetimeIndex:
-    return pd.bdate_range(idx.min(), idx.max())
+    if (idx == idx.normalize()).all():
+        return pd.bdate_range(idx.min(), idx.max())
+    return idx  # intraday bars: every stored bar is a trading bar
 
 
-def add_feeds_to_cerebro(df: pd.DataFrame, cerebro: bt.Cerebro) -> None:
-    """Convert DataFrame produced by `load_ohlc` into individual Backtrader feeds."""
+@dataclass(frozen=True)
+class PreparedPanel:
+    """Trading-day OHLCV values for every symbol, ready to become feeds.
+
+    `values` has shape (symbol, date, field) so each symbol's block is a
+    contiguous (date, field) matrix that `frame` can wrap without copying.
+    """
+
+    dates: pd.DatetimeIndex
+    symbols: tuple[str, ...]
+    fields: tuple[str, ...]
+    values: np.ndarray
+    timeframe: str | None = None  # `TIMEFRAMES` key when resampled
+
+    def frame(self, symbol: str) -> pd.DataFrame:
+        block = self.values[self.symbols.index(symbol)]
+        return pd.DataFrame(block, index=self.dates, columns=list(self.fields), copy=False)
+
+    def slice(self, start: str | None = None, end: str | None = None) -> "PreparedPanel":
+        """Zero-copy view restricted to trading days in [start, end]."""
+        i0 = self.dates.searchsorted(pd.Timestamp(start)) if start else 0
+        i1 = self.dates.searchsorted(pd.Timestamp(end), side="right") if end else len(self.dates)
+        return PreparedPanel(
+            dates=self.dates[i0:i1],
+            symbols=self.symbols,
+            fields=self.fields,
+            values=self.values[:, i0:i1],
+            timeframe=self.timeframe,
+        )
+
+
+def prepare_panel(df: pd.DataFrame, timeframe: str | None = None) -> PreparedPanel:
+    """Forward/back-fill each symbol of a `load_ohlc` frame onto trading days."""
     trading_idx = _trading_days(df.index)
-    tqdm_bar = tqdm(df.columns.levels[1], desc="Adding feeds")
-    for symbol in tqdm_bar:
-        tqdm_bar.set_postfix_str(symbol)
-        sym_df = df.xs(symbol, axis=1, level=1, drop_level=False).copy().droplevel(1, axis=1)
-        sym_df.index.name = "date"
-        sym_df = sym_df.ffill().bfill()
-        sym_df = sym_df.loc[trading_idx]
-
-        data_feed = bt.feeds.PandasData(dataname=sym_df)
+    trading_idx.name = "date"
+    rows = df.index.get_indexer(trading_idx)
+    if (rows < 0).any():
+        raise KeyError("load_ohlc frame does not cover every trading day")
+    symbols = tuple(df.columns.levels[1])
+    n_fields = len(FIELDS)
+    # symbol-major column order, so a run of columns is a run of whole symbols
+    cols = df.columns.get_indexer([(f, s) for s in symbols for f in FIELDS])
+    raw = df.to_numpy(dtype=np.float64)
+
+    values = np.empty((len(symbols), len(trading_idx), n_fields), dtype=np.float64)
+    # fill a block of symbols per pass: vectorised, but temporaries stay small
+    step = max(1, _FILL_BLOCK // (len(df) * n_fields))
+    for i in range(0, len(symbols), step):
+        j = min(i + step, len(symbols))
+        block = raw[:, cols[i * n_fields : j * n_fields]]
+        block = _fill_along_dates(block)[rows].reshape(len(rows), j - i, n_fields)
+        values[i:j] = block.transpose(1, 0, 2)
+    return PreparedPanel(
+        dates=trading_idx, symbols=symbols, fields=FIELDS, values=values, timeframe=timeframe
+    )
+
+
+_BT_UNIX_EPOCH = 719163.0  # date(1970, 1, 1).toordinal()
+
+
+def _bt_datenums(dates: pd.DatetimeIndex) -> np.ndarray:
+    """`bt.date2num` for a whole (naive) index: ordinal day + day fraction."""
+    ns = np.asarray(dates, dtype="datetime64[ns]").view(np.int64)
+    days, rem = np.divmod(ns, 86_400 * 10**9)
+    return (days + _BT_UNIX_EPOCH) + rem / (86_400 * 1e9)
+
+
+class ArrayData(bt.feed.DataBase):
+    """Backtrader feed over NumPy columns, preloaded in bulk.
+
+    `datenums` are Backtrader float dates, `values` a (date, field) matrix
+    whose columns follow `fields`.  Instead of `PandasData`'s per-row,
+    per-column `iloc` walk, `preload` copies each column into its line buffer
+    in one go.  Without preloading (or with filters / date bounds) bars are
+    served one at a time through `_load`.
+    """
+
+    params = (("datenums", None), ("values", None), ("fields", FIELDS))
+
+    def start(self):
+        super().start()
+        self._idx = -1
+        self._field_lines = [getattr(self.lines, f) for f in self.p.fields]
+
+    def _load(self):
+        self._idx += 1
+        if self._idx >= len(self.p.datenums):
+            return False
+        for line, value in zip(self._field_lines, self.p.values[self._idx]):
+            line[0] = value
+        self.lines.datetime[0] = self.p.datenums[self._idx]
+        return True
+
+    def preload(self):
+        bounded = self.p.fromdate is not None or self.p.todate is not None
+        if bounded or self._filters or self.lines.datetime.mode != bt.LineBuffer.UnBounded:
+            return super().preload()
+        n = len(self.p.datenums)
+        columns = {"datetime": np.asarray(self.p.datenums, dtype=np.float64)}
+        for k, field in enumerate(self.p.fields):
+            columns[field] = self.p.values[:, k]
+        for alias in self.getlinealiases():
+            col = columns.get(alias)
+            buf = getattr(self.lines, alias)
+            if col is None:  # e.g. openinterest: missing, like PandasData
+                col = np.full(n, np.nan)
+            buf.array.frombytes(np.ascontiguousarray(col, dtype=np.float64).tobytes())
+        self._last()
+        self.home()
+
+
+def add_panel_to_cerebro(panel: PreparedPanel, cerebro: bt.Cerebro) -> None:
+    """Add one Backtrader feed per symbol of an already prepared panel."""
+    kwargs = {}
+    if panel.timeframe and pd.Timedelta(TIMEFRAMES[panel.timeframe]) < pd.Timedelta("1D"):
+        minutes = pd.Timedelta(TIMEFRAMES[panel.timeframe]) // pd.Timedelta("1min")
+        kwargs = {"timeframe": bt.TimeFrame.Minutes, "compression": minutes}
+    datenums = _bt_datenums(panel.dates)
+    for i, symbol in enumerate(panel.symbols):
+        data_feed = ArrayData(
+            datenums=datenums, values=panel.values[i], fields=panel.fields, **kwargs
+        )
         cerebro.adddata(data_feed, name=symbol)
+
+
+def add_feeds_to_cerebro(df: pd.DataFrame, cerebro: bt.Cerebro) -> None:
+    """Convert DataFrame produced by `load_ohlc` into individual Backtrader feeds."""
+    add_panel_to_cerebro(prepare_panel(df), cerebro)
@@ -15,17 +15,19 @@ def _to_np(arr):
 # ------------------------------------------------------------------ #
 # BASIC METRICS
 # ------------------------------------------------------------------ #
-def daily_returns(equity_curve: pd.Series) -> np.ndarray:
-    return _to_np(equity_curve.pct_change().dropna())
+def daily_returns(equity_curve: pd.Series | np.ndarray) -> np.ndarray:
+    arr = _to_np(equity_curve)
+    rets = arr[1:] / arr[:-1] - 1
+    return rets[~np.isnan(rets)]
 
 
-def cagr(equity_curve: pd.Series, periods_per_year: int = 252) -> float:
+def cagr(equity_curve: pd.Series | np.ndarray, periods_per_year: float = 252) -> float:
     arr = _to_np(equity_curve)
     n_years = len(arr) / periods_per_year
     return (arr[-1] / arr[0]) ** (1 / n_years) - 1
 
 
-def sharpe(returns: np.ndarray, rf: float = 0.0, periods_per_year: int = 252) -> float:
+def sharpe(returns: np.ndarray, rf: float = 0.0, periods_per_year: float = 252) -> float:
     excess = returns - rf / periods_per_year
     if len(excess) < 2:
         return 0.0
@@ -35,12 +37,59 @@ def sharpe(returns: np.ndarray, rf: float = 0.0, periods_per_year: int = 252) ->
     return np.sqrt(periods_per_year) * excess.mean() / std
 
 
-def max_drawdown(equity_curve: pd.Series) -> float:
+def max_drawdown(equity_curve: pd.Series | np.ndarray) -> float:
     """Return *percentage* max drawdown (negative value)."""
-    cummax = equity_curve.cummax()
-    dd = (equity_curve - cummax) / cummax
+    arr = _to_np(equity_curve)
+    cummax = np.maximum.accumulate(arr)
+    dd = (arr - cummax) / cummax
     return dd.min()
 
 
 def calmar(cagr_: float, mdd: float) -> float:
     return cagr_ / abs(mdd) if mdd != 0 else 0
+
+
+# ------------------------------------------------------------------ #
+# KPI SUMMARY
+# ------------------------------------------------------------------ #
+def periods_per_year(dates: pd.DatetimeIndex, trading_days: int = 252) -> float:
+    """Bars per year of a bar index: `trading_days` × bars per trading day.
+
+    252 for daily bars; intraday bars scale it by how many bars a session holds.
+    """
+    days = dates.normalize().nunique()
+    return trading_days * len(dates) / days if days else trading_days
+
+
+def summary(equity_curve: pd.Series | np.ndarray, periods_per_year: float = 252) -> dict:
+    """KPI dict stored for every evaluated program (one equity value per bar)."""
+    arr = _to_np(equity_curve)
+    rets = daily_returns(arr)
+    cagr_ = cagr(arr, periods_per_year)
+    mdd = max_drawdown(arr)
+    return {
+        "total_return": arr[-1] / arr[0] - 1,
+        "cagr": cagr_,
+        "sharpe": sharpe(rets, periods_per_year=periods_per_year),
+        "max_drawdown": float(mdd),
+        "calmar": calmar(cagr_, mdd),
+        "n_days": int(arr.size),
+    }
+
+
+def fold_summary(folds: list[dict]) -> dict:
+    """Aggregate per-fold KPI dicts: mean (under the usual names), worst and std.
+
+    "Worst" is the minimum for every KPI; for `max_drawdown` (negative) that
+    is the deepest drawdown.  `n_days` is summed and the folds are kept.
+    """
+    out: dict = {}
+    for key in ("total_return", "cagr", "sharpe", "max_drawdown", "calmar"):
+        vals = np.array([f[key] for f in folds], dtype=float)
+        out[key] = float(vals.mean())
+        out[f"{key}_worst"] = float(vals.min())
+        out[f"{key}_std"] = float(vals.std())
+    out["n_days"] = int(sum(f["n_days"] for f in folds))
+    out["n_folds"] = len(folds)
+    out["folds"] = folds
+    return out
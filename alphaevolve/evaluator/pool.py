@@ -0,0 +1,160 @@
+"""
+Process-pool backend for back-test evaluation.
+
+Backtrader is pure Python, so running `evaluate_sync` on the default thread
+pool serialises every back-test behind the GIL.  This module owns a lazily
+created `ProcessPoolExecutor` that `evaluator.backtest.evaluate` routes
+through, so concurrent spawns really use one core each.
+
+Configuration (see `alphaevolve.config`):
+
+    eval_backend              – "process" (default) or "thread"
+    eval_workers              – number of worker processes [os.cpu_count()]
+    eval_max_tasks_per_child  – recycle a worker after N jobs [None = never]
+    eval_start_method         – "spawn" or "forkserver" ["spawn"]
+
+A worker killed mid-job (hard resource limit, OS OOM killer) breaks the
+whole `ProcessPoolExecutor` and fails every job in flight, not just its
+own; callers `discard` it (the next `get_executor` starts a fresh one) and
+re-run those jobs with `run_isolated`, one fresh process each, so a second
+death can be blamed on the right job and read from its exit code.
+
+Workers are long-lived: an optional initializer (e.g. `backtest.warm_up`)
+runs once per process so market data is loaded at start-up rather than for
+every job.
+"""
+
+import atexit
+import multiprocessing as mp
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any
+
+from alphaevolve.config import settings
+
+START_METHODS = ("spawn", "forkserver")
+
+
+class WorkerDied(Exception):
+    """An isolated job's process ended without reporting a result."""
+
+    def __init__(self, exitcode: int | None):
+        super().__init__(f"evaluation worker died with exit code {exitcode}")
+        self.exitcode = exitcode
+
+_lock = threading.Lock()
+_executor: ProcessPoolExecutor | None = None
+
+
+def _build_executor(
+    initializer: Callable[..., None] | None, initargs: tuple
+) -> ProcessPoolExecutor:
+    method = settings.eval_start_method
+    if method not in START_METHODS:
+        raise ValueError(
+            f"Unsupported eval_start_method {method!r}; expected one of {START_METHODS}"
+        )
+    kwargs = {}
+    if settings.eval_max_tasks_per_child:
+        # Python >= 3.11 only; incompatible with "fork", hence START_METHODS
+        kwargs["max_tasks_per_child"] = settings.eval_max_tasks_per_child
+    return ProcessPoolExecutor(
+        max_workers=settings.eval_workers or os.cpu_count() or 1,
+        mp_context=mp.get_context(method),
+        initializer=initializer,
+        initargs=initargs,
+        **kwargs,
+    )
+
+
+def get_executor(
+    initializer: Callable[..., None] | None = None, initargs: tuple = ()
+) -> Executor | None:
+    """Return the shared evaluation executor.
+
+    `None` means "use the event loop's default thread pool", which is what
+    `loop.run_in_executor` expects for the thread backend.  `initializer`
+    only applies when the pool is created; later calls reuse the same pool.
+    """
+    global _executor
+    backend = settings.eval_backend.lower()
+    if backend == "thread":
+        return None
+    if backend != "process":
+        raise ValueError(f"Unknown evaluation backend: {settings.eval_backend}")
+    with _lock:
+        if _executor is None:
+            _executor = _build_executor(initializer, initargs)
+        return _executor
+
+
+def shutdown(wait: bool = True) -> None:
+    """Stop the worker processes (a new pool is created on next use)."""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def discard(executor: Executor | None) -> None:
+    """Drop a broken pool (a worker was killed) so the next call respawns it.
+
+    Only `executor` itself is dropped: if another caller already replaced
+    it, the fresh pool is left alone.
+    """
+    global _executor
+    with _lock:
+        if executor is None or executor is not _executor:
+            return
+        _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _isolated_main(conn, fn: Callable[[], Any], initializer, initargs: tuple) -> None:
+    try:
+        if initializer is not None:
+            initializer(*initargs)
+        outcome = (True, fn())
+    except BaseException as e:
+        outcome = (False, e)
+    try:
+        conn.send(outcome)
+    except Exception as e:  # unpicklable result or exception
+        conn.send((False, RuntimeError(f"{type(e).__name__}: {e}")))
+    conn.close()
+
+
+def run_isolated(
+    fn: Callable[[], Any],
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple = (),
+) -> Any:
+    """Run `fn()` alone in a fresh process and return its result (blocking).
+
+    Exceptions raised by `fn` are re-raised here; if the process dies
+    without answering, `WorkerDied` carries its exit code (-N: signal N).
+    """
+    ctx = mp.get_context(settings.eval_start_method)
+    receiver, sender = ctx.Pipe(duplex=False)
+    proc = ctx.Process(
+        target=_isolated_main, args=(sender, fn, initializer, initargs), daemon=True
+    )
+    proc.start()
+    sender.close()  # the child holds the only write end: EOF once it is gone
+    try:
+        ok, value = receiver.recv()
+    except EOFError:
+        proc.join()
+        raise WorkerDied(proc.exitcode) from None
+    finally:
+        receiver.close()
+    proc.join()
+    if not ok:
+        raise value
+    return value
+
+
+atexit.register(shutdown)
@@ -0,0 +1,229 @@
+"""
+Static pre-flight checks on a candidate before it is sent to a back-test.
+
+Everything here works on the AST only, so a doomed child is rejected in
+about the time it takes to parse it, instead of occupying an evaluation
+worker.  `check` returns a
+`Rejection` naming the first problem found, or None if the code looks
+runnable:
+
+    syntax_error      – the source does not parse
+    forbidden_import  – imports a module outside the sandbox (os, subprocess, …)
+    forbidden_call    – calls eval / exec / open / __import__ …
+    no_strategy       – nothing `evaluate_sync` could run: no `Strategy`,
+                        `STRATEGY_CLASS`, bt.Strategy subclass or `target_weights`
+    empty_next        – the strategy's `next()` does nothing beyond logging
+                        (a `SignalStrategy`, or one calling `signal_add`,
+                        trades through its signals instead and passes)
+
+The checks mirror what `evaluator.backtest` looks up at run time; they are
+deliberately conservative, so anything they accept may still fail later.
+"""
+
+import ast
+from dataclasses import dataclass
+
+REASONS = (
+    "syntax_error",
+    "forbidden_import",
+    "forbidden_call",
+    "no_strategy",
+    "empty_next",
+)
+
+FORBIDDEN_MODULES = frozenset(
+    {
+        "builtins", "ctypes", "http", "importlib", "multiprocessing", "os",
+        "pathlib", "pickle", "requests", "shutil", "signal", "socket",
+        "subprocess", "sys", "tempfile", "threading", "urllib",
+    }
+)
+FORBIDDEN_CALLS = frozenset({"__import__", "compile", "eval", "exec", "open"})
+
+# `BaseLoggingStrategy.next` only records equity, so it does not count
+_BASE_CLASS = "BaseLoggingStrategy"
+_STRATEGY_BASES = frozenset({"Strategy", "SignalStrategy", _BASE_CLASS})
+# hooks besides next() where a Backtrader strategy can place orders
+_TRADING_HOOKS = ("next", "next_open", "prenext", "nextstart", "notify_timer")
+# bt.SignalStrategy places orders itself from signals added in __init__
+_SIGNAL_BASE = "SignalStrategy"
+
+
+@dataclass(frozen=True)
+class Rejection:
+    reason: str
+    detail: str = ""
+
+
+def _base_name(node: ast.expr) -> str | None:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):  # bt.Strategy
+        return node.attr
+    return None
+
+
+def _forbidden(tree: ast.Module) -> Rejection | None:
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            modules = [node.module or ""] if not node.level else []
+        elif (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in FORBIDDEN_CALLS
+        ):
+            return Rejection("forbidden_call", f"{node.func.id}() on line {node.lineno}")
+        else:
+            continue
+        for module in modules:
+            if module.split(".")[0] in FORBIDDEN_MODULES:
+                return Rejection("forbidden_import", f"{module} on line {node.lineno}")
+    return None
+
+
+def _is_noop(stmt: ast.stmt) -> bool:
+    if isinstance(stmt, ast.Pass):
+        return True
+    if not isinstance(stmt, ast.Expr):
+        return False
+    value = stmt.value
+    if isinstance(value, ast.Constant):  # docstring or `...`
+        return True
+    # super().next() / BaseLoggingStrategy.next(self)
+    return (
+        isinstance(value, ast.Call)
+        and isinstance(value.func, ast.Attribute)
+        and (
+            (
+                isinstance(value.func.value, ast.Call)
+                and isinstance(value.func.value.func, ast.Name)
+                and value.func.value.func.id == "super"
+            )
+            or _base_name(value.func.value) == _BASE_CLASS
+        )
+    )
+
+
+class _Strategies:
+    """Module-level classes and which of them are Backtrader strategies."""
+
+    def __init__(self, tree: ast.Module):
+        self.classes = {
+            node.name: node for node in tree.body if isinstance(node, ast.ClassDef)
+        }
+        self.strategy_class = None
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and any(
+                isinstance(t, ast.Name) and t.id == "STRATEGY_CLASS" for t in node.targets
+            ):
+                self.strategy_class = _base_name(node.value)
+
+    def is_strategy(self, name: str, seen: frozenset = frozenset()) -> bool:
+        node = self.classes.get(name)
+        if node is None or name in seen:
+            return False
+        for base in map(_base_name, node.bases):
+            if base in _STRATEGY_BASES or self.is_strategy(base, seen | {name}):
+                return True
+        return False
+
+    def find(self) -> str | None:
+        """Name of the class `backtest._find_strategy` would pick."""
+        for name in ("Strategy", self.strategy_class):
+            if name in self.classes:
+                return name
+        for name in self.classes:
+            if name != _BASE_CLASS and self.is_strategy(name):
+                return name
+        return None
+
+    def opaque(self, name: str) -> bool:
+        """Does `name` inherit from a class defined elsewhere (unknown methods)?"""
+        stack, seen = [name], set()
+        while stack:
+            cls = self.classes.get(stack.pop())
+            if cls is None or cls.name in seen:
+                continue
+            seen.add(cls.name)
+            for base in map(_base_name, cls.bases):
+                if base not in self.classes and base not in _STRATEGY_BASES | {"object"}:
+                    return True
+                stack.append(base)
+        return False
+
+    def trades_on_signals(self, name: str) -> bool:
+        """Is `name` a `SignalStrategy`, or does it call `signal_add`?"""
+        stack, seen = [name], set()
+        while stack:
+            cls = self.classes.get(stack.pop())
+            if cls is None or cls.name in seen:
+                continue
+            seen.add(cls.name)
+            bases = [b for b in map(_base_name, cls.bases) if b]
+            if _SIGNAL_BASE in bases:
+                return True
+            for node in ast.walk(cls):
+                if (
+                    isinstance(node, ast.Call)
+                    and isinstance(node.func, ast.Attribute)
+                    and node.func.attr == "signal_add"
+                ):
+                    return True
+            stack.extend(bases)
+        return False
+
+    def methods(self, name: str) -> dict[str, ast.FunctionDef]:
+        """Methods of `name` including local bases, nearest definition first."""
+        found: dict[str, ast.FunctionDef] = {}
+        stack, seen = [name], set()
+        while stack:
+            cls = self.classes.get(stack.pop(0))
+            if cls is None or cls.name in seen or cls.name == _BASE_CLASS:
+                continue
+            seen.add(cls.name)
+            for node in cls.body:
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    found.setdefault(node.name, node)
+            stack.extend(b for b in map(_base_name, cls.bases) if b)
+        return found
+
+
+def _has_target_weights(tree: ast.Module, strategies: _Strategies) -> bool:
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "target_weights":
+            return True
+    for name in ("Strategy", strategies.strategy_class):
+        if name in strategies.classes and "target_weights" in strategies.methods(name):
+            return True
+    return False
+
+
+def check(code: str) -> Rejection | None:
+    """First reason `code` cannot produce a useful back-test, else None."""
+    try:
+        tree = ast.parse(code)
+    except SyntaxError as e:
+        return Rejection("syntax_error", f"{e.msg} on line {e.lineno}")
+    rejection = _forbidden(tree)
+    if rejection is not None:
+        return rejection
+    strategies = _Strategies(tree)
+    if _has_target_weights(tree, strategies):
+        return None
+    name = strategies.find()
+    if name is None:
+        # imported strategy, or a subclass of something we cannot see
+        if strategies.strategy_class is not None or any(map(strategies.opaque, strategies.classes)):
+            return None
+        return Rejection("no_strategy", "no Strategy, STRATEGY_CLASS or bt.Strategy subclass")
+    if strategies.opaque(name) or strategies.trades_on_signals(name):
+        return None
+    methods = strategies.methods(name)
+    if not any(
+        hook in methods and not all(_is_noop(s) for s in methods[hook].body)
+        for hook in _TRADING_HOOKS
+    ):
+        return Rejection("empty_next", f"{name}.next() never does anything")
+    return None
@@ -0,0 +1,102 @@
+"""
+Read-only shared-memory copy of a `PreparedPanel` for multi-process evaluation.
+
+The parent publishes the prepared (symbol, date, field) array once; every
+evaluation worker attaches to the same block through a small, picklable
+`PanelDescriptor` and builds its feeds from zero-copy NumPy views.  Memory
+therefore stays flat as workers are added.
+
+Block layout (all items 8 bytes wide):
+
+    [ n_dates × int64 dates (ns since epoch) | symbol × date × field float64 ]
+"""
+
+import atexit
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from alphaevolve.evaluator.loader import PreparedPanel
+
+
+@dataclass(frozen=True)
+class PanelDescriptor:
+    """Everything a worker needs to re-create the panel from shared memory."""
+
+    name: str
+    symbols: tuple[str, ...]
+    fields: tuple[str, ...]
+    n_dates: int
+    timeframe: str | None = None
+
+
+# blocks created (owner) or mapped (worker) by this process; kept alive here
+_published: dict[str, shared_memory.SharedMemory] = {}
+_attached: dict[str, shared_memory.SharedMemory] = {}
+
+
+def _views(
+    shm: shared_memory.SharedMemory, desc: PanelDescriptor
+) -> tuple[np.ndarray, np.ndarray]:
+    n_dates = desc.n_dates
+    dates = np.ndarray((n_dates,), dtype=np.int64, buffer=shm.buf)
+    values = np.ndarray(
+        (len(desc.symbols), n_dates, len(desc.fields)),
+        dtype=np.float64,
+        buffer=shm.buf,
+        offset=n_dates * 8,
+    )
+    return dates, values
+
+
+def publish(panel: PreparedPanel) -> PanelDescriptor:
+    """Copy `panel` into a new shared-memory block and describe it."""
+    n_dates = len(panel.dates)
+    size = n_dates * 8 + panel.values.astype(np.float64, copy=False).nbytes
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    desc = PanelDescriptor(
+        name=shm.name,
+        symbols=panel.symbols,
+        fields=panel.fields,
+        n_dates=n_dates,
+        timeframe=panel.timeframe,
+    )
+    dates, values = _views(shm, desc)
+    dates[:] = np.asarray(panel.dates, dtype="datetime64[ns]").view(np.int64)
+    values[:] = panel.values
+    _published[shm.name] = shm
+    return desc
+
+
+def attach(desc: PanelDescriptor) -> PreparedPanel:
+    """Map a published block and wrap it as a read-only `PreparedPanel`."""
+    shm = _attached.get(desc.name)
+    if shm is None:
+        shm = _attached[desc.name] = shared_memory.SharedMemory(name=desc.name)
+    dates, values = _views(shm, desc)
+    values.flags.writeable = False
+    return PreparedPanel(
+        dates=pd.DatetimeIndex(dates.view("datetime64[ns]"), name="date"),
+        symbols=desc.symbols,
+        fields=desc.fields,
+        values=values,
+        timeframe=desc.timeframe,
+    )
+
+
+def release() -> None:
+    """Unmap attached blocks and unlink the ones this process published."""
+    for blocks, unlink in ((_attached, False), (_published, True)):
+        while blocks:
+            _, shm = blocks.popitem()
+            try:
+                shm.close()
+            except BufferError:  # views still alive; the OS unmaps at exit
+                pass
+            if unlink:
+                shm.unlink()
+
+
+atexit.register(release)
@@ -0,0 +1,117 @@
+"""
+Vectorised fast-path evaluator for signal-style strategies.
+
+Instead of a Backtrader `next()` loop, a strategy emits a target-weight
+matrix (trading dates × symbols) computed with NumPy/pandas.  The code
+string must expose either:
+
+    1. a class (`Strategy` / `STRATEGY_CLASS`) with a
+       `target_weights(self, prices) -> pd.DataFrame` method, **or**
+    2. a module-level function `target_weights(prices) -> pd.DataFrame`.
+
+`prices` has the `load_ohlc` layout – (field, symbol) columns – restricted to
+trading days, so `prices["close"]` is a dates × symbols frame.  Rows of the
+returned weights that are all-NaN mean "no rebalance, keep the last target".
+
+A target emitted on bar t is filled at the *open* of bar t+1, like a
+Backtrader market order placed in `next()`: the old holdings earn the
+overnight gap, the new ones the open → close move.  The simulation
+rebalances to the target weights every bar and charges `cost_bps` on
+turnover.  It is a screening engine: holdings are not allowed to drift
+between rebalances, so KPIs are close to, not identical with, the
+Backtrader run.
+"""
+
+import inspect
+import types
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+from alphaevolve.evaluator import metrics as mt
+from alphaevolve.evaluator.loader import PreparedPanel
+
+WeightsFn = Callable[[pd.DataFrame], pd.DataFrame]
+
+
+def find_weights_fn(mod: types.ModuleType) -> WeightsFn | None:
+    """Return the strategy's `target_weights` callable, if it is signal-style.
+
+    Static and class methods are used straight off the class; otherwise the
+    class must be constructible without arguments (a `bt.Strategy` subclass
+    is not, and is left to the Backtrader path).
+    """
+    for attr in ("Strategy", "STRATEGY_CLASS"):
+        cls = getattr(mod, attr, None)
+        if not inspect.isclass(cls) or not callable(getattr(cls, "target_weights", None)):
+            continue
+        if isinstance(inspect.getattr_static(cls, "target_weights"), (staticmethod, classmethod)):
+            return cls.target_weights
+        try:
+            return cls().target_weights
+        except Exception:
+            continue
+    fn = getattr(mod, "target_weights", None)
+    return fn if inspect.isfunction(fn) else None
+
+
+def panel_prices(panel: PreparedPanel) -> pd.DataFrame:
+    """(field, symbol)-column frame over the panel's trading days."""
+    values = panel.values.transpose(1, 2, 0)  # date, field, symbol
+    columns = pd.MultiIndex.from_product([panel.fields, panel.symbols])
+    return pd.DataFrame(
+        values.reshape(len(panel.dates), -1), index=panel.dates, columns=columns
+    )
+
+
+def simulate(
+    close: pd.DataFrame,
+    weights: pd.DataFrame,
+    *,
+    open_: pd.DataFrame | None = None,
+    cash: float = 1_000.0,
+    cost_bps: float = 0.0,
+) -> pd.DataFrame:
+    """Return daily `equity` and `turnover` for target `weights` on `close`.
+
+    Trades fill at `open_` (default: `close`, i.e. no overnight gap).
+    """
+    open_ = close if open_ is None else open_.reindex(index=close.index, columns=close.columns)
+    weights = weights.reindex(index=close.index, columns=close.columns)
+    weights = weights.astype(float).ffill().fillna(0.0)
+    live = weights.abs().to_numpy().sum(axis=1) > 0
+    first = int(np.argmax(live)) if live.any() else len(close) - 1
+
+    w = weights.to_numpy()[first:]
+    px = close.to_numpy(dtype=float)[first:]
+    op = open_.to_numpy(dtype=float)[first:]
+    gap = np.zeros_like(px)
+    gap[1:] = op[1:] / px[:-1] - 1  # close(i-1) -> open(i)
+    gap = np.nan_to_num(gap)
+    intraday = np.nan_to_num(px / op - 1)  # open(i) -> close(i)
+
+    # a signal at bar t is filled at the open of bar t+1: before[i] is held
+    # over the gap into bar i, after[i] from its open to its close
+    after = np.zeros_like(w)
+    after[1:] = w[:-1]
+    before = np.zeros_like(w)
+    before[1:] = after[:-1]
+    turnover = np.abs(after - before).sum(axis=1)
+    growth = (
+        (1 + (before * gap).sum(axis=1))
+        * (1 - turnover * cost_bps / 1e4)
+        * (1 + (after * intraday).sum(axis=1))
+    )
+    equity = cash * np.cumprod(growth)
+    return pd.DataFrame(
+        {"equity": equity, "turnover": turnover}, index=close.index[first:]
+    )
+
+
+def run(weights_fn: WeightsFn, panel: PreparedPanel, *, cost_bps: float = 0.0) -> Dict[str, Any]:
+    """Evaluate a signal-style strategy and return the standard KPI dict."""
+    prices = panel_prices(panel)
+    weights = weights_fn(prices)
+    sim = simulate(prices["close"], weights, open_=prices["open"], cost_bps=cost_bps)
+    return mt.summary(sim["equity"], periods_per_year=mt.periods_per_year(panel.dates))
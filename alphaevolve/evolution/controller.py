@@ -4,8 +4,12 @@ High‑level loop:
 1. Choose a *parent* strategy (elite or random) from `ProgramStore`.
 2. Build prompt, call OpenAI → JSON diff/full code.
 3. Apply patch ⇒ child code.
-4. Evaluate back‑test KPIs.
+4. Evaluate back‑test KPIs (optionally as a cascade: a cheap screen on a
+   recent window first, the full history only for promising children).
 5. Insert child into store (which updates MAP‑Elites grid).
+
+Store calls made while spawning go through `AsyncProgramStore`, so a slow
+query or commit never holds up the LLM calls of the other spawns.
 """
 
 import asyncio
@@ -14,15 +18,21 @@ import json
 import logging
 import random
 import textwrap
+from collections import Counter
 from collections.abc import Sequence
+from datetime import date
 from pathlib import Path
+from typing import Any
 
 from alphaevolve.config import settings
-from alphaevolve.evaluator.backtest import evaluate
+from alphaevolve.evaluator import preflight
+from alphaevolve.evaluator.backtest import evaluate, evaluate_walk_forward
+from alphaevolve.evaluator.limits import EvaluationLimitExceeded
 from alphaevolve.evolution.patching import apply_patch
 from alphaevolve.evolution.prompt_ga import PromptGenome
 from alphaevolve.llm_engine import client as llm_client
 from alphaevolve.llm_engine import prompts
+from alphaevolve.store.async_store import AsyncProgramStore
 from alphaevolve.store.sqlite import ProgramStore
 from alphaevolve.strategies.base import BaseLoggingStrategy
 from examples import config as example_config
@@ -33,18 +43,24 @@ logger = logging.getLogger(__name__)
 class Controller:
     def __init__(
         self,
-        store: ProgramStore,
+        store: ProgramStore | AsyncProgramStore,
         *,
         initial_program_paths: Sequence[str | Path] | None = None,
         metric: str | None = None,
         max_concurrency: int = 4,
         prompt: PromptGenome | None = None,
     ):
-        self.store = store
+        # controllers sharing a store should share one AsyncProgramStore
+        self.async_store = (
+            store if isinstance(store, AsyncProgramStore) else AsyncProgramStore(store)
+        )
+        self.store = self.async_store.store
         self.sem = asyncio.Semaphore(max_concurrency)
         self.initial_program_paths = [Path(p) for p in initial_program_paths or []]
         self.prompt = prompt or PromptGenome(prompts.SYSTEM_MSG, prompts.USER_TEMPLATE)
         self.metric = metric or example_config.HOF_METRIC
+        # children turned away by the pre-flight checks, per reason
+        self.rejections: Counter[str] = Counter()
         self._ensure_seed_population()
 
     # ------------------------------------------------------------------
@@ -76,35 +92,86 @@ class Controller:
             )
         logger.info("Seed strategies inserted into store.")
 
-    def _select_parent(self, parent_id: str | None):
+    async def _select_parent(self, parent_id: str | None):
+        store = self.async_store
         if parent_id:
-            return self.store.get(parent_id)
+            return await store.get(parent_id)
         r = random.random()
         if r < settings.elite_selection_ratio:
-            elites = self.store.top_k(k=settings.archive_size, metric=self.metric)
-            return random.choice(elites) if elites else self.store.sample()
+            elites = await store.top_k(k=settings.archive_size, metric=self.metric)
+            return random.choice(elites) if elites else await store.sample()
         r -= settings.elite_selection_ratio
         if r < settings.exploitation_ratio:
-            best = self.store.top_k(k=1, metric=self.metric)
-            return best[0] if best else self.store.sample()
+            best = await store.top_k(k=1, metric=self.metric)
+            return best[0] if best else await store.sample()
         r -= settings.exploitation_ratio
         if r < settings.exploration_ratio:
             island = random.randrange(settings.num_islands)
-            return self.store.sample(island=island)
-        return self.store.sample()
+            return await store.sample(island=island)
+        return await store.sample()
+
+    async def _passes_screen(self, kpis: dict[str, Any]) -> bool:
+        """Is the screen-window score close enough to the hall of fame?"""
+        best = await self.async_store.top_k(k=1, metric=self.metric)
+        if not best:
+            return True
+        # the screen is a single back-test: fold aggregates such as
+        # `calmar_worst` are compared on their underlying KPI
+        metric = self.metric.removesuffix("_worst").removesuffix("_std")
+        ref = best[0]["metrics"].get(metric, 0.0)
+        cutoff = ref - (1 - settings.cascade_threshold) * abs(ref)
+        return kpis.get(metric, 0.0) >= cutoff
+
+    async def _evaluate_child(self, code: str) -> tuple[dict[str, Any], str]:
+        """Return the child's KPIs and its store status.
+
+        Status is "ok", "rejected" (failed the static pre-flight checks, never
+        back-tested), "screened" (failed the cascade screen), "aborted" (the
+        back-test hit an early-abort rule), "timeout" / "oom" (it was
+        stopped by the per-evaluation time or memory limit) or "crashed" (its
+        worker died for another reason).
+        """
+        rejection = preflight.check(code)
+        if rejection is not None:
+            self.rejections[rejection.reason] += 1
+            logger.info(
+                "Child rejected by pre-flight [%s] %s", rejection.reason, rejection.detail
+            )
+            return {"reason": rejection.reason, "error": rejection.detail}, "rejected"
+        try:
+            return await self._run_cascade(code)
+        except EvaluationLimitExceeded as e:
+            logger.warning("Child stopped by evaluation limit: %s", e)
+            return {"error": str(e)}, e.status
+
+    async def _run_cascade(self, code: str) -> tuple[dict[str, Any], str]:
+        if settings.cascade_enabled:
+            screen_start = f"{date.today().year - settings.cascade_screen_years}-01-01"
+            screen = await evaluate(code, start=screen_start)
+            if screen.get("aborted"):
+                return screen, "aborted"
+            if not await self._passes_screen(screen):
+                return screen, "screened"
+        if settings.eval_folds > 1:
+            kpis = await evaluate_walk_forward(code, folds=settings.eval_folds)
+        else:
+            kpis = await evaluate(code)
+        return kpis, "aborted" if kpis.get("aborted") else "ok"
 
     async def _spawn(self, parent_id: str | None, *, prompt: PromptGenome | None = None):
         """Generate, evaluate & store one child strategy."""
         prompt = prompt or self.prompt
         async with self.sem:
             # 1) Select parent
-            parent = self._select_parent(parent_id)
+            parent = await self._select_parent(parent_id)
             if parent is None:
                 logger.warning("No parent found; skipping spawn.")
                 return
 
             # 2) Build prompt & call OpenAI
-            messages = prompts.build(parent, self.store, metric=self.metric, prompt=prompt)
+            messages = await asyncio.to_thread(
+                prompts.build, parent, self.store, metric=self.metric, prompt=prompt
+            )  # reads the hall of fame
             try:
                 msg = await llm_client.chat(messages)
             except Exception as e:
@@ -121,27 +188,30 @@ class Controller:
             child_strategy = apply_patch(parent["code"], diff_json)
 
             if "class BaseLoggingStrategy" not in child_strategy:
-                imports = "from collections import deque\nimport backtrader as bt"
-                base_cls = inspect.getsource(BaseLoggingStrategy)
-                child_code = textwrap.dedent(imports + "\n\n" + base_cls + "\n\n" + child_strategy)
+                # inline the whole base module: the class relies on its helpers
+                base_src = inspect.getsource(inspect.getmodule(BaseLoggingStrategy))
+                child_code = textwrap.dedent(base_src + "\n\n" + child_strategy)
             else:
                 child_code = textwrap.dedent(child_strategy)
 
             # 4) Evaluate
             try:
-                kpis = await evaluate(child_code)
+                kpis, status = await self._evaluate_child(child_code)
             except Exception as e:
                 logger.error(f"Evaluation failed: {e}")
                 return
 
             # 5) Persist
-            self.store.insert(
+            await self.async_store.insert(
                 child_code,
                 kpis,
                 parent_id=parent["id"],
                 island=parent.get("island", 0),
+                status=status,
+            )
+            logger.info(
+                "Child stored [%s] (%s %.2f)", status, self.metric, kpis.get(self.metric, 0)
             )
-            logger.info("Child stored (%s %.2f)", self.metric, kpis.get(self.metric, 0))
 
     # ------------------------------------------------------------------
     # public API
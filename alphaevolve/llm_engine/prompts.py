@@ -64,7 +64,10 @@ Task:
 def _format_metrics(metrics: dict[str, Any] | None) -> str:
     if not metrics:
         return "  (none yet – seed strategy)"
-    return "\n".join(f"  {k}: {v:.4g}" for k, v in metrics.items())
+    return "\n".join(
+        f"  {k}: {v:.4g}" if isinstance(v, (int, float)) else f"  {k}: {v}"
+        for k, v in metrics.items()
+    )
 
 
 def _format_hof(store: ProgramStore, k: int = 3, *, metric: str = example_config.HOF_METRIC) -> str:
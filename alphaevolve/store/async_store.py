@@ -0,0 +1,159 @@
+"""
+Awaitable facade over `ProgramStore` for the asyncio controller.
+
+A synchronous SQLite call inside a coroutine stalls every other coroutine on
+the loop, LLM requests included.  `AsyncProgramStore` keeps all of them off
+the loop:
+
+    get / top_k / count      – run in the default executor on a pooled
+                               reader connection (see `store.db`)
+    insert / update_metrics  – queued to one writer thread, which drains the
+    / sample                   queue and commits everything it found in a
+                               single transaction (one WAL append per batch)
+
+`sample` goes through the writer thread as well because it reads and
+reloads the store's in-memory id index, which inserts mutate.  The thread
+exits when idle and is restarted by the next write, so short-lived facades
+(one per prompt evaluation, say) do not accumulate threads.
+
+Share one facade per `ProgramStore`: two writer threads on the same store
+would race on its index.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
+
+from alphaevolve.store.sqlite import ProgramStore
+
+logger = logging.getLogger(__name__)
+
+# writes committed together at most; the rest wait for the next transaction
+MAX_BATCH = 64
+# seconds the writer thread waits for work before exiting
+IDLE_TIMEOUT = 1.0
+
+
+class AsyncProgramStore:
+    def __init__(self, store: ProgramStore, *, max_batch: int = MAX_BATCH):
+        self.store = store
+        self.max_batch = max_batch
+        self._queue: queue.SimpleQueue[tuple[Future, Callable, tuple, dict]] = (
+            queue.SimpleQueue()
+        )
+        self._lock = threading.Lock()  # guards _thread
+        self._thread: threading.Thread | None = None
+
+    # -------------------------------------------------------------- #
+    # reads
+    # -------------------------------------------------------------- #
+    async def get(self, prog_id: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self.store.get, prog_id)
+
+    async def top_k(self, k: int = 5, **kwargs) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.store.top_k, k, **kwargs)
+
+    async def count(self) -> int:
+        return await asyncio.to_thread(self.store._count)
+
+    async def sample(self, prog_id: Optional[str] = None, **kwargs) -> Optional[Dict[str, Any]]:
+        return await self._submit(self.store.sample, prog_id, **kwargs)
+
+    # -------------------------------------------------------------- #
+    # writes
+    # -------------------------------------------------------------- #
+    async def insert(self, code: str, metrics: Optional[Dict[str, Any]] = None, **kwargs) -> str:
+        return await self._submit(self.store.insert, code, metrics, **kwargs)
+
+    async def update_metrics(self, prog_id: str, metrics: Dict[str, Any]) -> None:
+        await self._submit(self.store.update_metrics, prog_id, metrics)
+
+    def close(self) -> None:
+        """Wait for queued writes to commit and stop the writer thread."""
+        with self._lock:
+            thread = self._thread
+            if thread is not None:
+                self._queue.put(None)
+        if thread is not None:
+            thread.join()
+
+    # -------------------------------------------------------------- #
+    # writer thread
+    # -------------------------------------------------------------- #
+    def _submit(self, fn: Callable, *args, **kwargs) -> asyncio.Future:
+        future: Future = Future()
+        with self._lock:
+            self._queue.put((future, fn, args, kwargs))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._writer, name="program-store-writer", daemon=True
+                )
+                self._thread.start()
+        return asyncio.wrap_future(future)
+
+    def _writer(self) -> None:
+        while True:
+            try:
+                job = self._queue.get(timeout=IDLE_TIMEOUT)
+            except queue.Empty:
+                with self._lock:
+                    if self._queue.empty():  # nothing slipped in meanwhile
+                        self._thread = None
+                        return
+                continue
+            batch = []
+            while job is not None:
+                batch.append(job)
+                if len(batch) >= self.max_batch:
+                    break
+                try:
+                    job = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._commit(batch)
+            if job is None:  # close()
+                with self._lock:
+                    self._thread = None
+                return
+
+    def _commit(self, batch: list[tuple[Future, Callable, tuple, dict]]) -> None:
+        """Run `batch` in one transaction; resolve the futures once it commits."""
+        started: list[Future] = []
+        outcomes: dict[Future, tuple[Any, Exception | None]] = {}
+        try:
+            with self.store.db.transaction() as conn:
+                for future, fn, args, kwargs in batch:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    started.append(future)
+                    outcomes[future] = self._run_job(conn, fn, args, kwargs)
+        except Exception as e:
+            logger.error("Program store batch of %d failed to commit: %s", len(batch), e)
+            self.store._load_index()  # the index saw rows that were rolled back
+            outcomes = {future: (None, e) for future in started}
+        for future in started:
+            result, error = outcomes[future]
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+    def _run_job(
+        self, conn, fn: Callable, args: tuple, kwargs: dict
+    ) -> tuple[Any, Exception | None]:
+        """Run one job under a savepoint so a failure undoes only that job."""
+        conn.execute("SAVEPOINT job")
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            conn.execute("ROLLBACK TO job")
+            conn.execute("RELEASE job")
+            self.store._load_index()  # drop whatever the job added to the index
+            return None, e
+        conn.execute("RELEASE job")
+        return result, None
@@ -0,0 +1,119 @@
+"""
+SQLite connections shared by the stores: one writer plus a pool of readers.
+
+File databases are switched to WAL journaling, so readers never block the
+writer (or each other) and a commit is one append to the log instead of a
+rollback-journal fsync.  With `synchronous=NORMAL` a power loss can drop
+the last few commits but never corrupts the file, which is the usual
+trade-off for WAL.
+
+    writer        – the only connection that writes; `transaction()` wraps
+                    statements in BEGIN IMMEDIATE … COMMIT under a lock, so
+                    threads sharing the store cannot interleave transactions
+    reader()      – borrows a read-only connection from the pool (created on
+                    demand, at most `readers`); reads see the last commit,
+                    except inside `transaction()` on the same thread, which
+                    reads its own uncommitted writes through the writer
+
+In-memory databases exist per connection, so there every call uses the
+writer.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+READERS = 4
+
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # KiB, i.e. 64 MiB of page cache
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _connect(path: str | os.PathLike, *, readonly: bool = False) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        path, check_same_thread=False, isolation_level=None, timeout=30.0  # autocommit
+    )
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    if readonly:
+        conn.execute("PRAGMA query_only=ON")
+    return conn
+
+
+class ConnectionPool:
+    def __init__(self, db_path: str | os.PathLike, *, readers: int = READERS):
+        self.memory = str(db_path) == ":memory:"
+        if not self.memory:
+            db_path = Path(db_path).expanduser()
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = db_path
+        self.writer = _connect(db_path)
+        if not self.memory:
+            self.writer.execute("PRAGMA journal_mode=WAL")
+        self.max_readers = 0 if self.memory else readers
+        self._readers: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        self._n_readers = 0
+        self._lock = threading.Lock()  # guards _n_readers
+        self._write_lock = threading.RLock()
+        self._depth = 0
+        self._owner: int | None = None  # thread inside transaction()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed writes as one transaction (nested calls join it)."""
+        with self._write_lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield self.writer
+                finally:
+                    self._depth -= 1
+                return
+            self.writer.execute("BEGIN IMMEDIATE")
+            self._depth = 1
+            self._owner = threading.get_ident()
+            try:
+                yield self.writer
+                self.writer.execute("COMMIT")
+            except BaseException:
+                # also after a failed COMMIT (e.g. SQLITE_BUSY), which leaves
+                # the transaction open and would block every later BEGIN
+                if self.writer.in_transaction:
+                    self.writer.execute("ROLLBACK")
+                raise
+            finally:
+                self._depth = 0
+                self._owner = None
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """A connection for reads; returned to the pool afterwards."""
+        if not self.max_readers or self._owner == threading.get_ident():
+            yield self.writer
+            return
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                spawn = self._n_readers < self.max_readers
+                self._n_readers += spawn
+            conn = _connect(self.path, readonly=True) if spawn else self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        self.writer.close()
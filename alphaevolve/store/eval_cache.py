@@ -0,0 +1,121 @@
+"""
+Content-addressed cache of back-test KPIs.
+
+Children that are byte-identical, or only differ in whitespace, comments or
+docstrings, normalise to the same AST and therefore the same key; the stored
+KPIs are returned instead of re-running the back-test.
+
+Schema
+------
+eval_cache(key TEXT PK,          -- sha256 of normalised code + eval context
+           kpis TEXT NOT NULL,    -- JSON string
+           created REAL,          -- Unix seconds
+           hits INTEGER)          -- times served from cache
+"""
+
+import ast, hashlib, json, os, sqlite3, threading, time
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+
+def _strip_docstrings(tree: ast.AST) -> ast.AST:
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            body = node.body
+            if (
+                body
+                and isinstance(body[0], ast.Expr)
+                and isinstance(body[0].value, ast.Constant)
+                and isinstance(body[0].value.value, str)
+            ):
+                node.body = body[1:] or [ast.Pass()]
+    return tree
+
+
+def normalize_code(code: str) -> str:
+    """Canonical form of `code`: its AST without comments, layout or docstrings."""
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return code.strip()
+    return ast.dump(_strip_docstrings(tree))
+
+
+def code_hash(code: str) -> str:
+    """Identity of a program: sha256 of its normalised source."""
+    return hashlib.sha256(normalize_code(code).encode()).hexdigest()
+
+
+def cache_key(
+    code: str,
+    *,
+    symbols: Sequence[str],
+    start: Optional[str],
+    end: Optional[str],
+    version: str,
+) -> str:
+    """Hash of the normalised code plus everything else that shapes the KPIs.
+
+    The universe is keyed as a set: the same symbols in another order match.
+    Without an `end` the data keeps growing, so such keys roll over daily
+    (like the loader's panel cache) and a refreshed lake is re-scored.
+    """
+    h = hashlib.sha256()
+    universe = ",".join(sorted(set(symbols)))
+    until = end or f"open:{date.today().isoformat()}"
+    for part in (normalize_code(code), universe, start or "", until, version):
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class EvalCache:
+    def __init__(self, db_path: str | os.PathLike):
+        db_path = Path(db_path).expanduser()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()  # callers use the cache from worker threads
+        self.conn = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None  # autocommit
+        )
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS eval_cache(
+                 key TEXT PRIMARY KEY,
+                 kpis TEXT NOT NULL,
+                 created REAL,
+                 hits INTEGER NOT NULL DEFAULT 0
+               )"""
+        )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT kpis FROM eval_cache WHERE key=?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.conn.execute("UPDATE eval_cache SET hits = hits + 1 WHERE key=?", (key,))
+        return json.loads(row[0])
+
+    def put(self, key: str, kpis: Dict[str, Any]) -> None:
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO eval_cache(key, kpis, created, hits) VALUES (?,?,?,0)",
+                (key, json.dumps(kpis), time.time()),
+            )
+
+    def stats(self) -> Dict[str, int]:
+        """Session hit/miss counters plus lifetime totals from the database."""
+        entries, served = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM eval_cache"
+        ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "lifetime_hits": served,
+        }
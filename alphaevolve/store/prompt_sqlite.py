@@ -1,11 +1,14 @@
-"""SQLite persistence for prompt genomes."""
+"""SQLite persistence for prompt genomes.
+
+Uses the same connections as `ProgramStore` (see `store.db`): one writer in
+explicit transactions plus pooled readers.
+"""
 
 from __future__ import annotations
 
 import json
 import os
 import random
-import sqlite3
 import time
 import uuid
 from pathlib import Path
@@ -13,6 +16,8 @@ from typing import Any
 
 from alphaevolve.config import settings
 from alphaevolve.evolution.prompt_ga import PromptGenome
+from alphaevolve.store.db import READERS, ConnectionPool
+from alphaevolve.store.sampling import IdIndex
 from examples import config as example_config
 
 
@@ -23,17 +28,17 @@ class PromptStore:
         *,
         population_size: int = settings.prompt_population_size,
         archive_size: int = settings.archive_size,
+        readers: int = READERS,
     ) -> None:
         db_path = (
             Path(db_path)
             if db_path is not None
             else Path(settings.sqlite_db).with_name("prompts.db")
         )
-        db_path = db_path.expanduser()
-        db_path.parent.mkdir(parents=True, exist_ok=True)
         self.population_size = population_size
         self.archive_size = archive_size
-        self.conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self.db = ConnectionPool(db_path, readers=readers)
+        self.conn = self.db.writer
         self.conn.execute(
             """CREATE TABLE IF NOT EXISTS prompts(
                  id TEXT PRIMARY KEY,
@@ -43,6 +48,7 @@ class PromptStore:
                  created REAL
                )"""
         )
+        self._load_index()
 
     # --------------------------------------------------------------
     # basic CRUD
@@ -54,55 +60,48 @@ class PromptStore:
         prompt_id: str | None = None,
     ) -> str:
         prompt_id = prompt_id or str(uuid.uuid4())
-        self.conn.execute(
-            (
-                "INSERT INTO prompts(id, system_msg, user_template, metrics, created)"
-                " VALUES (?,?,?,?,?)"
-            ),
-            (
-                prompt_id,
-                prompt.system_msg,
-                prompt.user_template,
-                json.dumps(metrics) if metrics is not None else None,
-                time.time(),
-            ),
-        )
+        with self.db.transaction() as conn:
+            conn.execute(
+                (
+                    "INSERT INTO prompts(id, system_msg, user_template, metrics, created)"
+                    " VALUES (?,?,?,?,?)"
+                ),
+                (
+                    prompt_id,
+                    prompt.system_msg,
+                    prompt.user_template,
+                    json.dumps(metrics) if metrics is not None else None,
+                    time.time(),
+                ),
+            )
+        self._ids.add(prompt_id)
         self._prune()
         return prompt_id
 
     def update_metrics(self, prompt_id: str, metrics: dict[str, Any]) -> None:
-        self.conn.execute(
-            "UPDATE prompts SET metrics=? WHERE id=?",
-            (json.dumps(metrics), prompt_id),
-        )
+        with self.db.transaction() as conn:
+            conn.execute(
+                "UPDATE prompts SET metrics=? WHERE id=?",
+                (json.dumps(metrics), prompt_id),
+            )
 
     def get(self, prompt_id: str) -> dict[str, Any] | None:
-        cur = self.conn.execute("SELECT * FROM prompts WHERE id=?", (prompt_id,))
-        row = cur.fetchone()
+        with self.db.reader() as conn:
+            row = conn.execute("SELECT * FROM prompts WHERE id=?", (prompt_id,)).fetchone()
         return self._row_to_dict(row) if row else None
 
     def sample_prompt(self) -> PromptGenome | None:
-        cur = self.conn.execute("SELECT * FROM prompts ORDER BY RANDOM() LIMIT 1")
-        row = cur.fetchone()
-        if not row:
-            return None
-        data = self._row_to_dict(row)
-        return PromptGenome(data["system_msg"], data["user_template"])
+        drawn = self._sample(1)
+        return drawn[0] if drawn else None
 
     def sample_pair(self) -> tuple[PromptGenome, PromptGenome] | None:
-        cur = self.conn.execute("SELECT * FROM prompts ORDER BY RANDOM() LIMIT 2")
-        rows = cur.fetchall()
-        if len(rows) < 2:
-            return None
-        data = [self._row_to_dict(r) for r in rows]
-        return (
-            PromptGenome(data[0]["system_msg"], data[0]["user_template"]),
-            PromptGenome(data[1]["system_msg"], data[1]["user_template"]),
-        )
+        drawn = self._sample(2)
+        return (drawn[0], drawn[1]) if drawn else None
 
     def top_k(self, k: int = 5, metric: str = example_config.HOF_METRIC) -> list[dict[str, Any]]:
-        cur = self.conn.execute("SELECT * FROM prompts WHERE metrics IS NOT NULL")
-        rows = [self._row_to_dict(r) for r in cur.fetchall()]
+        with self.db.reader() as conn:
+            cur = conn.execute("SELECT * FROM prompts WHERE metrics IS NOT NULL")
+            rows = [self._row_to_dict(r) for r in cur.fetchall()]
         rows.sort(key=lambda r: r["metrics"].get(metric, 0.0), reverse=True)
         return rows[:k]
 
@@ -126,27 +125,47 @@ class PromptStore:
             "created": created,
         }
 
+    def _sample(self, k: int) -> list[PromptGenome] | None:
+        """`k` distinct random prompts in O(k), via the in-memory id index."""
+        if self.conn.execute("PRAGMA data_version").fetchone()[0] != self._data_version:
+            self._load_index()  # another connection changed the table
+        for _ in range(2):
+            if len(self._ids) < k:
+                return None
+            rows = [self.get(pid) for pid in self._ids.sample(k)]
+            if all(rows):
+                return [PromptGenome(r["system_msg"], r["user_template"]) for r in rows]
+            self._load_index()  # deleted behind our back
+        return None
+
+    def _load_index(self) -> None:
+        self._ids = IdIndex(row[0] for row in self.conn.execute("SELECT id FROM prompts"))
+        self._data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+
     # --------------------------------------------------------------
     # pruning helpers
     # --------------------------------------------------------------
     def _count(self) -> int:
-        cur = self.conn.execute("SELECT COUNT(*) FROM prompts")
-        return cur.fetchone()[0]
+        with self.db.reader() as conn:
+            return conn.execute("SELECT COUNT(*) FROM prompts").fetchone()[0]
 
     def _prune(self) -> None:
         count = self._count()
         if count <= self.population_size:
             return
         elite_ids = {r["id"] for r in self.top_k(k=self.archive_size)}
-        if elite_ids:
-            placeholders = ",".join("?" * len(elite_ids))
-            cur = self.conn.execute(
-                f"SELECT id FROM prompts WHERE id NOT IN ({placeholders})",
-                tuple(elite_ids),
-            )
-        else:
-            cur = self.conn.execute("SELECT id FROM prompts")
-        candidates = [row[0] for row in cur.fetchall()]
-        excess = count - self.population_size
-        for pid in random.sample(candidates, min(excess, len(candidates))):
-            self.conn.execute("DELETE FROM prompts WHERE id=?", (pid,))
+        with self.db.transaction() as conn:
+            if elite_ids:
+                placeholders = ",".join("?" * len(elite_ids))
+                cur = conn.execute(
+                    f"SELECT id FROM prompts WHERE id NOT IN ({placeholders})",
+                    tuple(elite_ids),
+                )
+            else:
+                cur = conn.execute("SELECT id FROM prompts")
+            candidates = [row[0] for row in cur.fetchall()]
+            excess = count - self.population_size
+            doomed = random.sample(candidates, min(excess, len(candidates)))
+            conn.executemany("DELETE FROM prompts WHERE id=?", [(pid,) for pid in doomed])
+        for pid in doomed:
+            self._ids.discard(pid)
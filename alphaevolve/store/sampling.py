@@ -0,0 +1,113 @@
+"""
+Constant-time random draws for the SQLite stores.
+
+`ORDER BY RANDOM() LIMIT n` scores and sorts every candidate row on each
+draw.  The stores instead mirror the ids of selectable rows in an `IdIndex`
+(a list plus a position map, so add / discard / choice are all O(1)) and
+fetch the drawn row by primary key.
+
+Fitness-weighted draws use rejection sampling: pick uniformly, keep the id
+with probability `weight / bound`.  `bound` only has to be an upper bound on
+the weights, so it can be widened on insert and never needs shrinking on
+delete; the expected number of tries is `bound / mean weight`.
+"""
+
+import math
+import random
+from collections.abc import Callable, Hashable, Iterator
+from typing import Any
+
+# give up on rejection sampling after this many tries (then draw uniformly)
+MAX_TRIES = 64
+
+
+class IdIndex:
+    """Set of ids with O(1) add, discard and uniform random choice."""
+
+    __slots__ = ("_ids", "_pos")
+
+    def __init__(self, ids: Iterator[Hashable] = ()):
+        self._ids: list = []
+        self._pos: dict = {}
+        for i in ids:
+            self.add(i)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._pos
+
+    def __iter__(self) -> Iterator:
+        return iter(self._ids)
+
+    def add(self, item: Hashable) -> None:
+        if item not in self._pos:
+            self._pos[item] = len(self._ids)
+            self._ids.append(item)
+
+    def discard(self, item: Hashable) -> None:
+        i = self._pos.pop(item, None)
+        if i is None:
+            return
+        last = self._ids.pop()
+        if i < len(self._ids):  # move the last id into the hole
+            self._ids[i] = last
+            self._pos[last] = i
+
+    def clear(self) -> None:
+        self._ids.clear()
+        self._pos.clear()
+
+    def choice(self, rng: random.Random | Any = random) -> Any | None:
+        return self._ids[int(rng.random() * len(self._ids))] if self._ids else None
+
+    def sample(self, k: int, rng: random.Random | Any = random) -> list:
+        """`k` distinct ids (fewer if the index is smaller)."""
+        k = min(k, len(self._ids))
+        return [self._ids[i] for i in rng.sample(range(len(self._ids)), k)]
+
+    def weighted_choice(
+        self,
+        weight: Callable[[Any], float],
+        bound: float,
+        rng: random.Random | Any = random,
+    ) -> Any | None:
+        """Draw with probability proportional to `weight(id)` (0 ≤ weight ≤ bound)."""
+        if not self._ids or not bound > 0 or math.isinf(bound):
+            return self.choice(rng)
+        for _ in range(MAX_TRIES):
+            item = self.choice(rng)
+            if rng.random() * bound < weight(item):
+                return item
+        return self.choice(rng)
+
+
+class Bounds:
+    """Running [lo, hi] of finite values; widened on `update`, never shrunk."""
+
+    __slots__ = ("lo", "hi")
+
+    def __init__(self):
+        self.lo = math.inf
+        self.hi = -math.inf
+
+    def update(self, value: float | None) -> None:
+        if value is not None and math.isfinite(value):
+            self.lo = min(self.lo, value)
+            self.hi = max(self.hi, value)
+
+    def weight(self, value: float | None) -> float:
+        """Shifted fitness in [floor, span]; the worst program keeps a small chance."""
+        if self.lo > self.hi:
+            return 1.0
+        floor = 0.05 * (self.hi - self.lo) or 1.0
+        if value is None or not value > -math.inf:
+            return floor
+        return min(max(value, self.lo), self.hi) - self.lo + floor
+
+    @property
+    def bound(self) -> float:
+        if self.lo > self.hi:
+            return 1.0
+        return self.hi - self.lo + (0.05 * (self.hi - self.lo) or 1.0)
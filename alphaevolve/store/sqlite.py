@@ -8,17 +8,55 @@ programs(id TEXT PK,
          parent_id TEXT,
          metrics TEXT,           -- JSON string (nullable until eval completed)
          created REAL,           -- Unix seconds
-         island INTEGER)
+         island INTEGER,
+         status TEXT,            -- "ok", or why the program was rejected
+         sharpe REAL, calmar REAL, cagr REAL,
+         max_drawdown REAL, total_return REAL)
+
+Only "ok" programs take part in selection (`sample`, `top_k`); rejected ones
+(e.g. "screened" by the evaluation cascade) are kept with whatever partial
+metrics they reached.
+
+The KPIs in `METRIC_COLUMNS` are copied out of the JSON into indexed REAL
+columns (0.0 when the KPI is missing, as `top_k` always assumed), so ranking
+on them is an index scan that reads only the k winning rows.  Other metric
+names still work, ranked by `json_extract` over the JSON.
+
+Writes go through one connection in explicit transactions; reads borrow a
+connection from a small pool (see `store.db`), so on a WAL database the
+GUI or other controllers can read while evolution writes.
+
+`sample` draws from an in-memory mirror of the selectable ids (see
+`store.sampling`), so a draw costs the same at 100 or 100k programs.  The
+mirror is reloaded when another connection changes the database.
 """
 
-import os, sqlite3, uuid, json, time, random
-from pathlib import Path
-from typing import Optional, Dict, Any, List
+import os, uuid, json, math, time, random
+from typing import Optional, Dict, Any, List, Sequence
 
 from alphaevolve.config import settings
+from alphaevolve.store.db import READERS, ConnectionPool
+from alphaevolve.store.sampling import Bounds, IdIndex
 
 from examples import config as example_config
 
+COLUMNS = "id, code, parent_id, metrics, created, island, status"
+METRIC_COLUMNS = ("sharpe", "calmar", "cagr", "max_drawdown", "total_return")
+
+
+def _metric_values(metrics: Optional[Dict[str, Any]]) -> Sequence[Optional[float]]:
+    """Values for `METRIC_COLUMNS`; NULL only for unevaluated programs."""
+    if metrics is None:
+        return (None,) * len(METRIC_COLUMNS)
+    values = []
+    for name in METRIC_COLUMNS:
+        try:
+            value = float(metrics.get(name, 0.0))
+        except (TypeError, ValueError):
+            value = 0.0
+        values.append(-math.inf if math.isnan(value) else value)  # SQLite: NaN is NULL
+    return values
+
 
 class ProgramStore:
     def __init__(
@@ -28,25 +66,19 @@ class ProgramStore:
         population_size: int = settings.population_size,
         archive_size: int = settings.archive_size,
         num_islands: int = settings.num_islands,
+        prune_batch: int | None = None,
+        readers: int = READERS,
     ):
-        db_path = Path(db_path).expanduser()
-        db_path.parent.mkdir(parents=True, exist_ok=True)
         self.population_size = population_size
         self.archive_size = archive_size
         self.num_islands = num_islands
-        self.conn = sqlite3.connect(
-            db_path, check_same_thread=False, isolation_level=None  # autocommit
-        )
-        self.conn.execute(
-            """CREATE TABLE IF NOT EXISTS programs(
-                 id TEXT PRIMARY KEY,
-                 code TEXT NOT NULL,
-                 parent_id TEXT,
-                 metrics TEXT,
-                 created REAL,
-                 island INTEGER
-               )"""
-        )
+        # let the table overshoot by one batch, then prune it all at once
+        self.prune_batch = prune_batch or max(1, population_size // 10)
+        self.high_water = population_size + self.prune_batch
+        self.db = ConnectionPool(db_path, readers=readers)
+        self.conn = self.db.writer
+        self._create_schema()
+        self._load_index()
 
     # -------------------------------------------------------------- #
     # basic CRUD
@@ -59,32 +91,49 @@ class ProgramStore:
         prog_id: Optional[str] = None,
         *,
         island: Optional[int] = None,
+        status: str = "ok",
     ) -> str:
         prog_id = prog_id or str(uuid.uuid4())
         island = island if island is not None else random.randrange(self.num_islands)
-        self.conn.execute(
-            "INSERT INTO programs(id, code, parent_id, metrics, created, island) VALUES (?,?,?,?,?,?)",
-            (
-                prog_id,
-                code,
-                parent_id,
-                json.dumps(metrics) if metrics is not None else None,
-                time.time(),
-                island,
-            ),
-        )
-        self._prune()
+        with self.db.transaction() as conn:
+            conn.execute(
+                f"INSERT INTO programs({COLUMNS}, {', '.join(METRIC_COLUMNS)})"
+                f" VALUES ({','.join('?' * (7 + len(METRIC_COLUMNS)))})",
+                (
+                    prog_id,
+                    code,
+                    parent_id,
+                    json.dumps(metrics) if metrics is not None else None,
+                    time.time(),
+                    island,
+                    status,
+                    *_metric_values(metrics),
+                ),
+            )
+        if status == "ok":
+            self._track(prog_id, island, _metric_values(metrics))
+        self._n_rows += 1
+        if self._n_rows > self.high_water:
+            self._sync_index()  # recount if other writers changed the table
+            if self._n_rows > self.high_water:
+                self._prune()
         return prog_id
 
     def update_metrics(self, prog_id: str, metrics: Dict[str, Any]) -> None:
-        self.conn.execute(
-            "UPDATE programs SET metrics=? WHERE id=?",
-            (json.dumps(metrics), prog_id),
-        )
+        assignments = ", ".join(f"{m}=?" for m in METRIC_COLUMNS)
+        with self.db.transaction() as conn:
+            conn.execute(
+                f"UPDATE programs SET metrics=?, {assignments} WHERE id=?",
+                (json.dumps(metrics), *_metric_values(metrics), prog_id),
+            )
+        if prog_id in self._rows:
+            self._track(prog_id, self._rows[prog_id][0], _metric_values(metrics))
 
     def get(self, prog_id: str) -> Optional[Dict[str, Any]]:
-        cur = self.conn.execute("SELECT * FROM programs WHERE id=?", (prog_id,))
-        row = cur.fetchone()
+        with self.db.reader() as conn:
+            row = conn.execute(
+                f"SELECT {COLUMNS} FROM programs WHERE id=?", (prog_id,)
+            ).fetchone()
         return self._row_to_dict(row) if row else None
 
     def sample(
@@ -92,28 +141,57 @@ class ProgramStore:
         prog_id: Optional[str] = None,
         *,
         island: Optional[int] = None,
+        weighted_by: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
+        """Random "ok" program, optionally from one island.
+
+        With `weighted_by` (one of `METRIC_COLUMNS`) the draw is proportional
+        to that KPI, shifted so the worst program keeps a small chance.
+        """
         if prog_id:
             return self.get(prog_id)
-        if island is None:
-            cur = self.conn.execute(
-                "SELECT * FROM programs ORDER BY RANDOM() LIMIT 1"
-            )
-        else:
-            cur = self.conn.execute(
-                "SELECT * FROM programs WHERE island=? ORDER BY RANDOM() LIMIT 1",
-                (island,),
-            )
-        row = cur.fetchone()
-        return self._row_to_dict(row) if row else None
+        self._sync_index()
+        for _ in range(2):
+            index = self._by_island.get(island) if island is not None else self._ok
+            if not index:
+                return None
+            if weighted_by is None:
+                pick = index.choice()
+            else:
+                col = METRIC_COLUMNS.index(weighted_by)
+                bounds = self._bounds[weighted_by]
+                pick = index.weighted_choice(
+                    lambda i: bounds.weight(self._rows[i][1][col]), bounds.bound
+                )
+            row = self.get(pick)
+            if row is not None:
+                return row
+            self._load_index()  # deleted behind our back
+        return None
 
     def top_k(
         self, k: int = 5, metric: str = example_config.HOF_METRIC
     ) -> List[Dict[str, Any]]:
-        cur = self.conn.execute("SELECT * FROM programs WHERE metrics IS NOT NULL")
-        rows = [self._row_to_dict(r) for r in cur.fetchall()]
-        rows.sort(key=lambda r: r["metrics"].get(metric, 0.0), reverse=True)
-        return rows[:k]
+        if k <= 0:
+            return []
+        where, order, params = self._ranking(metric)
+        with self.db.reader() as conn:
+            rows = conn.execute(
+                f"SELECT {COLUMNS} FROM programs WHERE {where} ORDER BY {order} LIMIT ?",
+                (*params, k),
+            ).fetchall()
+        return [self._row_to_dict(r) for r in rows]
+
+    @staticmethod
+    def _ranking(metric: str) -> tuple[str, str, tuple]:
+        """WHERE / ORDER BY fragments (and their parameters) ranking on `metric`."""
+        if metric in METRIC_COLUMNS:
+            return f"status='ok' AND {metric} IS NOT NULL", f"{metric} DESC", ()
+        return (
+            "status='ok' AND metrics IS NOT NULL",
+            "COALESCE(json_extract(metrics, ?), 0.0) DESC",
+            (f'$."{metric}"',),
+        )
 
     # -------------------------------------------------------------- #
     # helpers
@@ -127,6 +205,7 @@ class ProgramStore:
             metrics_json,
             created,
             island,
+            status,
         ) = row
         return {
             "id": prog_id,
@@ -135,31 +214,123 @@ class ProgramStore:
             "metrics": json.loads(metrics_json) if metrics_json else None,
             "created": created,
             "island": island,
+            "status": status,
         }
 
+    def _create_schema(self) -> None:
+        with self.db.transaction() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS programs(
+                     id TEXT PRIMARY KEY,
+                     code TEXT NOT NULL,
+                     parent_id TEXT,
+                     metrics TEXT,
+                     created REAL,
+                     island INTEGER,
+                     status TEXT NOT NULL DEFAULT 'ok',
+                     sharpe REAL,
+                     calmar REAL,
+                     cagr REAL,
+                     max_drawdown REAL,
+                     total_return REAL
+                   )"""
+            )
+            cols = {row[1] for row in conn.execute("PRAGMA table_info(programs)")}
+            if "status" not in cols:  # databases created before the status column
+                conn.execute(
+                    "ALTER TABLE programs ADD COLUMN status TEXT NOT NULL DEFAULT 'ok'"
+                )
+            if not set(METRIC_COLUMNS) <= cols:  # ... or before the metric columns
+                self._add_metric_columns(cols)
+            for m in METRIC_COLUMNS:
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS programs_{m} ON programs(status, {m})"
+                )
+
+    def _add_metric_columns(self, existing: set[str]) -> None:
+        """Add and backfill `METRIC_COLUMNS` on a database created without them
+        (inside the schema transaction)."""
+        for m in METRIC_COLUMNS:
+            if m not in existing:
+                self.conn.execute(f"ALTER TABLE programs ADD COLUMN {m} REAL")
+        rows = self.conn.execute(
+            "SELECT id, metrics FROM programs WHERE metrics IS NOT NULL"
+        ).fetchall()
+        assignments = ", ".join(f"{m}=?" for m in METRIC_COLUMNS)
+        self.conn.executemany(
+            f"UPDATE programs SET {assignments} WHERE id=?",
+            [(*_metric_values(json.loads(m)), pid) for pid, m in rows],
+        )
+
+    # -------------------------------------------------------------- #
+    # sampling index
+    # -------------------------------------------------------------- #
+    def _load_index(self) -> None:
+        self._ok = IdIndex()
+        self._by_island: Dict[int, IdIndex] = {}
+        self._rows: Dict[str, tuple] = {}  # id -> (island, metric column values)
+        self._bounds = {m: Bounds() for m in METRIC_COLUMNS}
+        cur = self.conn.execute(
+            f"SELECT id, island, {', '.join(METRIC_COLUMNS)} FROM programs WHERE status='ok'"
+        )
+        for prog_id, island, *values in cur:
+            self._track(prog_id, island, values)
+        self._n_rows = self._count()
+        self._data_version = self._current_data_version()
+
+    def _current_data_version(self) -> int:
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _sync_index(self) -> None:
+        """Reload the index if another connection committed since we built it."""
+        if self._current_data_version() != self._data_version:
+            self._load_index()
+
+    def _track(self, prog_id: str, island: int, values: Sequence[Optional[float]]) -> None:
+        self._ok.add(prog_id)
+        self._by_island.setdefault(island, IdIndex()).add(prog_id)
+        self._rows[prog_id] = (island, tuple(values))
+        for m, value in zip(METRIC_COLUMNS, values):
+            self._bounds[m].update(value)
+
+    def _untrack(self, prog_id: str) -> None:
+        row = self._rows.pop(prog_id, None)
+        if row is not None:
+            self._ok.discard(prog_id)
+            self._by_island[row[0]].discard(prog_id)
+
     # -------------------------------------------------------------- #
     # pruning helpers
     # -------------------------------------------------------------- #
     def _count(self) -> int:
-        cur = self.conn.execute("SELECT COUNT(*) FROM programs")
-        return cur.fetchone()[0]
+        with self.db.reader() as conn:
+            return conn.execute("SELECT COUNT(*) FROM programs").fetchone()[0]
 
     def _prune(self) -> None:
-        """Ensure population does not exceed configured size."""
+        """Delete random non-elite programs down to `population_size`.
+
+        Rows that `sample` never picks (screened, rejected, timed-out, …) go
+        first, so they do not crowd out selectable programs.  One set-based
+        DELETE in one transaction; `insert` only calls this
+        once the table passes `high_water`, so the cost is spread over a
+        whole batch of inserts.
+        """
         count = self._count()
-        if count <= self.population_size:
-            return
-        # Keep archive of top performers
-        elite_ids = {r["id"] for r in self.top_k(k=self.archive_size)}
-        if elite_ids:
-            placeholders = ','.join('?' * len(elite_ids))
-            cur = self.conn.execute(
-                f"SELECT id FROM programs WHERE id NOT IN ({placeholders})",
-                tuple(elite_ids),
-            )
-        else:
-            cur = self.conn.execute("SELECT id FROM programs")
-        candidates = [row[0] for row in cur.fetchall()]
         excess = count - self.population_size
-        for prog_id in random.sample(candidates, min(excess, len(candidates))):
-            self.conn.execute("DELETE FROM programs WHERE id=?", (prog_id,))
+        if excess <= 0:
+            self._n_rows = count
+            return
+        where, order, params = self._ranking(example_config.HOF_METRIC)
+        with self.db.transaction() as conn:
+            deleted = conn.execute(
+                f"""DELETE FROM programs WHERE id IN (
+                      SELECT id FROM programs WHERE id NOT IN (
+                        SELECT id FROM programs WHERE {where} ORDER BY {order} LIMIT ?
+                      )
+                      ORDER BY status='ok', RANDOM() LIMIT ?
+                    ) RETURNING id""",
+                (*params, self.archive_size, excess),
+            ).fetchall()
+        for (prog_id,) in deleted:
+            self._untrack(prog_id)
+        self._n_rows = count - len(deleted)
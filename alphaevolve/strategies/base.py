@@ -3,28 +3,111 @@ Shared helpers / mixins for evolvable strategies.
 """
 
 import backtrader as bt
-from collections import deque
-from typing import Dict, Any
+import numpy as np
+
+# Backtrader stores bar times as float days since 0001-01-01 (day 1)
+_BT_UNIX_EPOCH = 719163.0
+_US_PER_DAY = 86_400_000_000
+
+
+class EquityRecorder:
+    """Preallocated (timestamp, value) columns for the per-bar equity curve.
+
+    Timestamps are int64 microseconds since the Unix epoch; both columns grow
+    geometrically if the feed turns out longer than the initial capacity.
+    """
+
+    __slots__ = ("_stamps", "_values", "size")
+
+    def __init__(self, capacity: int = 0):
+        capacity = max(int(capacity), 256)
+        self._stamps = np.empty(capacity, dtype=np.int64)
+        self._values = np.empty(capacity, dtype=np.float64)
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, bt_datetime: float, value: float) -> None:
+        i = self.size
+        if i == len(self._values):
+            self._stamps = np.resize(self._stamps, 2 * i)
+            self._values = np.resize(self._values, 2 * i)
+        self._stamps[i] = round((bt_datetime - _BT_UNIX_EPOCH) * _US_PER_DAY)
+        self._values[i] = value
+        self.size = i + 1
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values[: self.size]
+
+    @property
+    def dates(self) -> np.ndarray:
+        # float day numbers carry ~10us of noise; snap like bt.num2date does
+        us = self._stamps[: self.size]
+        frac = us % 1_000_000
+        snap = (frac < 10) | (frac > 999_990)
+        us = np.where(snap, (us + 500_000) // 1_000_000 * 1_000_000, us)
+        return us.astype("datetime64[us]").astype("datetime64[ns]")
 
 
 class BaseLoggingStrategy(bt.Strategy):
-    """Lightweight logger that stores equity curve for later KPIs."""
+    """Lightweight logger that stores equity curve for later KPIs.
 
-    params = (("log_equity", True),)
+    Optional abort rules stop the Cerebro run as soon as a candidate is
+    clearly doomed; the reason is left in `aborted` for the evaluator:
+
+    * ``abort_max_drawdown``  – fraction below the running equity peak (0.8)
+    * ``abort_equity_floor``  – fraction of the starting cash (0.2)
+    * ``abort_no_trade_bars`` – still flat with untouched cash after N bars
+    """
+
+    params = (
+        ("log_equity", True),
+        ("abort_max_drawdown", None),
+        ("abort_equity_floor", None),
+        ("abort_no_trade_bars", None),
+    )
 
     def __init__(self):
-        self._equity_log: deque[Dict[str, Any]] = deque()
+        self._equity_log = EquityRecorder(self.datas[0].buflen())
+        self._equity_peak = 0.0
+        self._bars_seen = 0
+        self.aborted: str | None = None
 
     def next(self):
+        value = self.broker.getvalue()
         if self.p.log_equity:
-            self._equity_log.append(
-                {
-                    "date": self.datas[0].datetime.date(0),
-                    "value": self.broker.getvalue(),
-                }
-            )
+            self._equity_log.append(self.datas[0].datetime[0], value)
+        self._check_abort(value)
+
+    def _check_abort(self, value: float) -> None:
+        if self.aborted:
+            return
+        self._bars_seen += 1
+        self._equity_peak = max(self._equity_peak, value)
+        p = self.p
+        if p.abort_max_drawdown is not None and value < self._equity_peak * (
+            1 - p.abort_max_drawdown
+        ):
+            self.aborted = "max_drawdown"
+        elif (
+            p.abort_equity_floor is not None
+            and value < self.broker.startingcash * p.abort_equity_floor
+        ):
+            self.aborted = "equity_floor"
+        elif (
+            p.abort_no_trade_bars is not None
+            and self._bars_seen == p.abort_no_trade_bars
+            and value == self.broker.startingcash
+            and not any(self.getposition(d).size for d in self.datas)
+        ):
+            self.aborted = "no_trades"
+        if self.aborted:
+            self.env.runstop()
 
     # helpers for evaluator
     @property
-    def equity_curve(self):
-        return list(self._equity_log)
+    def equity_curve(self) -> EquityRecorder:
+        """Recorded equity; use `.dates` / `.values` for the NumPy columns."""
+        return self._equity_log
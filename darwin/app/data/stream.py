@@ -0,0 +1,104 @@
+"""Constant-memory access to large 1-minute bar files.
+
+The raw Kaggle-style CSV (``Timestamp, Open, High, Low, Close, Volume`` with
+UNIX-second timestamps) is read in fixed-size chunks and converted once to a
+Parquet file next to it.  Later runs stream record batches straight from the
+Parquet row groups, so only one chunk of bars is ever in memory.
+
+Typical use with a Nautilus ``BacktestEngine`` (low-level streaming API)::
+
+    for frame in iter_bar_frames(csv_path, chunk_rows=500_000):
+        engine.add_data(wrangler.process(frame))
+        engine.run(streaming=True)
+        engine.clear_data()
+    engine.end()
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+BAR_COLUMNS = ["open", "high", "low", "close", "volume"]
+DEFAULT_CHUNK_ROWS = 500_000
+
+
+def _normalize(chunk: pd.DataFrame) -> pd.DataFrame:
+    chunk.columns = [c.strip().lower() for c in chunk.columns]
+    chunk["timestamp"] = pd.to_datetime(chunk["timestamp"], unit="s", utc=True)
+    chunk = chunk.dropna(subset=["open", "high", "low", "close"])
+    return chunk.set_index("timestamp")[BAR_COLUMNS].astype("float64")
+
+
+def iter_csv_chunks(
+    csv_path: Path, chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> Iterator[pd.DataFrame]:
+    """Yield ``BAR_COLUMNS`` frames indexed by UTC timestamp, ``chunk_rows`` at a time."""
+    with pd.read_csv(csv_path, chunksize=chunk_rows) as reader:
+        for chunk in reader:
+            yield _normalize(chunk)
+
+
+def parquet_path_for(csv_path: Path) -> Path:
+    return csv_path.with_suffix(".parquet")
+
+
+def csv_to_parquet(
+    csv_path: Path,
+    parquet_path: Path | None = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Path:
+    """Convert ``csv_path`` chunk by chunk; one Parquet row group per chunk."""
+    parquet_path = parquet_path or parquet_path_for(csv_path)
+    tmp_path = parquet_path.with_suffix(".parquet.tmp")
+    writer = None
+    try:
+        for frame in iter_csv_chunks(csv_path, chunk_rows):
+            table = pa.Table.from_pandas(frame, preserve_index=True)
+            if writer is None:
+                writer = pq.ParquetWriter(tmp_path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise ValueError(f"{csv_path} contains no bars")
+    tmp_path.replace(parquet_path)
+    return parquet_path
+
+
+def iter_bar_frames(
+    csv_path: Path,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    start: pd.Timestamp | None = None,
+    end: pd.Timestamp | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Stream bars in chunks, from the Parquet copy (created on first use).
+
+    ``start`` / ``end`` (UTC, inclusive) skip row groups outside the window.
+    """
+    csv_path = Path(csv_path)
+    parquet_path = parquet_path_for(csv_path)
+    if (
+        not parquet_path.exists()
+        or parquet_path.stat().st_mtime < csv_path.stat().st_mtime
+    ):
+        csv_to_parquet(csv_path, parquet_path, chunk_rows)
+
+    parquet = pq.ParquetFile(parquet_path)
+    ts_col = parquet.schema_arrow.get_field_index("timestamp")
+    for i in range(parquet.num_row_groups):
+        stats = parquet.metadata.row_group(i).column(ts_col).statistics
+        if stats is not None and stats.has_min_max:
+            lo, hi = pd.Timestamp(stats.min), pd.Timestamp(stats.max)
+            if (start is not None and hi < start) or (end is not None and lo > end):
+                continue
+        frame = parquet.read_row_group(i).to_pandas()
+        if start is not None:
+            frame = frame[frame.index >= start]
+        if end is not None:
+            frame = frame[frame.index <= end]
+        if len(frame):
+            yield frame
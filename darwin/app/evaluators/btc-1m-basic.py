@@ -1,10 +1,11 @@
 from pathlib import Path
 from decimal import Decimal
 
-import pandas as pd
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent / "strategies"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "data"))
 from basic import MyStrategy, MyStrategyConfig
+from stream import iter_bar_frames
 # from basic import MACDStrategy, MACDConfig
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.config import BacktestEngineConfig
@@ -51,42 +52,16 @@ if __name__ == "__main__":
     engine.add_instrument(BTCUSD_INSTRUMENT)
 
     # ==========================================================================================
-    # POINT OF FOCUS: Loading bars from CSV
+    # POINT OF FOCUS: Streaming bars from CSV / Parquet
     # ------------------------------------------------------------------------------------------
 
-    # Step 4a: Load bar data from CSV file -> into pandas DataFrame
-    csv_file_path = Path(__file__).parent.parent / "data" / "btcusd_1-min_data.csv"
-    # Note: Full CSV has 7.2M rows. Using 500k for reasonable performance.
-    # For full dataset, use High-Level API with ParquetDataCatalog (streams data in batches)
-    df = pd.read_csv(csv_file_path, nrows=900000)  # ~347 days of 1-min data
-    
-    # Step 4b: Restructure DataFrame into required structure, that can be passed `BarDataWrangler`
-    #   - 5 columns: 'open', 'high', 'low', 'close', 'volume' (volume is optional)
-    #   - 'timestamp' as index
-
-    # Normalize headers
-    df.columns = [c.strip().lower() for c in df.columns]
-    # Parse UNIX seconds -> UTC timestamps
-    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="s", utc=True)
-    
-    # HACK: Add fake volume since the data has zero volume (needed for execution)
-    df["volume"] = 1000.0  # Use 1.0 BTC volume per bar for testing
-    
-    # Set timestamp as index first, then reorder columns
-    df = df.set_index("timestamp")
-    df = df[["open", "high", "low", "close", "volume"]]
-
-    # Step 4c: Define type of loaded bars
+    # Step 4a: Define type of loaded bars
     BTCUSD_1MIN_BARTYPE = BarType.from_str(
         f"{BTCUSD_INSTRUMENT.id}-1-MINUTE-LAST-EXTERNAL",
     )
 
-    # Step 4d: `BarDataWrangler` converts each row into objects of type `Bar`
+    # Step 4b: `BarDataWrangler` converts each row into objects of type `Bar`
     wrangler = BarDataWrangler(BTCUSD_1MIN_BARTYPE, BTCUSD_INSTRUMENT)
-    btcusd_1min_bars_list: list[Bar] = wrangler.process(df)
-
-    # Step 4e: Add loaded data to the engine
-    engine.add_data(btcusd_1min_bars_list)
 
     # ------------------------------------------------------------------------------------------
     # END OF POINT OF FOCUS
@@ -113,8 +88,18 @@ if __name__ == "__main__":
     # )
 
     # strategy = MACDStrategy(config=strategy_config)
-    # Step 6: Run engine = Run backtest
-    engine.run()
+    # Step 6: Run engine = Run backtest, one chunk of bars at a time.
+    # The full 7.2M-row CSV is converted to Parquet on first use; afterwards
+    # only CHUNK_ROWS bars (plus their Bar objects) are ever held in memory.
+    csv_file_path = Path(__file__).parent.parent / "data" / "btcusd_1-min_data.csv"
+    CHUNK_ROWS = 500_000
+    for chunk in iter_bar_frames(csv_file_path, chunk_rows=CHUNK_ROWS):
+        # HACK: Add fake volume since the data has zero volume (needed for execution)
+        chunk["volume"] = 1000.0
+        engine.add_data(wrangler.process(chunk))
+        engine.run(streaming=True)
+        engine.clear_data()
+    engine.end()
 
     # Step 7: Release system resources
     engine.dispose()
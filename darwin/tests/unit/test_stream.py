@@ -0,0 +1,38 @@
+import importlib.util
+from pathlib import Path
+
+import pandas as pd
+
+spec = importlib.util.spec_from_file_location(
+    "stream", Path(__file__).resolve().parents[2] / "app/data/stream.py"
+)
+stream = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(stream)
+
+
+def _write_csv(path: Path, n: int) -> None:
+    start = 1325412060  # 2012-01-01 10:01 UTC
+    rows = [f"{start + 60 * i},{i},{i + 1},{i - 1},{i + 0.5},0.0" for i in range(n)]
+    path.write_text("Timestamp,Open,High,Low,Close,Volume\n" + "\n".join(rows) + "\n")
+
+
+def test_streams_fixed_size_chunks_via_parquet(tmp_path: Path) -> None:
+    csv = tmp_path / "bars.csv"
+    _write_csv(csv, 2_500)
+    frames = list(stream.iter_bar_frames(csv, chunk_rows=1_000))
+    assert [len(f) for f in frames] == [1_000, 1_000, 500]
+    assert stream.parquet_path_for(csv).exists()
+    first = frames[0]
+    assert list(first.columns) == stream.BAR_COLUMNS
+    assert first.index[0] == pd.Timestamp("2012-01-01 10:01", tz="UTC")
+    assert first["close"].iloc[-1] == 999.5
+
+
+def test_window_skips_row_groups(tmp_path: Path) -> None:
+    csv = tmp_path / "bars.csv"
+    _write_csv(csv, 2_500)
+    start = pd.Timestamp("2012-01-02 03:00", tz="UTC")  # bar 1_019
+    end = pd.Timestamp("2012-01-02 03:09", tz="UTC")
+    frames = list(stream.iter_bar_frames(csv, chunk_rows=1_000, start=start, end=end))
+    assert len(frames) == 1
+    assert frames[0]["open"].tolist() == list(range(1_019, 1_029))
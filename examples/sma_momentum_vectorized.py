@@ -0,0 +1,26 @@
+import pandas as pd
+
+
+class SMAMomentumVectorized:
+    """Signal-style twin of `sma_momentum.py` for the vectorised evaluator."""
+
+    params = dict(leverage=0.9, sma_period=210)
+
+    # === EVOLVE-BLOCK: decision_logic =================================
+    def target_weights(self, prices: pd.DataFrame) -> pd.DataFrame:
+        close = prices["close"]
+        sma = close.rolling(self.params["sma_period"]).mean()
+        longs = (close > sma) & sma.notna()
+
+        n_longs = longs.sum(axis=1)
+        weights = longs.div(n_longs.where(n_longs > 0), axis=0).fillna(0.0)
+        weights *= self.params["leverage"]
+
+        # rebalance on the first trading day of each month, hold otherwise
+        month = close.index.to_period("M")
+        first_of_month = month != month.shift(1)
+        return weights.where(pd.Series(first_of_month, index=close.index), axis=0)
+    # === END EVOLVE-BLOCK =============================================
+
+
+STRATEGY_CLASS = SMAMomentumVectorized
@@ -0,0 +1,81 @@
+"""Benchmark the loader's pivot + fill path against the old per-symbol one.
+
+Runs on a synthetic long-format dataset so no download is needed:
+
+    python scripts/bench_loader.py --symbols 500 --years 20
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from alphaevolve.evaluator.loader import FIELDS, pivot_ohlc, prepare_panel
+
+
+def synthetic_rows(n_symbols: int, years: int) -> pd.DataFrame:
+    dates = pd.bdate_range(end="2024-12-31", periods=252 * years)
+    rng = np.random.default_rng(0)
+    frames = []
+    for i in range(n_symbols):
+        # staggered listings and a few missing bars, like a real universe
+        listed = dates[rng.integers(0, len(dates) // 2) :]
+        listed = listed[rng.random(len(listed)) > 0.01]
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(listed))))
+        frames.append(
+            pd.DataFrame(
+                {"date": listed, "symbol": f"S{i:04d}", "open": close, "high": close,
+                 "low": close, "close": close, "volume": 1e6}
+            )
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+def legacy(df: pd.DataFrame) -> np.ndarray:
+    """The previous implementation: pivot_table, then one fill per symbol."""
+    pivot = pd.pivot_table(
+        df, index="date", columns="symbol", values=list(FIELDS), aggfunc="first"
+    ).sort_index()
+    pivot = pivot.reindex(pd.date_range(pivot.index.min(), pivot.index.max(), freq="D"))
+    trading_idx = pd.bdate_range(pivot.index.min(), pivot.index.max())
+    symbols = tuple(pivot.columns.levels[1])
+    values = np.empty((len(symbols), len(trading_idx), len(FIELDS)))
+    for i, symbol in enumerate(symbols):
+        sym_df = pivot.xs(symbol, axis=1, level=1, drop_level=False).copy().droplevel(1, axis=1)
+        sym_df = sym_df.ffill().bfill()
+        values[i] = sym_df.loc[trading_idx, list(FIELDS)].to_numpy(dtype=np.float64)
+    return values
+
+
+def vectorised(df: pd.DataFrame) -> np.ndarray:
+    return prepare_panel(pivot_ohlc(df, freq="D")).values
+
+
+def _time(fn, df, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        out = fn(df)
+        best = min(best, time.perf_counter() - t)
+    return best, out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = synthetic_rows(args.symbols, args.years)
+    print(f"{len(df):,} rows, {args.symbols} symbols, {args.years} years")
+    t_old, old = _time(legacy, df, args.repeat)
+    t_new, new = _time(vectorised, df, args.repeat)
+    assert np.array_equal(old, new, equal_nan=True), "outputs differ"
+    print(f"legacy     {t_old:8.3f}s")
+    print(f"vectorised {t_new:8.3f}s  ({t_old / t_new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -176,8 +176,8 @@ with col_chart:
         cerebro.broker.set_cash(100_000)
         strat_instance = cerebro.run(maxcpus=1)[0]
         curve = pd.Series(
-            [pt["value"] for pt in strat_instance.equity_curve],
-            index=[pt["date"] for pt in strat_instance.equity_curve],
+            strat_instance.equity_curve.values,
+            index=pd.DatetimeIndex(strat_instance.equity_curve.dates),
             name="equity",
         )
 
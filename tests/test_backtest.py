@@ -0,0 +1,301 @@
+import asyncio
+import importlib.util
+import inspect
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("backtrader")
+pytest.importorskip("pandas")
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _install(name: str, module: types.ModuleType, installed: list[tuple[str, object]]):
+    prev = sys.modules.get(name)
+    sys.modules[name] = module
+    installed.append((name, prev))
+
+
+def _cleanup(installed):
+    for name, prev in installed:
+        if prev is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = prev
+
+
+@pytest.fixture
+def backtest():
+    installed: list[tuple[str, object]] = []
+    before = set(sys.modules)
+    for name in ["pwb_toolbox", "pwb_toolbox.datasets"]:
+        sys.modules.setdefault(name, types.ModuleType(name))
+
+    config_mod = types.ModuleType("alphaevolve.config")
+    config_mod.settings = types.SimpleNamespace(
+        eval_backend="thread",
+        eval_workers=2,
+        eval_prewarm=False,
+        eval_cache_db=None,
+        eval_dataset="ETFs-Daily-Price",
+        eval_timeframe=None,
+    )
+    _install("alphaevolve.config", config_mod, installed)
+    for pkg in ["alphaevolve", "alphaevolve.evaluator", "alphaevolve.store"]:
+        mod = types.ModuleType(pkg)
+        mod.__path__ = [str(ROOT / pkg.replace(".", "/"))]
+        _install(pkg, mod, installed)
+
+    spec = importlib.util.spec_from_file_location(
+        "alphaevolve.evaluator.backtest", ROOT / "alphaevolve/evaluator/backtest.py"
+    )
+    mod = importlib.util.module_from_spec(spec)
+    _install(spec.name, mod, installed)
+    spec.loader.exec_module(mod)
+    yield mod
+    for name in set(sys.modules) - before:
+        if name.startswith("alphaevolve."):
+            sys.modules.pop(name)
+    _cleanup(installed)
+
+
+def _collect(agen):
+    async def run():
+        return [item async for item in agen]
+
+    return asyncio.run(run())
+
+
+def test_evaluate_many_dedupes_and_streams_errors(backtest, monkeypatch):
+    calls = []
+
+    def evaluate_sync(code, *, symbols, start, end):
+        calls.append(code)
+        if "boom" in code:
+            raise RuntimeError("boom")
+        return {"sharpe": float(len(code))}
+
+    monkeypatch.setattr(backtest, "evaluate_sync", evaluate_sync)
+    codes = ["x = 1\n", "x = 1  # same program\n", "y = 2\n", "boom = 3\n"]
+    results = dict(_collect(backtest.evaluate_many(codes)))
+
+    assert len(calls) == 3
+    assert set(results) == {backtest.code_hash(c) for c in codes}
+    assert results[backtest.code_hash("y = 2\n")] == {"sharpe": 6.0}
+    assert isinstance(results[backtest.code_hash("boom = 3\n")], RuntimeError)
+
+
+def test_evaluate_many_bounds_jobs_in_flight(backtest, monkeypatch):
+    running = peak = 0
+
+    async def evaluate(code, **kw):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {}
+
+    monkeypatch.setattr(backtest, "evaluate", evaluate)
+    codes = [f"x = {i}\n" for i in range(10)]
+    results = _collect(backtest.evaluate_many(codes, max_concurrency=3))
+
+    assert len(results) == 10
+    assert peak == 3
+
+
+STRATEGY = """
+import backtrader as bt
+
+class Strategy(bt.Strategy):
+    params = (("n", 3),)
+
+    def next(self):
+        raise RuntimeError("unreachable")
+"""
+
+
+def test_strategy_module_is_loaded_in_memory_and_unloaded(backtest, monkeypatch):
+    monkeypatch.setattr(backtest, "_CODE_CACHE", backtest._CODE_CACHE.__class__())
+    with backtest._strategy_module(STRATEGY) as mod:
+        assert sys.modules[mod.__name__] is mod
+        cls = backtest._find_strategy(mod)
+        assert cls.params.n == 3
+        assert "class Strategy" in inspect.getsource(cls)
+    assert mod.__name__ not in sys.modules
+
+    with backtest._strategy_module(STRATEGY) as again:
+        assert again.__name__ != mod.__name__
+    assert len(backtest._CODE_CACHE) == 1  # compiled once
+
+
+def test_failed_module_is_not_leaked(backtest):
+    before = set(sys.modules)
+    with pytest.raises(ZeroDivisionError):
+        backtest._load_module_from_code("x = 1 / 0\n")
+    assert set(sys.modules) == before
+
+
+def test_code_cache_is_bounded(backtest, monkeypatch):
+    monkeypatch.setattr(backtest, "CODE_CACHE_SIZE", 2)
+    monkeypatch.setattr(backtest, "_CODE_CACHE", backtest._CODE_CACHE.__class__())
+    for i in range(5):
+        backtest._compile(f"x = {i}\n")
+    assert len(backtest._CODE_CACHE) == 2
+
+
+def test_walk_forward_runs_folds_concurrently(backtest, monkeypatch):
+    import threading
+
+    pd = pytest.importorskip("pandas")
+    dates = pd.bdate_range("2020-01-01", periods=10)
+    loaded_on = []
+
+    def prepared_panel(symbols, start, end=None, timeframe=None):
+        loaded_on.append((threading.current_thread(), timeframe))
+        return types.SimpleNamespace(dates=dates)
+
+    monkeypatch.setattr(backtest, "_prepared_panel", prepared_panel)
+    monkeypatch.setattr(backtest.settings, "eval_timeframe", "1w")
+    running = peak = 0
+
+    async def evaluate(code, *, symbols, start, end):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        sharpe = 1.0 if start == "2020-01-01" else 3.0
+        return {"total_return": 0.1, "cagr": 0.1, "sharpe": sharpe,
+                "max_drawdown": -0.1, "calmar": 1.0, "n_days": 5}
+
+    monkeypatch.setattr(backtest, "evaluate", evaluate)
+    kpis = asyncio.run(backtest.evaluate_walk_forward("x = 1\n", folds=2))
+
+    assert peak == 2
+    assert loaded_on and threading.main_thread() not in [t for t, _ in loaded_on]  # off the loop
+    assert {tf for _, tf in loaded_on} == {"1w"}  # the calendar of the bars evaluated
+    assert [(f["start"], f["end"]) for f in kpis["folds"]] == [
+        ("2020-01-01", "2020-01-07"),
+        ("2020-01-08", "2020-01-14"),
+    ]
+    assert kpis["sharpe"] == 2.0 and kpis["sharpe_worst"] == 1.0
+    assert "aborted" not in kpis
+
+
+def test_walk_forward_rejects_too_many_folds(backtest, monkeypatch):
+    pd = pytest.importorskip("pandas")
+    dates = pd.bdate_range("2020-01-01", periods=3)
+    monkeypatch.setattr(
+        backtest, "_prepared_panel", lambda *a, **kw: types.SimpleNamespace(dates=dates)
+    )
+    with pytest.raises(ValueError):
+        backtest.walk_forward_windows(2)
+
+
+def _ohlc_frame():
+    np = pytest.importorskip("numpy")
+    pd = pytest.importorskip("pandas")
+    dates = pd.date_range("2021-01-01", "2021-03-31", freq="D")
+    cols = pd.MultiIndex.from_product([["open", "high", "low", "close", "volume"], ["A", "B"]])
+    values = np.arange(len(dates) * len(cols), dtype=float).reshape(len(dates), len(cols))
+    return pd.DataFrame(values + 1.0, index=dates, columns=cols)
+
+
+def test_worker_reuses_attached_panel_and_slices_match(backtest, monkeypatch):
+    np = pytest.importorskip("numpy")
+    loader = sys.modules["alphaevolve.evaluator.loader"]
+    shared = sys.modules["alphaevolve.evaluator.shared_panel"]
+    monkeypatch.setattr(backtest.example_config, "START_DATE", "2021-01-01")
+    monkeypatch.setattr(backtest, "_PANELS", backtest._PANELS.__class__())
+    df = _ohlc_frame()
+    desc = shared.publish(loader.prepare_panel(df))
+    try:
+        def load_ohlc(*args, **kwargs):
+            raise AssertionError("worker reloaded market data")
+
+        monkeypatch.setattr(backtest, "load_ohlc", load_ohlc)
+        backtest.warm_up(("A", "B"), "2021-01-01", desc)
+        full = backtest._prepared_panel(("A", "B"), "2021-01-01")
+        assert not full.values.flags.writeable  # the shared block, not a copy
+
+        window = backtest._prepared_panel(("A", "B"), "2021-02-01", "2021-02-15")
+        fresh = loader.prepare_panel(df.loc["2021-02-01":"2021-02-15"])
+        assert window.dates.equals(fresh.dates)
+        assert np.array_equal(window.values, fresh.values)
+        assert backtest._prepared_panel(("A", "B"), "2021-02-01", "2021-02-15") is window
+        del full, window
+    finally:
+        shared.release()
+
+
+def test_prepared_panels_are_bounded(backtest, monkeypatch):
+    loader = sys.modules["alphaevolve.evaluator.loader"]
+    panel = loader.prepare_panel(_ohlc_frame())
+    monkeypatch.setattr(backtest, "_PANELS", backtest._PANELS.__class__())
+    monkeypatch.setattr(backtest, "PANEL_CACHE_MAX_BYTES", 2 * panel.values.nbytes)
+    for i in range(4):
+        backtest._cache_panel((("A",), str(i), None, None), panel)
+    backtest._cached_panel((("A",), "2", None, None))  # recently used: kept
+    backtest._cache_panel((("A",), "4", None, None), panel)
+    assert [k[1] for k in backtest._PANELS] == ["2", "4"]
+
+
+def test_warm_up_keys_shared_panel_by_timeframe(backtest, monkeypatch):
+    loader = sys.modules["alphaevolve.evaluator.loader"]
+    shared = sys.modules["alphaevolve.evaluator.shared_panel"]
+    monkeypatch.setattr(backtest, "_PANELS", backtest._PANELS.__class__())
+    monkeypatch.setattr(backtest, "load_ohlc", None)  # any load would fail
+    desc = shared.publish(loader.prepare_panel(_ohlc_frame(), timeframe="1d"))
+    try:
+        backtest.warm_up(("A", "B"), "2021-01-01", desc, "1d")
+        panel = backtest._prepared_panel(("A", "B"), "2021-01-01", None, "1d")
+        assert panel.timeframe == "1d"
+        del panel
+    finally:
+        shared.release()
+
+
+def test_evaluate_rejects_intraday_timeframe_on_daily_data(backtest, monkeypatch):
+    monkeypatch.setattr(backtest.settings, "eval_timeframe", "1h")
+    with pytest.raises(ValueError, match="finer than the 1d bars"):
+        asyncio.run(backtest.evaluate("x = 1\n"))
+
+
+def test_broken_pool_blames_only_the_job_that_dies_alone(backtest, monkeypatch):
+    import signal
+    from functools import partial
+
+    pool, limits = backtest.pool, backtest.limits
+
+    class Broken:
+        def submit(self, *args, **kwargs):
+            raise backtest.BrokenProcessPool("a worker died")
+
+    broken = Broken()
+    discarded = []
+    monkeypatch.setattr(backtest, "_pool_executor", lambda: broken)
+    monkeypatch.setattr(pool, "discard", discarded.append)
+
+    def run_isolated(job, initializer, initargs):
+        outcome = job.args[0]
+        if outcome == "innocent":  # shared the pool with the culprit
+            return {"sharpe": 1.0}
+        raise pool.WorkerDied(outcome)
+
+    monkeypatch.setattr(pool, "run_isolated", run_isolated)
+
+    def run(outcome):
+        return asyncio.run(backtest._run_on_pool(partial(str, outcome)))
+
+    assert run("innocent") == {"sharpe": 1.0}
+    with pytest.raises(limits.EvaluationOOM):
+        run(limits.EXIT_CODES[limits.EvaluationOOM])
+    with pytest.raises(limits.EvaluationTimeout):
+        run(-signal.SIGXCPU)
+    with pytest.raises(limits.EvaluationCrashed):
+        run(-signal.SIGSEGV)
+    assert discarded == [broken] * 4
@@ -22,7 +22,16 @@ def _cleanup(installed):
             sys.modules[name] = prev
 
 
-def _setup_controller(tmp_path, diff_content, metrics, population_size=5):
+def _setup_controller(
+    tmp_path,
+    diff_content,
+    metrics,
+    population_size=5,
+    screen_metrics=None,
+    eval_status=None,
+    rejection=None,
+    **overrides,
+):
     installed = []
     os.environ.setdefault("OPENAI_API_KEY", "x")
 
@@ -56,7 +65,13 @@ def _setup_controller(tmp_path, diff_content, metrics, population_size=5):
         exploration_ratio=0.2,
         exploitation_ratio=0.7,
         llm_backend="openai",
+        cascade_enabled=False,
+        cascade_screen_years=5,
+        cascade_threshold=0.5,
+        eval_folds=1,
     )
+    for key, value in overrides.items():
+        setattr(config_mod.settings, key, value)
     _install("alphaevolve.config", config_mod, installed)
 
     # real modules loaded from source files
@@ -68,10 +83,13 @@ def _setup_controller(tmp_path, diff_content, metrics, population_size=5):
         _install(name, mod, installed)
         return mod
 
+    load_mod("alphaevolve.store.db", ROOT / "alphaevolve/store/db.py")
+    load_mod("alphaevolve.store.sampling", ROOT / "alphaevolve/store/sampling.py")
     store_mod = load_mod(
         "alphaevolve.store.sqlite",
         ROOT / "alphaevolve/store/sqlite.py",
     )
+    load_mod("alphaevolve.store.async_store", ROOT / "alphaevolve/store/async_store.py")
     patch_mod = load_mod(
         "alphaevolve.evolution.patching",
         ROOT / "alphaevolve/evolution/patching.py",
@@ -98,12 +116,32 @@ def _setup_controller(tmp_path, diff_content, metrics, population_size=5):
     base_metrics = {"sharpe": 0.0, "calmar": 0.0, "cagr": 0.0}
     base_metrics.update(metrics)
 
-    async def evaluate(code, *, symbols=None):
+    class EvaluationLimitExceeded(Exception):
+        status = eval_status
+
+    async def evaluate(code, *, symbols=None, start=None, end=None):
+        if eval_status is not None:
+            raise EvaluationLimitExceeded("limit hit")
+        if start is not None and screen_metrics is not None:
+            return {**base_metrics, **screen_metrics}
         return base_metrics
 
+    async def evaluate_walk_forward(code, *, folds, symbols=None, start=None, end=None):
+        worst = {f"{k}_worst": v for k, v in base_metrics.items() if not isinstance(v, str)}
+        return {**base_metrics, **worst, "n_folds": folds}
+
     evaluator_mod.evaluate = evaluate
+    evaluator_mod.evaluate_walk_forward = evaluate_walk_forward
     _install("alphaevolve.evaluator.backtest", evaluator_mod, installed)
 
+    limits_mod = types.ModuleType("alphaevolve.evaluator.limits")
+    limits_mod.EvaluationLimitExceeded = EvaluationLimitExceeded
+    _install("alphaevolve.evaluator.limits", limits_mod, installed)
+
+    preflight_mod = types.ModuleType("alphaevolve.evaluator.preflight")
+    preflight_mod.check = lambda code: rejection
+    _install("alphaevolve.evaluator.preflight", preflight_mod, installed)
+
     base_file = tmp_path / "base.py"
     base_file.write_text("class BaseLoggingStrategy:\n    def next(self):\n        pass\n")
     spec_base = importlib.util.spec_from_file_location("alphaevolve.strategies.base", base_file)
@@ -141,8 +179,13 @@ def _setup_controller(tmp_path, diff_content, metrics, population_size=5):
     alpha_pkg.evolution = evolution_pkg
     alpha_pkg.strategies = strat_pkg
     alpha_pkg.config = config_mod
-    alpha_pkg.evaluator = types.ModuleType("alphaevolve.evaluator")
-    alpha_pkg.evaluator.backtest = evaluator_mod
+    evaluator_pkg = types.ModuleType("alphaevolve.evaluator")
+    evaluator_pkg.__path__ = []
+    evaluator_pkg.backtest = evaluator_mod
+    evaluator_pkg.preflight = preflight_mod
+    evaluator_pkg.limits = limits_mod
+    _install("alphaevolve.evaluator", evaluator_pkg, installed)
+    alpha_pkg.evaluator = evaluator_pkg
     _install("alphaevolve", alpha_pkg, installed)
 
     ctrl_mod = load_mod(
@@ -208,6 +251,128 @@ def test_controller_respects_population_limit(tmp_path):
     try:
         for _ in range(4):
             asyncio.run(_run_spawn(ctrl))
-        assert store._count() <= 2
+        assert store._count() <= store.high_water == 3
+    finally:
+        _cleanup(installed)
+
+
+def test_controller_cascade_rejects_weak_screen(tmp_path):
+    diff = '{"code": "print(1)"}'
+    ctrl, store, installed = _setup_controller(
+        tmp_path,
+        diff,
+        {"sharpe": 3.0},
+        screen_metrics={"sharpe": 0.5},
+        cascade_enabled=True,
+    )
+    try:
+        store.insert("best", {"sharpe": 2.0, "calmar": 0.0, "cagr": 0.0}, island=0)
+        asyncio.run(_run_spawn(ctrl))
+        rows = store.conn.execute("SELECT status, metrics FROM programs").fetchall()
+        screened = [r for r in rows if r[0] == "screened"]
+        assert len(screened) == 1 and '"sharpe": 0.5' in screened[0][1]
+        # rejected children never reach the hall of fame
+        assert store.top_k(k=1)[0]["metrics"]["sharpe"] == 2.0
+    finally:
+        _cleanup(installed)
+
+
+def test_controller_cascade_promotes_strong_screen(tmp_path):
+    diff = '{"code": "print(1)"}'
+    ctrl, store, installed = _setup_controller(
+        tmp_path,
+        diff,
+        {"sharpe": 3.0},
+        screen_metrics={"sharpe": 1.5},
+        cascade_enabled=True,
+    )
+    try:
+        store.insert("best", {"sharpe": 2.0, "calmar": 0.0, "cagr": 0.0}, island=0)
+        asyncio.run(_run_spawn(ctrl))
+        assert store.top_k(k=1)[0]["metrics"]["sharpe"] == 3.0
+    finally:
+        _cleanup(installed)
+
+
+def test_controller_marks_aborted_children(tmp_path):
+    diff = '{"code": "print(1)"}'
+    ctrl, store, installed = _setup_controller(
+        tmp_path, diff, {"sharpe": -1.0, "aborted": "max_drawdown"}
+    )
+    try:
+        asyncio.run(_run_spawn(ctrl))
+        statuses = [r[0] for r in store.conn.execute("SELECT status FROM programs")]
+        assert sorted(statuses) == ["aborted", "ok"]
     finally:
         _cleanup(installed)
+
+
+def test_controller_records_limit_failures(tmp_path):
+    diff = '{"code": "while True: pass"}'
+    ctrl, store, installed = _setup_controller(
+        tmp_path, diff, {"sharpe": 1.0}, eval_status="timeout"
+    )
+    try:
+        asyncio.run(_run_spawn(ctrl))
+        rows = store.conn.execute("SELECT status, metrics FROM programs").fetchall()
+        assert sorted(r[0] for r in rows) == ["ok", "timeout"]
+        assert "limit hit" in [r[1] for r in rows if r[0] == "timeout"][0]
+    finally:
+        _cleanup(installed)
+
+
+def test_controller_rejects_children_before_evaluation(tmp_path):
+    diff = '{"code": "class Strategy: pass"}'
+    ctrl, store, installed = _setup_controller(
+        tmp_path,
+        diff,
+        {"sharpe": 1.0},
+        eval_status="timeout",  # would fail loudly if evaluate() were reached
+        rejection=types.SimpleNamespace(reason="empty_next", detail="no next()"),
+    )
+    try:
+        asyncio.run(_run_spawn(ctrl))
+        asyncio.run(_run_spawn(ctrl))
+        statuses = [r[0] for r in store.conn.execute("SELECT status FROM programs")]
+        assert sorted(statuses) == ["ok", "rejected", "rejected"]
+        assert ctrl.rejections == {"empty_next": 2}
+    finally:
+        _cleanup(installed)
+
+
+def test_controller_scores_with_walk_forward_folds(tmp_path):
+    diff = '{"code": "print(1)"}'
+    ctrl, store, installed = _setup_controller(tmp_path, diff, {"sharpe": 1.0}, eval_folds=4)
+    try:
+        asyncio.run(_run_spawn(ctrl))
+        assert store.top_k(k=1)[0]["metrics"]["n_folds"] == 4
+    finally:
+        _cleanup(installed)
+
+
+def test_controller_screens_fold_metrics_on_the_base_kpi(tmp_path):
+    diff = '{"code": "print(1)"}'
+    results = {}
+    for screen in (0.5, 1.5):
+        (tmp_path / str(screen)).mkdir()
+        ctrl, store, installed = _setup_controller(
+            tmp_path / str(screen),
+            diff,
+            {"sharpe": 3.0},
+            screen_metrics={"sharpe": screen},
+            cascade_enabled=True,
+            eval_folds=4,
+        )
+        try:
+            ctrl.metric = "sharpe_worst"  # a hall-of-fame metric the screen never reports
+            best = {"sharpe": 2.0, "sharpe_worst": 1.0, "calmar": 0.0, "cagr": 0.0}
+            store.insert("best", best, island=0)
+            asyncio.run(_run_spawn(ctrl))
+            statuses = [r[0] for r in store.conn.execute("SELECT status FROM programs")]
+            results[screen] = (statuses, store.top_k(k=1, metric="sharpe_worst")[0])
+        finally:
+            _cleanup(installed)
+    assert "screened" in results[0.5][0]
+    statuses, best = results[1.5]
+    assert "screened" not in statuses
+    assert best["metrics"]["sharpe_worst"] == 3.0 and best["metrics"]["n_folds"] == 4
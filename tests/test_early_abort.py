@@ -0,0 +1,73 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+bt = pytest.importorskip("backtrader")
+pd = pytest.importorskip("pandas")
+
+spec = importlib.util.spec_from_file_location(
+    "strategies_base", Path(__file__).resolve().parents[1] / "alphaevolve/strategies/base.py"
+)
+base = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(base)
+
+
+class AllIn(base.BaseLoggingStrategy):
+    def next(self):
+        super().next()
+        if not self.position:
+            self.order_target_percent(target=0.99)
+
+
+class Idle(base.BaseLoggingStrategy):
+    pass
+
+
+def _run(strategy, closes, **params):
+    idx = pd.bdate_range("2020-01-01", periods=len(closes))
+    df = pd.DataFrame({f: closes for f in ("open", "high", "low", "close")}, index=idx)
+    df["volume"] = 1.0
+    cerebro = bt.Cerebro()
+    cerebro.adddata(bt.feeds.PandasData(dataname=df))
+    cerebro.addstrategy(strategy, **params)
+    cerebro.broker.set_cash(1_000)
+    return cerebro.run(maxcpus=1)[0]
+
+
+def test_runs_to_the_end_without_rules():
+    strat = _run(AllIn, [100.0 - i for i in range(90)])
+    assert strat.aborted is None
+    assert len(strat.equity_curve) == 90
+
+
+def test_max_drawdown_stops_the_run():
+    strat = _run(AllIn, [100.0 - i for i in range(90)], abort_max_drawdown=0.2)
+    assert strat.aborted == "max_drawdown"
+    assert len(strat.equity_curve) < 30
+    assert strat.equity_curve.values[-1] < 800
+
+
+def test_equity_floor_and_no_trades():
+    strat = _run(AllIn, [100.0 - i for i in range(90)], abort_equity_floor=0.5)
+    assert strat.aborted == "equity_floor"
+    strat = _run(Idle, [100.0] * 90, abort_no_trade_bars=10)
+    assert strat.aborted == "no_trades"
+    assert len(strat.equity_curve) == 10
+
+
+def test_equity_recorder_grows_and_exposes_numpy_columns():
+    rec = base.EquityRecorder(capacity=1)
+    day = bt.date2num(pd.Timestamp("2020-01-02 16:00").to_pydatetime())
+    for i in range(300):
+        rec.append(day + i, 1_000.0 + i)
+    assert len(rec) == 300
+    assert rec.values.dtype == "float64" and rec.values[-1] == 1_299.0
+    assert pd.Timestamp(rec.dates[0]) == pd.Timestamp("2020-01-02 16:00")
+    assert pd.Timestamp(rec.dates[-1]) == pd.Timestamp("2020-10-27 16:00")
+
+
+def test_equity_curve_is_preallocated_from_feed_length():
+    strat = _run(Idle, [100.0] * 400)
+    assert len(strat.equity_curve) == 400
+    assert strat.equity_curve._values.size == 400
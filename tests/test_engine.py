@@ -33,9 +33,19 @@ def test_alphaevolve_multi_branch_creates_controllers():
     store_mod.ProgramStore = DummyStore
     _install("alphaevolve.store.sqlite", store_mod, installed)
 
+    async_mod = types.ModuleType("alphaevolve.store.async_store")
+
+    class DummyAsyncStore:
+        def __init__(self, store):
+            self.store = store
+
+    async_mod.AsyncProgramStore = DummyAsyncStore
+    _install("alphaevolve.store.async_store", async_mod, installed)
+
     store_pkg = types.ModuleType("alphaevolve.store")
     store_pkg.__path__ = []
     store_pkg.sqlite = store_mod
+    store_pkg.async_store = async_mod
     _install("alphaevolve.store", store_pkg, installed)
 
     # stub Controller
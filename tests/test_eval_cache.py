@@ -0,0 +1,72 @@
+import importlib.util
+from pathlib import Path
+
+spec = importlib.util.spec_from_file_location(
+    "eval_cache", Path(__file__).resolve().parents[1] / "alphaevolve/store/eval_cache.py"
+)
+eval_cache = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(eval_cache)
+
+CODE = '''
+class S:
+    """Buy and hold."""
+
+    def next(self):
+        x = 1  # position size
+        return x
+'''
+
+EQUIVALENT = '''
+# reformatted by the model
+class S:
+    def next(self):
+        x = 1
+        return x
+'''
+
+
+def _key(code, **kw):
+    ctx = dict(symbols=("SPY", "EFA"), start="1990-01-01", end=None, version="1")
+    ctx.update(kw)
+    return eval_cache.cache_key(code, **ctx)
+
+
+def test_key_ignores_comments_whitespace_and_docstrings():
+    assert _key(CODE) == _key(EQUIVALENT)
+    assert _key(CODE) != _key(CODE.replace("x = 1", "x = 2"))
+
+
+def test_key_depends_on_evaluation_context():
+    assert _key(CODE) != _key(CODE, symbols=("SPY",))
+    assert _key(CODE) == _key(CODE, symbols=("EFA", "SPY", "EFA"))  # a set of symbols
+    assert _key(CODE) != _key(CODE, start="2000-01-01")
+    assert _key(CODE) != _key(CODE, version="2")
+
+
+def test_open_ended_key_rolls_over_with_the_data(monkeypatch):
+    import datetime
+
+    class Tomorrow(datetime.date):
+        @classmethod
+        def today(cls):
+            return datetime.date.today() + datetime.timedelta(days=1)
+
+    closed, today = _key(CODE, end="2020-01-01"), _key(CODE)
+    assert _key(CODE) == today
+    monkeypatch.setattr(eval_cache, "date", Tomorrow)
+    assert _key(CODE) != today  # the lake refreshes daily
+    assert _key(CODE, end="2020-01-01") == closed
+
+
+def test_cache_roundtrip_and_stats(tmp_path):
+    cache = eval_cache.EvalCache(tmp_path / "cache.sqlite")
+    key = _key(CODE)
+    assert cache.get(key) is None
+    cache.put(key, {"sharpe": 1.5, "n_days": 10})
+    assert cache.get(_key(EQUIVALENT)) == {"sharpe": 1.5, "n_days": 10}
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    # persisted across instances
+    reopened = eval_cache.EvalCache(tmp_path / "cache.sqlite")
+    assert reopened.get(key)["sharpe"] == 1.5
+    assert reopened.stats()["lifetime_hits"] == 2
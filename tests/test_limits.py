@@ -0,0 +1,112 @@
+import importlib.util
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+spec = importlib.util.spec_from_file_location(
+    "eval_limits", ROOT / "alphaevolve/evaluator/limits.py"
+)
+limits = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(limits)
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="limits rely on POSIX signals and /proc"
+)
+
+
+def test_runaway_loop_raises_timeout():
+    started = time.monotonic()
+    with pytest.raises(limits.EvaluationTimeout) as info:
+        with limits.enforce(0.2, None):
+            while True:
+                pass
+    assert info.value.status == "timeout"
+    assert time.monotonic() - started < 5
+
+
+def test_memory_growth_raises_oom():
+    hog = []
+    with pytest.raises(limits.EvaluationOOM) as info:
+        with limits.enforce(None, 64 << 20):
+            while True:
+                hog.append(bytearray(1 << 20))
+    del hog
+    assert info.value.status == "oom"
+
+
+def test_except_exception_in_the_candidate_cannot_swallow_the_limit():
+    started = time.monotonic()
+    with pytest.raises(limits.EvaluationTimeout):
+        with limits.enforce(0.2, None):
+            for _ in range(60):
+                try:
+                    time.sleep(0.1)
+                except Exception:  # what LLM code wraps around `next()`
+                    pass
+    assert time.monotonic() - started < 3
+
+
+def test_swallowed_limit_ends_the_worker_after_the_grace_period():
+    import multiprocessing
+
+    def candidate():
+        with limits.enforce(0.2, None, grace=0.3):
+            while True:
+                try:
+                    time.sleep(10)
+                except BaseException:  # a bare `except:` still gets the watchdog
+                    pass
+
+    started = time.monotonic()
+    child = multiprocessing.get_context("fork").Process(target=candidate)
+    child.start()
+    child.join(10)
+    assert child.exitcode == limits.EXIT_CODES[limits.EvaluationTimeout]
+    assert time.monotonic() - started < 5
+
+
+def test_fast_job_is_unaffected_and_limits_restored():
+    import resource
+    import signal
+
+    before = signal.getsignal(signal.SIGUSR2)
+    cpu_before = resource.getrlimit(resource.RLIMIT_CPU)
+    with limits.enforce(5, 1 << 30):
+        assert resource.getrlimit(resource.RLIMIT_CPU)[0] != resource.RLIM_INFINITY
+        total = sum(range(1000))
+    assert total == 499500
+    assert signal.getsignal(signal.SIGUSR2) is before
+    assert resource.getrlimit(resource.RLIMIT_CPU) == cpu_before
+
+
+def test_limits_are_skipped_off_the_main_thread():
+    errors = []
+
+    def job():
+        try:
+            with limits.enforce(0.01, None):
+                time.sleep(0.1)
+        except Exception as e:  # pragma: no cover - would be a failure
+            errors.append(e)
+
+    t = threading.Thread(target=job)
+    t.start()
+    t.join()
+    assert errors == []
+
+
+def test_exit_codes_name_the_limit_or_a_crash():
+    import signal
+
+    for cls, code in limits.EXIT_CODES.items():
+        assert type(limits.from_exit_code(code)) is cls
+    assert type(limits.from_exit_code(-signal.SIGXCPU)) is limits.EvaluationTimeout
+    crash = limits.from_exit_code(-signal.SIGSEGV)
+    assert crash.status == "crashed" and "SIGSEGV" in str(crash)
+    assert limits.from_exit_code(-signal.SIGKILL).status == "crashed"
+    assert limits.from_exit_code(1).status == "crashed"
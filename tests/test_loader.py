@@ -0,0 +1,268 @@
+import importlib.util
+import os
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+pytest.importorskip("backtrader")
+pytest.importorskip("tqdm")
+
+ROOT = Path(__file__).resolve().parents[1]
+
+for _name in ["pwb_toolbox", "pwb_toolbox.datasets"]:
+    sys.modules.setdefault(_name, types.ModuleType(_name))
+
+spec = importlib.util.spec_from_file_location(
+    "alphaevolve.evaluator.loader", ROOT / "alphaevolve/evaluator/loader.py"
+)
+loader = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = loader
+spec.loader.exec_module(loader)
+load_ohlc = loader.load_ohlc
+
+
+@pytest.fixture
+def dataset(tmp_path, monkeypatch):
+    calls = []
+
+    def load_dataset(name, symbols, extend=True):
+        calls.append(tuple(symbols))
+        dates = pd.bdate_range("2021-01-01", "2021-02-26")
+        return pd.concat(
+            pd.DataFrame(
+                {"date": dates, "symbol": sym, "open": 1.0, "high": 2.0,
+                 "low": 0.5, "close": np.arange(len(dates)) + i, "volume": 1e3}
+            )
+            for i, sym in enumerate(symbols)
+        )
+
+    # no in-process memo, so every call exercises the disk cache
+    monkeypatch.setattr(loader, "panel_cache", loader.PanelCache(max_bytes=0))
+    monkeypatch.setattr(loader, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(loader, "LAKE_DIR", tmp_path / "lake")
+    monkeypatch.setattr(loader.pwb_ds, "load_dataset", load_dataset, raising=False)
+    return calls
+
+
+def test_second_load_is_served_from_disk(dataset):
+    first = load_ohlc(("A", "B"), start="2021-01-10")
+    again = load_ohlc(("A", "B"), start="2021-01-10")
+    assert dataset == [("A", "B")]
+    assert again.columns.equals(first.columns)
+    assert again.index.equals(first.index)
+    assert np.array_equal(again.to_numpy(), first.to_numpy(), equal_nan=True)
+
+
+def test_lake_serves_other_ranges_and_subsets(dataset, tmp_path):
+    load_ohlc(("A", "B"))
+    df = load_ohlc(("B",), start="2021-02-01", end="2021-02-10")
+    assert dataset == [("A", "B")]  # the second request only reads the lake
+    assert list(df.columns.levels[1]) == ["B"]
+    assert (df.index.min(), df.index.max()) == (
+        pd.Timestamp("2021-02-01"),
+        pd.Timestamp("2021-02-10"),
+    )
+    assert (tmp_path / "lake/ETFs-Daily-Price/symbol=A/year=2021").is_dir()
+
+    load_ohlc(("A", "C"))
+    assert dataset[-1] == ("C",)  # only the missing symbol is ingested
+
+
+def test_symbols_without_rows_are_not_fetched_again(dataset, tmp_path, monkeypatch):
+    fetch = loader.pwb_ds.load_dataset
+
+    def load_dataset(name, symbols, extend=True):
+        df = fetch(name, symbols, extend)
+        return df[df["symbol"] != "GONE"]
+
+    monkeypatch.setattr(loader.pwb_ds, "load_dataset", load_dataset)
+    df = load_ohlc(("A", "GONE"))
+    assert list(df.columns.levels[1]) == ["A"]
+    load_ohlc(("A", "GONE"), start="2021-02-01")
+    assert dataset == [("A", "GONE")]
+
+    # a refresh swaps the partition in and leaves nothing behind
+    monkeypatch.setattr(loader, "LAKE_MAX_AGE_DAYS", 0)
+    load_ohlc(("A",), end="2021-01-31")
+    assert sorted(p.name for p in (tmp_path / "lake/ETFs-Daily-Price").iterdir()) == [
+        "symbol=A",
+        "symbol=GONE",
+    ]
+
+
+def test_eviction_keeps_most_recent_files(dataset, tmp_path):
+    load_ohlc(("A",))
+    load_ohlc(("B",))
+    files = sorted(tmp_path.glob("*.feather"), key=os.path.getmtime)
+    assert len(files) == 2
+    os.utime(files[0], (0, 0))  # make it the least recently used
+    loader.evict_cache(max_bytes=files[1].stat().st_size)
+    assert [f.name for f in tmp_path.glob("*.feather")] == [files[1].name]
+
+
+def test_corrupt_cache_file_is_rebuilt(dataset, tmp_path):
+    load_ohlc(("A",))
+    (cached,) = tmp_path.glob("*.feather")
+    cached.write_bytes(b"garbage")
+    df = load_ohlc(("A",))
+    assert dataset == [("A",)] and not df.empty
+
+
+def test_pivot_matches_pivot_table():
+    rows = pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2021-01-05", "2021-01-04", "2021-01-04", "2021-01-04"]),
+            "symbol": ["B", "A", "B", "A"],
+            **{f: [1.0, 2.0, 3.0, 4.0] for f in loader.FIELDS},
+        }
+    )
+    expected = pd.pivot_table(
+        rows, index="date", columns="symbol", values=list(loader.FIELDS), aggfunc="first"
+    )
+    got = loader.pivot_ohlc(rows)
+    assert got.columns.equals(expected.columns) and got.index.equals(expected.index)
+    assert np.array_equal(got.to_numpy(), expected.to_numpy(), equal_nan=True)
+
+    daily = loader.pivot_ohlc(rows, freq="D")
+    assert len(daily) == 2 and daily.index.freq == "D"
+
+
+def test_prepare_panel_fills_each_symbol(monkeypatch):
+    monkeypatch.setattr(loader, "_FILL_BLOCK", 1)  # one symbol per pass
+    dates = pd.date_range("2021-01-01", "2021-01-12", freq="D")  # Fri → Tue
+    cols = pd.MultiIndex.from_product([sorted(loader.FIELDS), ["A", "B"]])
+    df = pd.DataFrame(np.nan, index=dates, columns=cols)
+    df[("close", "A")] = [np.nan, np.nan, np.nan, 4, np.nan, 6, 7, 8, 9, np.nan, np.nan, 12]
+    df[("close", "B")] = np.arange(12.0)
+    panel = loader.prepare_panel(df)
+    assert panel.dates[0] == pd.Timestamp("2021-01-01")
+    a = panel.frame("A")["close"].tolist()
+    assert a == [4, 4, 4, 6, 7, 8, 9, 12]  # back-filled head, forward-filled gaps
+    assert panel.frame("B")["close"].tolist() == [0, 3, 4, 5, 6, 7, 10, 11]
+
+
+def _frame(n):
+    cols = pd.MultiIndex.from_product([["close"], ["A"]])
+    return pd.DataFrame(np.ones((n, 1)), index=pd.date_range("2021-01-01", periods=n), columns=cols)
+
+
+def test_panel_cache_is_consistent_under_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    frame = _frame(64)
+    cache = loader.PanelCache(max_bytes=8 * loader.PanelCache._nbytes(frame))
+
+    def churn(worker):
+        for i in range(200):
+            key = (worker, i % 16)
+            if cache.get(key) is None:
+                cache.put(key, frame)
+
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(churn, range(4)))
+    stats = cache.stats()
+    assert stats["entries"] == 8
+    assert stats["bytes"] == 8 * loader.PanelCache._nbytes(frame)
+    assert stats["hits"] + stats["misses"] == 800
+
+
+def test_panel_cache_is_bounded_and_read_only():
+    one_mb = 1024**2 // 16  # rows of 8-byte value + 8-byte date
+    cache = loader.PanelCache(max_bytes=3 * 1024**2)
+    view = cache.put("a", _frame(one_mb))
+    cache.put("b", _frame(one_mb))
+    assert cache.get("a") is not None  # "a" is now most recently used
+    cache.put("c", _frame(2 * one_mb))
+    assert cache.get("b") is None and cache.get("a") is not None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 1)
+    assert stats["bytes"] == 3 * 1024**2 and stats["entries"] == 2
+
+    with pytest.raises(ValueError):
+        view.to_numpy()[0, 0] = 5.0
+    try:  # writes through pandas either raise or copy (copy-on-write)
+        view.iloc[0, 0] = 5.0
+    except ValueError:
+        pass
+    assert cache.get("a").iloc[0, 0] == 1.0
+
+
+def test_load_ohlc_memoises_in_memory(dataset, monkeypatch):
+    monkeypatch.setattr(loader, "panel_cache", loader.PanelCache(max_bytes=1024**2))
+    first = load_ohlc(["A"])
+    (cached,) = loader.CACHE_DIR.glob("*.feather")
+    cached.unlink()
+    again = load_ohlc(("A",))
+    assert dataset == [("A",)] and again.equals(first)
+    assert loader.panel_cache.stats()["hits"] == 1
+
+
+def _minute_frame():
+    idx = pd.date_range("2021-01-04 09:30", periods=180, freq="1min")
+    cols = pd.MultiIndex.from_product([sorted(loader.FIELDS), ["A", "B"]], names=[None, "symbol"])
+    df = pd.DataFrame(1.0, index=idx, columns=cols)
+    for sym, scale in (("A", 1.0), ("B", 10.0)):
+        px = (np.arange(180.0) + 100) * scale
+        df[("open", sym)], df[("close", sym)] = px, px + 0.5
+        df[("high", sym)], df[("low", sym)] = px + 1, px - 1
+    return df
+
+
+def test_resample_aggregates_ohlcv():
+    bars = loader.resample_ohlc(_minute_frame(), "5min")
+    assert len(bars) == 36
+    first = bars.xs("A", axis=1, level=1).iloc[0]
+    assert first.to_dict() == {"close": 104.5, "high": 105.0, "low": 99.0, "open": 100.0, "volume": 5.0}
+
+
+def test_pyramid_levels_compose():
+    levels = loader.build_pyramid(_minute_frame())
+    assert list(levels) == ["1m", "5m", "15m", "1h", "1d"]
+    direct = loader.resample_ohlc(_minute_frame(), "1h")
+    assert np.array_equal(levels["1h"].to_numpy(), direct.to_numpy())
+    daily = levels["1d"].xs("B", axis=1, level=1).iloc[0]
+    assert (daily["open"], daily["close"], daily["volume"]) == (1000.0, 2790.5, 180.0)
+
+
+def test_load_ohlc_timeframe_builds_and_caches_levels(dataset, tmp_path):
+    with pytest.raises(ValueError, match="finer than the 1d bars"):
+        load_ohlc(("A",), timeframe="1h")  # daily data has no hourly bars
+    assert dataset == [] and not list(tmp_path.glob("*.feather"))  # failed fast
+    daily = load_ohlc(("A",), timeframe="1d")
+    assert len(list(tmp_path.glob("*.feather"))) == 2  # base + the 1d level
+    assert daily["close"]["A"].dropna().tolist() == load_ohlc(("A",))["close"]["A"].dropna().tolist()
+    assert dataset == [("A",)]
+    with pytest.raises(ValueError):
+        load_ohlc(("A",), timeframe="2h")
+
+
+def _run_feed(feed_cls, **kw):
+    import backtrader as bt
+
+    cerebro = bt.Cerebro(**kw)
+    cerebro.adddata(feed_cls)
+    cerebro.addstrategy(bt.Strategy)
+    data = cerebro.run()[0].datas[0]
+    return {a: list(getattr(data.lines, a).array) for a in ("datetime", *loader.FIELDS)}
+
+
+@pytest.mark.parametrize("preload", [True, False])
+def test_array_feed_matches_pandas_feed(preload):
+    import backtrader as bt
+
+    dates = pd.DatetimeIndex(["2021-01-04", "2021-01-05 09:30", "2021-01-06 16:00:00.5"])
+    values = np.arange(15.0).reshape(3, 5)
+    frame = pd.DataFrame(values, index=dates, columns=list(loader.FIELDS))
+    expected = _run_feed(bt.feeds.PandasData(dataname=frame), preload=preload)
+    got = _run_feed(
+        loader.ArrayData(datenums=loader._bt_datenums(dates), values=values),
+        preload=preload,
+    )
+    for alias in loader.FIELDS:
+        assert got[alias] == expected[alias]
+    assert got["datetime"] == pytest.approx(expected["datetime"], abs=1e-9)
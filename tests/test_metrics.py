@@ -26,3 +26,31 @@ def test_cagr_simple_case():
     curve = pd.Series([1.0, 2.0])
     result = metrics.cagr(curve, periods_per_year=1)
     assert result == pytest.approx(np.sqrt(2) - 1)
+
+
+def test_summary_annualises_by_bar_size():
+    daily = pd.bdate_range("2021-01-04", periods=10)
+    hourly = pd.DatetimeIndex(
+        [d + pd.Timedelta(hours=h) for d in daily for h in range(9, 16)]
+    )
+    assert metrics.periods_per_year(daily) == 252
+    assert metrics.periods_per_year(hourly) == 252 * 7
+    curve = np.linspace(100, 101, len(hourly))
+    fast = metrics.summary(curve, periods_per_year=metrics.periods_per_year(hourly))
+    slow = metrics.summary(curve)
+    assert fast["sharpe"] == pytest.approx(slow["sharpe"] * np.sqrt(7))
+    assert fast["cagr"] > slow["cagr"]
+
+
+def test_fold_summary_mean_worst_and_dispersion():
+    folds = [
+        metrics.summary(np.array([100, 110, 121], dtype=float)),
+        metrics.summary(np.array([100, 90, 95], dtype=float)),
+    ]
+    out = metrics.fold_summary(folds)
+    assert out["total_return"] == pytest.approx((0.21 - 0.05) / 2)
+    assert out["total_return_worst"] == pytest.approx(-0.05)
+    assert out["total_return_std"] == pytest.approx(0.13)
+    assert out["max_drawdown_worst"] == pytest.approx(-0.1)
+    assert out["n_days"] == 6 and out["n_folds"] == 2
+    assert out["folds"] == folds
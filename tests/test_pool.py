@@ -0,0 +1,85 @@
+import importlib.util
+import os
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_pool(**overrides):
+    config_mod = types.ModuleType("alphaevolve.config")
+    values = dict(
+        eval_backend="process",
+        eval_workers=1,
+        eval_max_tasks_per_child=None,
+        eval_start_method="spawn",
+    )
+    values.update(overrides)
+    config_mod.settings = types.SimpleNamespace(**values)
+    prev = sys.modules.get("alphaevolve.config")
+    sys.modules["alphaevolve.config"] = config_mod
+    try:
+        spec = importlib.util.spec_from_file_location(
+            "eval_pool", ROOT / "alphaevolve/evaluator/pool.py"
+        )
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+    finally:
+        if prev is None:
+            sys.modules.pop("alphaevolve.config", None)
+        else:
+            sys.modules["alphaevolve.config"] = prev
+    return mod
+
+
+def test_thread_backend_uses_default_executor():
+    pool = _load_pool(eval_backend="thread")
+    assert pool.get_executor() is None
+
+
+def test_process_backend_runs_in_worker_process():
+    pool = _load_pool()
+    try:
+        executor = pool.get_executor()
+        assert executor is pool.get_executor()  # shared across callers
+        assert executor.submit(os.getpid).result(timeout=60) != os.getpid()
+    finally:
+        pool.shutdown()
+
+
+def test_invalid_start_method_rejected():
+    pool = _load_pool(eval_start_method="fork")
+    with pytest.raises(ValueError):
+        pool.get_executor()
+
+
+def test_discard_only_drops_the_broken_pool():
+    pool = _load_pool()
+    try:
+        broken = pool.get_executor()
+        pool.discard(broken)
+        fresh = pool.get_executor()
+        assert fresh is not broken
+        pool.discard(broken)  # stale reference: the fresh pool survives
+        assert pool.get_executor() is fresh
+    finally:
+        pool.shutdown()
+
+
+def test_run_isolated_reports_results_errors_and_exit_codes():
+    import signal
+
+    # fork, so the test-local callables need no pickling
+    pool = _load_pool(eval_start_method="fork")
+    assert pool.run_isolated(lambda: 2**10) == 1024
+    with pytest.raises(ZeroDivisionError):
+        pool.run_isolated(lambda: 1 / 0)
+    with pytest.raises(pool.WorkerDied) as info:
+        pool.run_isolated(lambda: os.kill(os.getpid(), signal.SIGKILL))
+    assert info.value.exitcode == -signal.SIGKILL
+    with pytest.raises(pool.WorkerDied) as info:
+        pool.run_isolated(lambda: os._exit(125))
+    assert info.value.exitcode == 125
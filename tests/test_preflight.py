@@ -0,0 +1,79 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+spec = importlib.util.spec_from_file_location(
+    "preflight", ROOT / "alphaevolve/evaluator/preflight.py"
+)
+preflight = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(preflight)
+
+BASE = (ROOT / "alphaevolve/strategies/base.py").read_text()
+
+
+def _reason(code):
+    rejection = preflight.check(code)
+    return rejection and rejection.reason
+
+
+@pytest.mark.parametrize(
+    "path", ["sma_momentum.py", "vol_adj_momentum.py", "sma_momentum_vectorized.py"]
+)
+def test_seed_strategies_pass(path):
+    code = (ROOT / "examples" / path).read_text()
+    assert preflight.check(code) is None
+    assert preflight.check(BASE + "\n\n" + code) is None  # as inlined by the controller
+
+
+@pytest.mark.parametrize(
+    "code, reason",
+    [
+        ("class Strategy(bt.Strategy)\n    pass\n", "syntax_error"),
+        ("import subprocess\n", "forbidden_import"),
+        ("from os.path import join\n", "forbidden_import"),
+        ("def next(self):\n    exec('x = 1')\n", "forbidden_call"),
+        ("x = 1\n", "no_strategy"),
+        (BASE, "no_strategy"),
+        ("class S(BaseLoggingStrategy):\n    def next(self):\n        super().next()\n",
+         "empty_next"),
+        ("class S(bt.Strategy):\n    def next(self):\n        '''todo'''\n        pass\n",
+         "empty_next"),
+        ("class S(bt.Strategy):\n    pass\n", "empty_next"),
+    ],
+)
+def test_rejections(code, reason):
+    assert _reason(code) == reason
+    assert reason in preflight.REASONS
+
+
+def test_inherited_and_unknown_bases_are_accepted():
+    inherited = (
+        "class Base(bt.Strategy):\n    def next(self):\n        self.buy()\n"
+        "class Child(Base):\n    pass\nSTRATEGY_CLASS = Child\n"
+    )
+    assert preflight.check(inherited) is None
+    assert preflight.check("from mylib import Momentum\nclass S(Momentum):\n    pass\n") is None
+
+
+SMA_CROSS_SIGNAL = """
+import backtrader as bt
+
+
+class SmaCross(bt.SignalStrategy):
+    def __init__(self):
+        sma1, sma2 = bt.ind.SMA(period=10), bt.ind.SMA(period=30)
+        crossover = bt.ind.CrossOver(sma1, sma2)
+        self.signal_add(bt.SIGNAL_LONG, crossover)
+"""
+
+
+def test_signal_strategies_are_not_empty():
+    assert preflight.check(SMA_CROSS_SIGNAL) is None
+    # signal_add on a plain Strategy subclass, via a local base
+    via_base = SMA_CROSS_SIGNAL.replace("bt.SignalStrategy", "Base") + (
+        "\nclass Base(bt.Strategy):\n    pass\n"
+    )
+    assert preflight.check(via_base) is None
@@ -47,6 +47,10 @@ def _setup(tmp_path, messages_holder):
         prompt_mutation_rate=1.0,
         prompt_iterations=1,
         llm_backend="openai",
+        cascade_enabled=False,
+        cascade_screen_years=5,
+        cascade_threshold=0.5,
+        eval_folds=1,
     )
     sys.modules["alphaevolve.config"] = config_mod
     installed.append(("alphaevolve.config", None))
@@ -68,6 +72,8 @@ def _setup(tmp_path, messages_holder):
         "alphaevolve.evolution.patching",
         ROOT / "alphaevolve/evolution/patching.py",
     )
+    load("alphaevolve.store.db", ROOT / "alphaevolve/store/db.py")
+    load("alphaevolve.store.sampling", ROOT / "alphaevolve/store/sampling.py")
     sqlite_mod = load(
         "alphaevolve.store.sqlite",
         ROOT / "alphaevolve/store/sqlite.py",
@@ -77,6 +83,7 @@ def _setup(tmp_path, messages_holder):
     store_pkg.sqlite = sqlite_mod
     sys.modules["alphaevolve.store"] = store_pkg
     installed.append(("alphaevolve.store", None))
+    load("alphaevolve.store.async_store", ROOT / "alphaevolve/store/async_store.py")
     ga_mod = load(
         "alphaevolve.evolution.prompt_ga",
         ROOT / "alphaevolve/evolution/prompt_ga.py",
@@ -93,12 +100,29 @@ def _setup(tmp_path, messages_holder):
     load("alphaevolve.store.sqlite", ROOT / "alphaevolve/store/sqlite.py")
     evaluator_mod = types.ModuleType("alphaevolve.evaluator.backtest")
 
-    async def evaluate(code, *, symbols=None):
+    async def evaluate(code, *, symbols=None, start=None, end=None):
         return {"sharpe": 0.0}
 
     evaluator_mod.evaluate = evaluate
+    evaluator_mod.evaluate_walk_forward = evaluate
     sys.modules["alphaevolve.evaluator.backtest"] = evaluator_mod
     installed.append(("alphaevolve.evaluator.backtest", None))
+    limits_mod = types.ModuleType("alphaevolve.evaluator.limits")
+    limits_mod.EvaluationLimitExceeded = type("EvaluationLimitExceeded", (Exception,), {})
+    sys.modules["alphaevolve.evaluator.limits"] = limits_mod
+    installed.append(("alphaevolve.evaluator.limits", None))
+    preflight_mod = types.ModuleType("alphaevolve.evaluator.preflight")
+    preflight_mod.check = lambda code: None
+    evaluator_mod.preflight = preflight_mod
+    sys.modules["alphaevolve.evaluator.preflight"] = preflight_mod
+    installed.append(("alphaevolve.evaluator.preflight", None))
+    evaluator_pkg = types.ModuleType("alphaevolve.evaluator")
+    evaluator_pkg.__path__ = []
+    evaluator_pkg.backtest = evaluator_mod
+    evaluator_pkg.preflight = preflight_mod
+    evaluator_pkg.limits = limits_mod
+    sys.modules["alphaevolve.evaluator"] = evaluator_pkg
+    installed.append(("alphaevolve.evaluator", None))
 
     base_file = tmp_path / "base.py"
     base_file.write_text("class BaseLoggingStrategy:\n    def next(self):\n        pass\n")
@@ -142,7 +166,7 @@ def _setup(tmp_path, messages_holder):
     alpha_pkg.store = store_pkg
     alpha_pkg.evolution = evolution_pkg
     alpha_pkg.config = config_mod
-    alpha_pkg.evaluator = evaluator_mod
+    alpha_pkg.evaluator = evaluator_pkg
     sys.modules["alphaevolve"] = alpha_pkg
     installed.append(("alphaevolve", None))
 
@@ -213,6 +237,24 @@ def test_prompt_store_insert_get(tmp_path):
         _cleanup(installed)
 
 
+def test_prompt_store_sampling(tmp_path):
+    messages = []
+    PromptGenome, _, PromptStore, _, installed = _setup(tmp_path, messages)
+    try:
+        store = PromptStore(tmp_path / "p.sqlite", population_size=2, archive_size=0)
+        assert store.sample_prompt() is None
+        store.insert(PromptGenome("a", "b"))
+        assert store.sample_prompt() == PromptGenome("a", "b")
+        assert store.sample_pair() is None
+        for name in "cde":  # population_size=2 prunes down to two prompts
+            store.insert(PromptGenome(name, name))
+        pair = store.sample_pair()
+        assert pair[0] != pair[1]
+        assert store._count() == len(store._ids) == 2
+    finally:
+        _cleanup(installed)
+
+
 def test_mutate_changes_prompt(tmp_path):
     messages = []
     (
@@ -0,0 +1,57 @@
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("backtrader")
+pytest.importorskip("tqdm")
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+# loader imports pwb_toolbox at module level; the data source is not needed here
+for _name in ["pwb_toolbox", "pwb_toolbox.datasets"]:
+    sys.modules.setdefault(_name, types.ModuleType(_name))
+
+
+def _load(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+loader = _load("alphaevolve.evaluator.loader", ROOT / "alphaevolve/evaluator/loader.py")
+shared = _load(
+    "alphaevolve.evaluator.shared_panel", ROOT / "alphaevolve/evaluator/shared_panel.py"
+)
+
+
+def _ohlc_frame():
+    dates = pd.date_range("2021-01-01", "2021-01-20", freq="D")
+    cols = pd.MultiIndex.from_product([["open", "high", "low", "close", "volume"], ["A", "B"]])
+    values = np.arange(len(dates) * len(cols), dtype=float).reshape(len(dates), len(cols))
+    values[3, 0] = np.nan
+    return pd.DataFrame(values, index=dates, columns=cols)
+
+
+def test_publish_attach_roundtrip():
+    panel = loader.prepare_panel(_ohlc_frame())
+    desc = shared.publish(panel)
+    try:
+        attached = shared.attach(desc)
+        assert attached.symbols == panel.symbols
+        assert attached.dates.equals(panel.dates)
+        assert np.array_equal(attached.values, panel.values)
+        assert attached.frame("B").to_numpy().tolist() == panel.frame("B").to_numpy().tolist()
+        # workers get a read-only view of the shared block
+        assert not attached.values.flags.writeable
+        assert not attached.values.flags.owndata
+        del attached
+    finally:
+        shared.release()
@@ -20,12 +20,29 @@ config_mod.settings = DummySettings()
 sys.modules.setdefault("alphaevolve", dummy_pkg)
 sys.modules["alphaevolve.config"] = config_mod
 
+for _name in ("db", "sampling"):
+    _spec = importlib.util.spec_from_file_location(
+        f"alphaevolve.store.{_name}", ROOT / f"alphaevolve/store/{_name}.py"
+    )
+    _mod = importlib.util.module_from_spec(_spec)
+    sys.modules[_spec.name] = _mod
+    _spec.loader.exec_module(_mod)
+sampling = sys.modules["alphaevolve.store.sampling"]
+db_mod = sys.modules["alphaevolve.store.db"]
+
 spec = importlib.util.spec_from_file_location(
     "sqlite_store", ROOT / "alphaevolve/store/sqlite.py"
 )
 store_mod = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(store_mod)
 ProgramStore = store_mod.ProgramStore
+sys.modules["alphaevolve.store.sqlite"] = store_mod
+
+async_spec = importlib.util.spec_from_file_location(
+    "async_store", ROOT / "alphaevolve/store/async_store.py"
+)
+async_store = importlib.util.module_from_spec(async_spec)
+async_spec.loader.exec_module(async_store)
 
 
 def test_program_store_insert_and_get(tmp_path):
@@ -44,6 +61,240 @@ def test_program_store_prune_population_size(tmp_path):
     db_file = tmp_path / "db.sqlite"
     store = ProgramStore(db_file, population_size=2, archive_size=0, num_islands=1)
     ids = [store.insert(f"code {i}") for i in range(3)]
+    assert store._count() == 3 == store.high_water  # one batch of slack
+    ids.append(store.insert("code 3"))
     assert store._count() == 2
     existing = {pid for pid in ids if store.get(pid) is not None}
     assert len(existing) == 2
+    assert len(store._ok) == 2
+
+
+def test_prune_batches_and_keeps_elites(tmp_path):
+    store = ProgramStore(
+        tmp_path / "db.sqlite", population_size=10, archive_size=3, num_islands=1, prune_batch=5
+    )
+    elites = [store.insert(f"elite {i}", metrics={"calmar": 100.0 + i}) for i in range(3)]
+    for i in range(12):
+        store.insert(f"code {i}", metrics={"calmar": float(i)})
+    assert store._count() == 15  # at the high-water mark, not pruned yet
+    store.insert("one more", metrics={"calmar": 0.0})
+    assert store._count() == 10
+    assert all(store.get(pid) is not None for pid in elites)
+
+
+def test_prune_evicts_unselectable_rows_first(tmp_path):
+    store = ProgramStore(
+        tmp_path / "db.sqlite", population_size=5, archive_size=0, num_islands=1, prune_batch=5
+    )
+    ok = [store.insert(f"ok {i}", metrics={"calmar": 1.0}) for i in range(3)]
+    for i in range(8):
+        store.insert(f"bad {i}", metrics={"reason": "empty_next"}, status="rejected")
+    assert store._count() == 5
+    assert all(store.get(pid) is not None for pid in ok)
+    statuses = [r[0] for r in store.conn.execute("SELECT status FROM programs")]
+    assert sorted(statuses) == ["ok"] * 3 + ["rejected"] * 2
+
+
+def test_top_k_uses_metric_columns_and_json_fallback(tmp_path):
+    store = ProgramStore(tmp_path / "db.sqlite", population_size=10, archive_size=0, num_islands=1)
+    a = store.insert("a", metrics={"sharpe": 1.0, "calmar_worst": 0.2}, island=0)
+    b = store.insert("b", metrics={"sharpe": 3.0, "calmar_worst": 0.1}, island=0)
+    c = store.insert("c", metrics={"calmar": 5.0}, island=0)  # no sharpe: ranks as 0.0
+    store.insert("d", metrics={"sharpe": 9.0}, island=0, status="screened")
+    store.insert("e", island=0)  # not evaluated yet
+
+    assert [r["id"] for r in store.top_k(k=5, metric="sharpe")] == [b, a, c]
+    assert [r["id"] for r in store.top_k(k=1, metric="calmar_worst")] == [a]
+    plan = " ".join(
+        str(r) for r in store.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM programs WHERE status='ok'"
+            " AND sharpe IS NOT NULL ORDER BY sharpe DESC LIMIT 1"
+        )
+    )
+    assert "programs_sharpe" in plan and "TEMP B-TREE" not in plan
+
+    store.update_metrics(a, {"sharpe": 4.0})
+    assert store.top_k(k=1, metric="sharpe")[0]["id"] == a
+
+
+def test_metric_columns_backfilled_for_old_databases(tmp_path):
+    import json
+    import sqlite3
+
+    db_file = tmp_path / "old.sqlite"
+    conn = sqlite3.connect(db_file)
+    conn.execute(
+        "CREATE TABLE programs(id TEXT PRIMARY KEY, code TEXT NOT NULL, parent_id TEXT,"
+        " metrics TEXT, created REAL, island INTEGER)"
+    )
+    conn.execute("INSERT INTO programs VALUES ('x', 'c', NULL, ?, 0, 0)",
+                 (json.dumps({"calmar": 2.0}),))
+    conn.execute("INSERT INTO programs VALUES ('y', 'c', NULL, ?, 0, 0)",
+                 (json.dumps({"calmar": 3.0}),))
+    conn.commit()
+    conn.close()
+
+    store = ProgramStore(db_file, population_size=10, archive_size=0, num_islands=1)
+    assert [r["id"] for r in store.top_k(k=2, metric="calmar")] == ["y", "x"]
+
+
+def test_id_index_swap_remove():
+    index = sampling.IdIndex(["a", "b", "c"])
+    index.discard("a")
+    index.discard("missing")
+    index.add("d")
+    assert sorted(index) == ["b", "c", "d"] and "a" not in index
+    assert index.choice() in {"b", "c", "d"}
+    assert sorted(index.sample(5)) == ["b", "c", "d"]
+
+
+def test_sample_respects_island_status_and_weights(tmp_path):
+    import random
+
+    random.seed(0)
+    store = ProgramStore(tmp_path / "db.sqlite", population_size=100, archive_size=0, num_islands=2)
+    low = store.insert("low", metrics={"sharpe": 0.0}, island=0)
+    high = store.insert("high", metrics={"sharpe": 10.0}, island=0)
+    other = store.insert("other", metrics={"sharpe": 5.0}, island=1)
+    store.insert("rejected", metrics={"sharpe": 99.0}, island=1, status="screened")
+
+    assert {store.sample(island=1)["id"] for _ in range(20)} == {other}
+    assert {store.sample()["id"] for _ in range(100)} == {low, high, other}
+    draws = [store.sample(island=0, weighted_by="sharpe")["id"] for _ in range(400)]
+    assert draws.count(high) > 5 * draws.count(low) > 0
+    assert store.sample(island=7) is None
+
+
+def test_sample_sees_changes_from_other_connections(tmp_path):
+    import sqlite3
+
+    db_file = tmp_path / "db.sqlite"
+    store = ProgramStore(db_file, population_size=100, archive_size=0, num_islands=1)
+    gone = store.insert("gone", metrics={"sharpe": 1.0}, island=0)
+    other = sqlite3.connect(db_file)
+    other.execute("DELETE FROM programs WHERE id=?", (gone,))
+    other.execute(
+        "INSERT INTO programs(id, code, island, status, sharpe) VALUES ('new', 'c', 0, 'ok', 1)"
+    )
+    other.commit()
+    assert store.sample()["id"] == "new"
+
+
+def test_wal_readers_do_not_block_on_writes(tmp_path):
+    store = ProgramStore(tmp_path / "db.sqlite", population_size=100, archive_size=0, num_islands=1)
+    assert store.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    kept = store.insert("kept", metrics={"sharpe": 1.0}, island=0)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(1) as other, store.db.transaction() as conn:
+        conn.execute("UPDATE programs SET code='dirty' WHERE id=?", (kept,))
+        # another thread gets a pooled reader and sees the last commit ...
+        assert other.submit(store.get, kept).result()["code"] == "kept"
+        # ... while the writing thread reads its own changes
+        assert store.get(kept)["code"] == "dirty"
+    assert store.get(kept)["code"] == "dirty"
+
+
+def test_failed_commit_rolls_back(tmp_path):
+    import sqlite3
+
+    import pytest
+
+    class BusyOnce:
+        """Writer whose first COMMIT fails like a busy database."""
+
+        def __init__(self, conn):
+            self.conn, self.busy = conn, True
+
+        def execute(self, sql, *args):
+            if sql == "COMMIT" and self.busy:
+                self.busy = False
+                raise sqlite3.OperationalError("database is locked")
+            return self.conn.execute(sql, *args)
+
+        def __getattr__(self, name):
+            return getattr(self.conn, name)
+
+    pool = db_mod.ConnectionPool(tmp_path / "db.sqlite", readers=1)
+    pool.writer.execute("CREATE TABLE t(x)")
+    pool.writer = BusyOnce(pool.writer)
+    with pytest.raises(sqlite3.OperationalError):
+        with pool.transaction() as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+    assert not pool.writer.in_transaction
+    with pool.transaction() as conn:  # the next transaction starts cleanly
+        conn.execute("INSERT INTO t VALUES (2)")
+    with pool.reader() as conn:
+        assert conn.execute("SELECT x FROM t").fetchall() == [(2,)]
+    pool.close()
+
+
+def test_transaction_rolls_back_on_error(tmp_path):
+    import pytest
+
+    pool = db_mod.ConnectionPool(tmp_path / "db.sqlite", readers=1)
+    pool.writer.execute("CREATE TABLE t(x)")
+    with pytest.raises(RuntimeError):
+        with pool.transaction() as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+            with pool.transaction():  # nested: joins the outer transaction
+                conn.execute("INSERT INTO t VALUES (2)")
+            raise RuntimeError
+    with pool.reader() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+        assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+    pool.close()
+
+
+def test_async_store_batches_writes_off_the_loop(tmp_path):
+    import asyncio
+    import sqlite3
+    import threading
+
+    store = ProgramStore(tmp_path / "db.sqlite", population_size=100, archive_size=0, num_islands=1)
+    facade = async_store.AsyncProgramStore(store)
+    commits = []
+    store.conn.set_trace_callback(lambda sql: sql == "COMMIT" and commits.append(sql))
+
+    def hold_writer(busy, gate):
+        busy.set()
+        gate.wait(5)
+
+    async def blocked(*writes):
+        """Queue `writes` while the writer thread is busy, so they share one batch."""
+        busy, gate = threading.Event(), threading.Event()
+        held = facade._submit(hold_writer, busy, gate)
+        await asyncio.to_thread(busy.wait, 5)
+        tasks = [asyncio.ensure_future(w) for w in writes]
+        await asyncio.sleep(0)  # let every task reach the queue
+        gate.set()
+        await held
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def ghost():
+        store.insert("ghost", {"sharpe": 100.0}, island=0, prog_id="ghost")
+        raise RuntimeError("fails after its insert")
+
+    async def main():
+        ids = await blocked(
+            *(facade.insert(f"c{i}", {"sharpe": float(i)}, island=0) for i in range(10))
+        )
+        assert len(commits) == 2  # the held job, then all ten inserts together
+        dup, ok, failed = await blocked(
+            facade.insert("dup", prog_id=ids[0]),
+            facade.insert("ok", {"sharpe": 99.0}, island=0),
+            facade._submit(ghost),
+        )
+        assert isinstance(dup, sqlite3.IntegrityError)  # only the bad rows fail
+        assert isinstance(failed, RuntimeError)
+        assert await facade.get("ghost") is None
+        assert "ghost" not in store._rows
+        assert (await facade.get(ok))["code"] == "ok"
+        assert (await facade.top_k(k=1))[0]["id"] == ok
+        assert (await facade.sample(island=0))["id"] in {*ids, ok}
+        return await facade.count()
+
+    assert asyncio.run(main()) == 11
+    facade.close()
+    assert facade._thread is None
@@ -0,0 +1,106 @@
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("backtrader")
+pytest.importorskip("tqdm")
+
+ROOT = Path(__file__).resolve().parents[1]
+
+for _name in ["pwb_toolbox", "pwb_toolbox.datasets"]:
+    sys.modules.setdefault(_name, types.ModuleType(_name))
+
+
+def _load(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+evaluator_pkg = types.ModuleType("alphaevolve.evaluator")
+evaluator_pkg.__path__ = []
+sys.modules["alphaevolve.evaluator"] = evaluator_pkg
+evaluator_pkg.metrics = _load(
+    "alphaevolve.evaluator.metrics", ROOT / "alphaevolve/evaluator/metrics.py"
+)
+loader = _load("alphaevolve.evaluator.loader", ROOT / "alphaevolve/evaluator/loader.py")
+vectorized = _load(
+    "alphaevolve.evaluator.vectorized", ROOT / "alphaevolve/evaluator/vectorized.py"
+)
+
+
+def _close():
+    idx = pd.bdate_range("2022-01-03", periods=6)
+    return pd.DataFrame({"A": [100.0, 110, 121, 121, 110, 110], "B": 50.0}, index=idx)
+
+
+def test_simulate_lags_signal_and_holds_targets():
+    close = _close()
+    weights = pd.DataFrame(np.nan, index=close.index, columns=close.columns)
+    weights.iloc[0] = [1.0, 0.0]  # one signal, then "hold"
+    sim = vectorized.simulate(close, weights, cash=100.0)
+    # filled at the open of bar 1 (= its close here), so the first return
+    # earned is bar 1 -> 2
+    assert sim["equity"].tolist() == pytest.approx([100, 100, 110, 110, 100, 100])
+    assert sim["turnover"].tolist() == pytest.approx([0, 1, 0, 0, 0, 0])
+
+
+def test_simulate_fills_at_next_open():
+    close = _close()
+    open_ = close * 1.0
+    open_.iloc[2, 0] = 115.0  # A gaps up 110 -> 115, then closes at 121
+    weights = pd.DataFrame(np.nan, index=close.index, columns=close.columns)
+    weights.iloc[1] = [1.0, 0.0]  # signal on bar 1, filled at the open of bar 2
+    sim = vectorized.simulate(close, weights, open_=open_, cash=115.0)
+    # the gap is missed; only open -> close of bar 2 is earned
+    assert sim["equity"].tolist() == pytest.approx([115, 121, 121, 110, 110])
+
+
+def test_simulate_charges_costs_on_turnover():
+    close = _close()
+    weights = pd.DataFrame({"A": 1.0, "B": 0.0}, index=close.index)
+    free = vectorized.simulate(close, weights)
+    costly = vectorized.simulate(close, weights, cost_bps=100)
+    # a single full rebalance (at the open of bar 1) costs 1% of equity
+    assert costly["equity"].iloc[-1] == pytest.approx(free["equity"].iloc[-1] * 0.99)
+
+
+def test_find_weights_fn_and_run():
+    mod = types.ModuleType("candidate")
+    exec(
+        "class S:\n"
+        "    def target_weights(self, prices):\n"
+        "        return prices['close'] * 0 + 0.5\n"
+        "STRATEGY_CLASS = S\n",
+        mod.__dict__,
+    )
+    fn = vectorized.find_weights_fn(mod)
+    assert fn is not None
+    assert vectorized.find_weights_fn(types.ModuleType("plain")) is None
+
+    needs_args = types.ModuleType("needs_args")
+    exec(
+        "class Strategy:\n"
+        "    def __init__(self, broker):\n"
+        "        pass\n"
+        "    def target_weights(self, prices):\n"
+        "        return prices['close']\n",
+        needs_args.__dict__,
+    )
+    assert vectorized.find_weights_fn(needs_args) is None
+
+    close = _close()
+    values = np.stack([close[s].to_numpy()[:, None].repeat(5, axis=1) for s in close])
+    panel = loader.PreparedPanel(
+        dates=close.index, symbols=("A", "B"), fields=loader.FIELDS, values=values
+    )
+    kpis = vectorized.run(fn, panel)
+    assert set(kpis) == {"total_return", "cagr", "sharpe", "max_drawdown", "calmar", "n_days"}
+    assert kpis["n_days"] == len(close)